@@ -1,5 +1,17 @@
 """Clean Architecture Linter Plugin."""
 
-from clean_architecture_linter.checker import register
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
 
 __all__ = ["register"]
+
+
+def register(linter: "PyLinter") -> None:
+    """Register checkers (pylint plugin entry point)."""
+    # JUSTIFICATION: Imported here so that importing the package (e.g. for the `excelsior`
+    # CLI) does not load pylint and every checker up front.
+    from clean_architecture_linter.checker import register as register_checkers
+
+    register_checkers(linter)
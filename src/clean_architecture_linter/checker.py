@@ -2,6 +2,10 @@
 Pylint plugin entry point.
 """
 
+import functools
+import logging
+from typing import Optional, Type, TYPE_CHECKING
+
 from pylint.lint import PyLinter
 
 from clean_architecture_linter.checks.boundaries import (
@@ -14,21 +18,71 @@ from clean_architecture_linter.checks.dependencies import DependencyChecker
 from clean_architecture_linter.checks.design import DesignChecker
 from clean_architecture_linter.checks.di import DIChecker
 from clean_architecture_linter.checks.immutability import ImmutabilityChecker
+from clean_architecture_linter.checks.inference import InferenceBudgetChecker
 from clean_architecture_linter.checks.patterns import CouplingChecker, PatternChecker
 from clean_architecture_linter.checks.structure import ModuleStructureChecker
 from clean_architecture_linter.checks.testing import TestingChecker
+from clean_architecture_linter.config import ConfigurationLoader, PluginState
 from clean_architecture_linter.constants import EXCELSIOR_BANNER
 from clean_architecture_linter.reporter import CleanArchitectureSummaryReporter
 from clean_architecture_linter.di.container import ExcelsiorContainer
 from clean_architecture_linter.domain.protocols import AstroidProtocol, PythonProtocol
+# JUSTIFICATION: The plugin entry point is the Composition Root for pylint runs.
+from clean_architecture_linter.infrastructure.gateways.python_gateway import PythonGateway
+
+if TYPE_CHECKING:
+    from clean_architecture_linter.infrastructure.ast_cache import AstCache
+
+# Linter attribute holding the PluginState; pylint pickles the linter to its -j workers.
+PLUGIN_STATE_ATTR: str = "clean_arch_plugin_state"
+
+
+@functools.lru_cache(maxsize=None)
+def _ast_cache_class() -> Optional[Type["AstCache"]]:
+    """The AST cache, or None (warned about once) when the ast-cache extra is not installed."""
+    try:
+        # JUSTIFICATION: Imported on demand; the cache is opt-in and pulls in dill.
+        from clean_architecture_linter.infrastructure.ast_cache import AstCache
+    except ImportError as e:
+        logging.warning(
+            "ast_cache is enabled but unavailable (%s); install pylint-clean-architecture[ast-cache]. "
+            "Continuing without it.",
+            e,
+        )
+        return None
+    return AstCache
 
 
 def register(linter: PyLinter) -> None:
-    """Register checkers."""
-    print(EXCELSIOR_BANNER)
+    """
+    Register checkers.
 
-    # Get gateways once for injection
+    The first registration on a linter loads the configuration and stores it on the
+    linter as a PluginState. Under `pylint -j N` each worker registers the plugin again
+    on an unpickled copy of that linter; it finds the state and installs it, so
+    workers neither re-read pyproject.toml nor print the banner.
+    """
     container = ExcelsiorContainer.get_instance()
+    state = getattr(linter, PLUGIN_STATE_ATTR, None)
+    if isinstance(state, PluginState):
+        ConfigurationLoader.install(state)
+    else:
+        state = ConfigurationLoader().snapshot()
+        setattr(linter, PLUGIN_STATE_ATTR, state)
+        if not container.embedded:
+            print(EXCELSIOR_BANNER)
+
+    # Installed once per process; workers and later runs (watch, serve) reuse it.
+    if ConfigurationLoader().ast_cache and not container.is_built("AstCache"):
+        ast_cache = _ast_cache_class()
+        if ast_cache is not None:
+            container.register_singleton("AstCache", ast_cache())
+            container.get("AstCache").install()
+
+    # Get gateways once for injection
+    if not container.is_built("PythonGateway"):
+        stdlib_modules = state.stdlib_modules
+        container.register_factory("PythonGateway", lambda: PythonGateway(stdlib_modules))
     python_gateway: PythonProtocol = container.get("PythonGateway")
     ast_gateway: AstroidProtocol = container.get("AstroidGateway")
 
@@ -44,6 +98,7 @@ def register(linter: PyLinter) -> None:
     linter.register_checker(BypassChecker(linter))
     linter.register_checker(DIChecker(linter, ast_gateway=ast_gateway, python_gateway=python_gateway))
     linter.register_checker(ModuleStructureChecker(linter))
+    linter.register_checker(InferenceBudgetChecker(linter, ast_gateway=ast_gateway))
 
     # Register reporter
     linter.register_reporter(CleanArchitectureSummaryReporter)
@@ -1,6 +1,6 @@
 """Design checks (W9007, W9009, W9012, W9013, W9015, W9016)."""
 
-from typing import TYPE_CHECKING, Optional, List, Set, Any, IO
+from typing import TYPE_CHECKING, Optional, Iterator, List, Set, Any, IO
 
 import astroid  # type: ignore[import-untyped]
 from pylint.checkers import BaseChecker
@@ -83,6 +83,17 @@ class DesignChecker(BaseChecker):
         }
         return defaults.union(self.config_loader.infrastructure_modules)
 
+    def leave_module(self, _node: astroid.nodes.Module) -> None:
+        """Free the gateway's per-module answers."""
+        if self._ast_gateway is not None:
+            self._ast_gateway.clear_memo()
+
+    def _infer(self, node: astroid.nodes.NodeNG) -> Iterator[astroid.nodes.NodeNG]:
+        """node.infer(), within the gateway's inference budget when there is a gateway."""
+        if self._ast_gateway is None:
+            return node.infer()
+        return self._ast_gateway.infer(node)
+
     def visit_return(self, node: astroid.nodes.Return) -> None:
         """W9007: Flag raw I/O object returns."""
         if not node.value:
@@ -111,7 +122,7 @@ class DesignChecker(BaseChecker):
     def _check_assignment_value(self, node: astroid.nodes.Assign) -> None:
         """Helper to inspect assignment values."""
         try:
-            for inferred in node.value.infer():
+            for inferred in self._infer(node.value):
                 if inferred is astroid.Uninferable:
                     continue
 
@@ -252,7 +263,7 @@ class DesignChecker(BaseChecker):
     def _is_infrastructure_type(self, node: astroid.nodes.NodeNG) -> bool:
         """Check if node belongs to infrastructure."""
         try:
-            for inferred in node.infer():
+            for inferred in self._infer(node):
                 if self._is_infrastructure_inferred(inferred):
                     return True
         except astroid.InferenceError:
@@ -0,0 +1,38 @@
+"""Inference budget reporting (W9017)."""
+
+from typing import TYPE_CHECKING, Optional
+
+import astroid  # type: ignore[import-untyped]
+from pylint.checkers import BaseChecker
+
+if TYPE_CHECKING:
+    from pylint.lint import PyLinter
+
+from clean_architecture_linter.domain.protocols import AstroidProtocol
+
+
+class InferenceBudgetChecker(BaseChecker):
+    """W9017: Tag modules whose analysis fell back to syntactic rules because inference ran over budget."""
+
+    name = "clean-arch-inference"
+
+    def __init__(self, linter: "PyLinter", ast_gateway: Optional[AstroidProtocol] = None) -> None:
+        self.msgs = {
+            "W9017": (
+                "Degraded analysis: inference budget exhausted (%s). Inference-based rules fell back to "
+                "syntactic checks. Clean Fix: Simplify the metaprogramming or raise "
+                "[tool.clean-arch.inference_budget].",
+                "clean-arch-inference-degraded",
+                "One pathological module must not stall a run; its inference is cut short and reported here.",
+            ),
+        }
+        super().__init__(linter)
+        self._ast_gateway = ast_gateway
+
+    def leave_module(self, node: astroid.nodes.Module) -> None:
+        """Report the module as degraded if any of its inference was cut short."""
+        if self._ast_gateway is None:
+            return
+        reason = self._ast_gateway.inference_degradation(node)
+        if reason:
+            self.add_message("clean-arch-inference-degraded", node=node, args=(reason,))
@@ -1,6 +1,6 @@
 """Pattern checks (W9005, W9006)."""
 
-from typing import TYPE_CHECKING, Optional, List, Dict
+from typing import TYPE_CHECKING, Optional, Iterator, List, Dict
 
 import astroid  # type: ignore[import-untyped]
 from pylint.checkers import BaseChecker
@@ -90,6 +90,15 @@ class PatternChecker(BaseChecker):
         return False
 
 
+def _is_chain_link(node: astroid.nodes.Call) -> bool:
+    """Whether node is the receiver of a further method call, as `a.b()` in `a.b().c()`."""
+    child: astroid.nodes.NodeNG = node
+    parent = node.parent
+    while isinstance(parent, astroid.nodes.Attribute) and parent.expr is child:
+        child, parent = parent, parent.parent
+    return child is not node and isinstance(parent, astroid.nodes.Call) and parent.func is child
+
+
 class CouplingChecker(BaseChecker):
     """W9006: Law of Demeter violation detection."""
 
@@ -118,6 +127,17 @@ class CouplingChecker(BaseChecker):
         """Reset locals map for each function."""
         self._locals_map = {}
 
+    def leave_module(self, _node: astroid.nodes.Module) -> None:
+        """Free the gateway's per-module answers."""
+        if self._ast_gateway is not None:
+            self._ast_gateway.clear_memo()
+
+    def _infer(self, node: astroid.nodes.NodeNG) -> Iterator[astroid.nodes.NodeNG]:
+        """node.infer(), within the gateway's inference budget when there is a gateway."""
+        if self._ast_gateway is None:
+            return node.infer()
+        return self._ast_gateway.infer(node)
+
     def visit_assign(self, node: astroid.nodes.Assign) -> None:
         """Track if a local variable is created from a method call (likely a stranger)."""
         if not isinstance(node.value, astroid.nodes.Call):
@@ -132,7 +152,11 @@ class CouplingChecker(BaseChecker):
                 self._locals_map[target.name] = True
 
     def visit_call(self, node: astroid.nodes.Call) -> None:
-        """Check for Law of Demeter violations."""
+        """Check for Law of Demeter violations, once per chain at its outermost call."""
+        if _is_chain_link(node):
+            # Analysed along with the outermost call of its chain.
+            return
+
         if self._is_test_file(node):
             return
 
@@ -166,32 +190,46 @@ class CouplingChecker(BaseChecker):
         return False
 
     def _check_method_chain(self, node: astroid.nodes.Call) -> bool:
-        """Case 1: Direct method chains."""
+        """
+        Case 1: Direct method chains.
+
+        The chain is walked once from its outermost call. Each call in it heads a
+        sub-chain (`a.b().c()` inside `a.b().c().d()`); the outermost one that is long
+        enough and not excluded is reported, and nothing else in the chain is.
+        """
         if not isinstance(node.func, astroid.nodes.Attribute):
             return False
 
         chain: List[str] = []
+        # (index into chain where the link's own sub-chain starts, link), outermost first
+        links: List[tuple[int, astroid.nodes.Call]] = [(0, node)]
         curr: astroid.nodes.NodeNG = node.func
         while isinstance(curr, (astroid.nodes.Attribute, astroid.nodes.Call)):
             if isinstance(curr, astroid.nodes.Attribute):
                 chain.append(curr.attrname)
                 curr = curr.expr
             else:
-                # Only count Call as a level if it's not the outermost call we are visiting
-                if curr != node:
-                    chain.append("()")
+                chain.append("()")
+                if isinstance(curr.func, astroid.nodes.Attribute):
+                    links.append((len(chain), curr))
                 curr = curr.func
 
-        if len(chain) < _MIN_CHAIN_LENGTH:
-            return False
-
-        if self._is_chain_excluded(node, chain, curr):
-            return False
+        for start, link in links:
+            link_chain = chain[start:]
+            if len(link_chain) < _MIN_CHAIN_LENGTH:
+                break
+            if self._is_chain_excluded(link, link_chain, curr):
+                continue
+            # Clean up display: replace .(). with ()
+            full_chain = ".".join(reversed(link_chain)).replace(".()", "()")
+            self.add_message("clean-arch-demeter", node=link, args=(full_chain,))
+            return True
 
-        # Clean up display: replace .(). with ()
-        full_chain = ".".join(reversed(chain)).replace(".()", "()")
-        self.add_message("clean-arch-demeter", node=node, args=(full_chain,))
-        return True
+        # No link was reported: the innermost call may still be on a stranger variable.
+        innermost = links[-1][1]
+        if innermost is not node:
+            self._check_stranger_variable(innermost)
+        return False
 
     def _check_stranger_variable(self, node: astroid.nodes.Call) -> None:
         """Case 2: Method called on a 'stranger' variable."""
@@ -299,7 +337,7 @@ class CouplingChecker(BaseChecker):
     def _is_inferred_safe(self, receiver: astroid.nodes.NodeNG, config_loader: ConfigurationLoader) -> bool:
         """Inference-based safety check."""
         try:
-            for inferred in receiver.infer():
+            for inferred in self._infer(receiver):
                 if inferred is astroid.Uninferable:
                     continue
 
@@ -330,7 +368,7 @@ class CouplingChecker(BaseChecker):
             if not isinstance(node.func, astroid.nodes.Attribute):
                 return False
 
-            for inferred in node.func.infer():
+            for inferred in self._infer(node.func):
                 if inferred is astroid.Uninferable:
                     continue
                 qname = getattr(inferred, "qname", lambda: "")()
@@ -374,7 +412,7 @@ class CouplingChecker(BaseChecker):
                     # Category 4: Factory Exemption (Must be a Class instantiation)
                     call_node: astroid.nodes.Call = parent.value
                     func_node = call_node.func
-                    for inf in func_node.infer():
+                    for inf in self._infer(func_node):
                         if isinstance(inf, astroid.nodes.ClassDef):
                             return True
         except (astroid.InferenceError, AttributeError):
@@ -42,10 +42,6 @@ class ModuleStructureChecker(BaseChecker):
         self.current_layer_types: set[str] = set()
         self.heavy_component_count: int = 0
 
-    def open(self) -> None:
-        """Called when starting to process a file."""
-        self.config_loader.load_config()
-
     def visit_module(self, node: astroid.nodes.Module) -> None:
         """Process module level checks."""
         self.current_classes = []
@@ -1,25 +1,53 @@
 """CLI entry points for Excelsior."""
 
 import argparse
-import sys
 import json
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Dict, Any, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Dict, List, Optional, Set, Tuple, Union, cast
+
+# Only light modules are imported here. pylint, astroid, mypy and rich are imported
+# inside the subcommands that use them, so `--help`, `init` and `history` start fast
+# (see `excelsior bench startup`).
+from clean_architecture_linter.config import ConfigurationLoader
 
 # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
 from clean_architecture_linter.di.container import ExcelsiorContainer
+
+# JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+from clean_architecture_linter.infrastructure.adapters.mypy_adapter import MYPY_MODES
+
 # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
-from clean_architecture_linter.infrastructure.adapters.linter_adapters import (
-    ExcelsiorAdapter,
-    MypyAdapter,
-    ImportLinterAdapter,
+from clean_architecture_linter.infrastructure.audit_trail import (
+    AUDIT_COMPRESSIONS,
+    AuditTrailWriter,
+    audit_trail_path,
+)
+from clean_architecture_linter.interface.headless import (
+    HeadlessTelemetry,
+    PlainColumn,
+    PlainReporter,
+    PlainSchema,
+    headless_requested,
 )
-from stellar_ui_kit import ColumnDefinition, ReportSchema, TerminalReporter
-from clean_architecture_linter.config import ConfigurationLoader
 
 if TYPE_CHECKING:
-    from stellar_ui_kit import TelemetryPort
-    from clean_architecture_linter.domain.entities import LinterResult
+    from concurrent.futures import Future
+
+    from stellar_ui_kit import ReportSchema, TelemetryPort, TerminalReporter
+
+    from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+    from clean_architecture_linter.domain.protocols import LinterAdapterProtocol
+    from clean_architecture_linter.infrastructure.adapters.result_cache import ResultCache
+    from clean_architecture_linter.infrastructure.audit_history import AuditHistory
+    from clean_architecture_linter.infrastructure.baseline import Baseline
+    from clean_architecture_linter.infrastructure.symbol_index import SymbolIndex
 
 BANNER = r"""
     _______  ________________   _____ ________  ____
@@ -146,80 +174,77 @@ verify-file:
 	pytest --cov=src --cov-report=term-missing | grep $(FILE)
 """
 
-def check_command(telemetry: "TelemetryPort", target_path: str) -> None:
-    """Run standardized linter audit with grouped counts and desc sorting."""
+@dataclass(frozen=True)
+class CheckOptions:
+    """How `excelsior check` runs; the defaults are those of a bare `excelsior check`."""
 
-    telemetry.step(f"Starting Excelsior Audit for: {target_path}")
+    concurrent: bool = True
+    in_process: bool = True
+    use_cache: bool = True
+    daemon: bool = False
+    jobs: Optional[int] = None
+    mypy_mode: str = "subprocess"
+    audit_compression: str = "none"
+    record_history: bool = False
+    baseline_path: Optional[str] = None
+    update_baseline: bool = False
+    headless: bool = False
 
-    # 1. Run Mypy
-    telemetry.step("Gathering Type Integrity violations (Source: Mypy)...")
-    mypy_adapter = MypyAdapter()
-    mypy_results = mypy_adapter.gather_results(target_path)
-
-    # 2. Run Excelsior
-    telemetry.step("Gathering Architectural violations (Source: Pylint/Excelsior)...")
-    excelsior_adapter = ExcelsiorAdapter()
-    excelsior_results = excelsior_adapter.gather_results(target_path)
-
-    # 3. Run Import Linter
-    telemetry.step("Verifying Package Contracts (Source: Import-Linter)...")
-    il_adapter = ImportLinterAdapter()
-    il_results = il_adapter.gather_results(target_path)
-
-    reporter = TerminalReporter()
-
-    def process_results(results: List["LinterResult"]) -> List[Dict[str, object]]:
-        processed = []
-        for r in results:
-            d: Dict[str, object] = dict(r.to_dict())
-            d["count"] = len(r.locations) if r.locations else 1
-            processed.append(d)
-        return sorted(processed, key=lambda x: int(x["count"]) if isinstance(x["count"], int) else 0, reverse=True)
-
-    # Table 1: Type Integrity
-    mypy_schema = ReportSchema(
-        title="[MYPY] Type Integrity Audit",
-        columns=[
-            ColumnDefinition(header="Error Code", key="code", style="#00EEFF"),
-            ColumnDefinition(header="Count", key="count", style="bold #007BFF"),
-            ColumnDefinition(header="Message", key="message"),
-        ],
-        header_style="bold #007BFF",
-    )
-    if mypy_results:
-        reporter.generate_report(process_results(mypy_results), mypy_schema)
-    else:
-        print("\n✅ No Type Integrity violations detected.")
 
-    # Table 2: Architectural Governance
-    excelsior_schema = ReportSchema(
-        title="[EXCELSIOR] Architectural Governance Audit",
-        columns=[
-            ColumnDefinition(header="Rule ID", key="code", style="#C41E3A"),
-            ColumnDefinition(header="Count", key="count", style="bold #007BFF"),
-            ColumnDefinition(header="Violation Description", key="message"),
-        ],
-        header_style="bold #F9A602",
-    )
-    if excelsior_results:
-        reporter.generate_report(process_results(excelsior_results), excelsior_schema)
-    else:
-        print("\n✅ No Architectural violations detected.")
+def check_command(telemetry: "TelemetryPort", target_path: str, options: Optional[CheckOptions] = None) -> None:
+    """Run standardized linter audit with grouped counts and desc sorting."""
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.adapters.linter_adapters import ImportLinterAdapter, MypyAdapter
 
-    # Table 3: Package Contracts
-    il_schema = ReportSchema(
-        title="[IMPORT-LINTER] Package Boundary Audit",
-        columns=[
-            ColumnDefinition(header="Rule ID", key="code", style="#7B68EE"),
-            ColumnDefinition(header="Contract Violation", key="message"),
-        ],
-        header_style="bold #7B68EE",
-    )
-    if il_results:
-        reporter.generate_report([r.to_dict() for r in il_results], il_schema)
+    options = options or CheckOptions()
+    telemetry.step(f"Starting Excelsior Audit for: {target_path}")
 
-    # 4. Save Audit Trail
-    _save_audit_trail(telemetry, mypy_results, excelsior_results, il_results)
+    cache, symbols = _open_caches(telemetry, options)
+    # Each audit is (key, announcement, adapter). The order here is the display order
+    # in sequential mode; in concurrent mode tables are rendered as each tool finishes.
+    audits: List[Tuple[str, str, "LinterAdapterProtocol"]] = [
+        (
+            "type_integrity",
+            "Gathering Type Integrity violations (Source: Mypy)...",
+            MypyAdapter(mode=options.mypy_mode),
+        ),
+        (
+            "architectural",
+            "Gathering Architectural violations (Source: Pylint/Excelsior)...",
+            _excelsior_adapter(telemetry, options, cache),
+        ),
+        ("contracts", "Verifying Package Contracts (Source: Import-Linter)...", ImportLinterAdapter()),
+    ]
+    baseline = _BaselineFilter(_load_baseline(options))
+    reporter = _new_reporter(options.headless)
+
+    # Each tool's results are appended to the audit trail (and the history store,
+    # when enabled) as soon as they are in.
+    with AuditTrailWriter(audit_trail_path(options.audit_compression)) as trail, _open_history(
+        telemetry, options.record_history
+    ) as history:
+        run_id = history.begin_run(target_path) if history is not None else 0
+
+        def publish(key: str, tool_results: List["LinterResult"]) -> None:
+            trail.write_results(key, tool_results)
+            if history is not None:
+                history.record_results(run_id, key, tool_results)
+            _render_audit_table(reporter, key, baseline.partition(key, tool_results))
+
+        results, timings = _run_audits(telemetry, audits, target_path, options.concurrent, publish)
+        _report_run_stats(telemetry, timings, cache, symbols, options.in_process)
+
+        # 4. Save Audit Trail
+        _save_audit_trail(
+            telemetry, trail, results["type_integrity"], results["architectural"], results["contracts"], timings
+        )
+        if history is not None:
+            history.finish_run(run_id)
+            telemetry.step(f"📈 Run #{run_id} recorded in {history.path}")
+
+    new_violations = 0
+    if options.baseline_path:
+        new_violations = _settle_baseline(telemetry, Path(options.baseline_path), baseline, target_path, results)
 
     # AI Handover
     telemetry.step("AI Agent Handover initialized.")
@@ -227,34 +252,515 @@ def check_command(telemetry: "TelemetryPort", target_path: str) -> None:
     print("🤖 EXCELSIOR v2: AI HANDOVER")
     print("=" * 40)
     print("System Integrity Report completed.")
-    print("Audit Log: .excelsior/last_audit.json")
+    print(f"Audit Log: {trail.path}")
     print("Run 'excelsior fix' to resolve common issues.")
     print("=" * 40 + "\n")
 
-def _save_audit_trail(telemetry: "TelemetryPort", mypy: List["LinterResult"], excelsior: List["LinterResult"], il: List["LinterResult"]) -> None:
-    """Save results to .excelsior directory for human/AI review."""
-    excelsior_dir = Path(".excelsior")
-    excelsior_dir.mkdir(exist_ok=True)
-
-    audit_data = {
-        "version": "2.0.0",
-        "timestamp": str(Path(".excelsior").stat().st_mtime), # rough timestamp
-        "summary": {
-            "type_integrity": len(mypy),
-            "architectural": len(excelsior),
-            "contracts": len(il)
-        },
-        "violations": {
-            "type_integrity": [r.to_dict() for r in mypy],
-            "architectural": [r.to_dict() for r in excelsior],
-            "contracts": [r.to_dict() for r in il]
+    if baseline.baseline is not None and new_violations:
+        telemetry.error(f"❌ {new_violations} new violation(s) not in baseline {options.baseline_path}")
+        sys.exit(1)
+
+def _config_fingerprint(telemetry: "TelemetryPort") -> Optional[str]:
+    """The result-cache fingerprint of the configuration, or None (with a warning) when it cannot be read."""
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.adapters.result_cache import config_fingerprint
+
+    try:
+        return config_fingerprint(ConfigurationLoader().config)
+    except (OSError, ValueError) as e:
+        telemetry.warning(f"Cannot fingerprint the configuration, so no cached results are reused: {e}")
+        return None
+
+def _open_caches(
+    telemetry: "TelemetryPort", options: CheckOptions
+) -> Tuple[Optional["ResultCache"], Optional["SymbolIndex"]]:
+    """The result cache and the symbol index for this run, both wired into the shared AstroidGateway."""
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.adapters.result_cache import ResultCache
+    from clean_architecture_linter.infrastructure.symbol_index import SYMBOL_INDEX_PATH, SymbolIndex
+
+    # Unaffected files replay their previous Excelsior results instead of being re-linted.
+    # The cache needs the dependency graph recorded by the in-process AstroidGateway,
+    # so --isolated runs always analyse everything.
+    fingerprint = _config_fingerprint(telemetry) if options.use_cache and options.in_process else None
+    if fingerprint is None:
+        return None, None
+    cache = ResultCache(fingerprint)
+    # Class and method lookups learnt by earlier runs, so analysing the stale files starts warm.
+    symbols = SymbolIndex(SYMBOL_INDEX_PATH)
+    ExcelsiorContainer.get_instance().get("AstroidGateway").symbols = symbols
+    return cache, symbols
+
+def _excelsior_adapter(
+    telemetry: "TelemetryPort", options: CheckOptions, cache: Optional["ResultCache"]
+) -> "LinterAdapterProtocol":
+    """The local Excelsior run, or a running `excelsior serve` daemon when --daemon asks for one."""
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.adapters.daemon_adapter import DaemonAdapter, DaemonClient
+    from clean_architecture_linter.infrastructure.adapters.linter_adapters import ExcelsiorAdapter
+
+    if options.daemon:
+        client = DaemonClient()
+        if client.ping():
+            telemetry.step(f"Using warm Excelsior daemon at {client.socket_path}")
+            return DaemonAdapter(client)
+        telemetry.warning("No Excelsior daemon is running (start one with 'excelsior serve'); checking locally.")
+    return ExcelsiorAdapter(
+        in_process=options.in_process,
+        cache=cache,
+        dependency_tracker=ExcelsiorContainer.get_instance().get("AstroidGateway"),
+        jobs=options.jobs,
+    )
+
+def _run_audits(
+    telemetry: "TelemetryPort",
+    audits: List[Tuple[str, str, "LinterAdapterProtocol"]],
+    target_path: str,
+    concurrent: bool,
+    publish: Callable[[str, List["LinterResult"]], None],
+) -> Tuple[Dict[str, List["LinterResult"]], Dict[str, float]]:
+    """Run every audit, publishing each one's results as soon as it finishes; returns results and timings."""
+    progress = _LiveProgress(telemetry)
+    results: Dict[str, List["LinterResult"]] = {}
+    timings: Dict[str, float] = {}
+    if concurrent:
+        with ThreadPoolExecutor(max_workers=len(audits)) as executor:
+            futures: Dict["Future[Tuple[List[LinterResult], float]]", str] = {}
+            for key, announcement, adapter in audits:
+                telemetry.step(announcement)
+                futures[executor.submit(_run_timed, adapter, target_path, progress.sink(key))] = key
+            for future in as_completed(futures):
+                key = futures[future]
+                results[key], timings[key] = future.result()
+                publish(key, results[key])
+    else:
+        for key, announcement, adapter in audits:
+            telemetry.step(announcement)
+            results[key], timings[key] = _run_timed(adapter, target_path, progress.sink(key))
+            publish(key, results[key])
+    # Completion order is arbitrary; summaries follow the display order.
+    return {key: results[key] for key, _, _ in audits}, {key: timings[key] for key, _, _ in audits}
+
+def _report_run_stats(
+    telemetry: "TelemetryPort",
+    timings: Dict[str, float],
+    cache: Optional["ResultCache"],
+    symbols: Optional["SymbolIndex"],
+    in_process: bool,
+) -> None:
+    """Report per-tool wall times and how much the caches saved, persisting the symbol index."""
+    for key, seconds in timings.items():
+        telemetry.step(f"⏱️ {key}: {seconds:.2f}s")
+    if cache is not None:
+        telemetry.step(f"♻️ cache: {cache.hits} file(s) reused, {cache.misses} analysed")
+    if symbols is not None:
+        try:
+            symbols.save()
+        except OSError as e:
+            telemetry.warning(f"Symbol index not saved: {e}")
+        telemetry.step(f"🗂️ symbol index: {symbols.hits} lookup(s) reused, {symbols.misses} resolved")
+    container = ExcelsiorContainer.get_instance()
+    if in_process and container.is_built("AstCache"):
+        hits, misses, stored = container.get("AstCache").stats()
+        telemetry.step(f"🧊 AST cache: {hits} module(s) loaded, {misses} built, {stored} stored")
+
+def _load_baseline(options: CheckOptions) -> Optional["Baseline"]:
+    """The baseline to filter against; None when there is none yet or it is being rewritten."""
+    if not options.baseline_path or options.update_baseline:
+        return None
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.baseline import Baseline
+
+    try:
+        return Baseline.load(Path(options.baseline_path))
+    except OSError:
+        # A missing baseline is created from this run.
+        return None
+
+class _BaselineFilter:
+    """
+    With a baseline, tables show (and the run fails on) only violations it does not know.
+    Keeps what each tool showed, how many it hid and which baseline keys were seen.
+    """
+
+    def __init__(self, baseline: Optional["Baseline"]) -> None:
+        self.baseline = baseline
+        self.shown: Dict[str, List["LinterResult"]] = {}
+        self.known: Dict[str, int] = {}
+        self.seen: Set[str] = set()
+
+    def partition(self, key: str, results: List["LinterResult"]) -> List["LinterResult"]:
+        """The results of one tool that are to be shown."""
+        if self.baseline is None:
+            self.shown[key] = results
+        else:
+            self.shown[key], self.known[key], keys = self.baseline.partition(results)
+            self.seen.update(keys)
+        return self.shown[key]
+
+def _settle_baseline(
+    telemetry: "TelemetryPort",
+    path: Path,
+    baseline: _BaselineFilter,
+    target_path: str,
+    results: Dict[str, List["LinterResult"]],
+) -> int:
+    """Write a new baseline or ratchet the loaded one; returns the number of new violations."""
+    if baseline.baseline is None:
+        # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+        from clean_architecture_linter.infrastructure.baseline import Baseline
+
+        created = Baseline()
+        created.add(r for tool_results in results.values() for r in tool_results)
+        created.save(path)
+        telemetry.step(f"📌 Baseline written to {path}: {len(created)} known violation(s)")
+        return 0
+
+    telemetry.step(f"📌 {sum(baseline.known.values())} baselined violation(s) hidden")
+    # A tool that failed reported nothing, which must not read as "everything fixed".
+    if not any(r.code.endswith("_ERROR") for tool_results in results.values() for r in tool_results):
+        fixed = baseline.baseline.ratchet(baseline.seen, target_path)
+        if fixed:
+            baseline.baseline.save(path)
+            telemetry.step(f"📉 Baseline ratcheted: {fixed} fixed violation(s) removed from {path}")
+    return sum(len(r.diagnostics) or 1 for tool_results in baseline.shown.values() for r in tool_results)
+
+def serve_command(telemetry: "TelemetryPort", stop: bool = False) -> None:
+    """Run the warm analysis daemon in the foreground, or stop a running one."""
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.adapters.daemon_adapter import DaemonClient
+    from clean_architecture_linter.infrastructure.daemon import EvictingResultCache, serve
+
+    client = DaemonClient()
+    if stop:
+        if client.ping():
+            client.shutdown()
+            telemetry.step("Excelsior daemon stopped.")
+        else:
+            telemetry.warning("No Excelsior daemon is running.")
+        return
+
+    # Configuration is read once; restart the daemon after editing [tool.clean-arch] or [tool.pylint].
+    # The daemon needs a cache to find stale files; without a fingerprint it gets a one-off
+    # one, so nothing stored earlier is replayed.
+    cache = EvictingResultCache(_config_fingerprint(telemetry) or uuid.uuid4().hex)
+    try:
+        serve(
+            client.socket_path,
+            cache,
+            ExcelsiorContainer.get_instance().get("AstroidGateway"),
+            on_ready=lambda _: telemetry.step(f"Excelsior daemon listening on {client.socket_path} (Ctrl+C to stop)"),
+        )
+    except OSError as e:
+        telemetry.error(str(e))
+        sys.exit(1)
+
+def watch_command(telemetry: "TelemetryPort", target_path: str, interval: float = 0.5) -> None:
+    """Re-check changed modules and their dependents on every save, printing only what changed."""
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.adapters.excelsior_adapter import ExcelsiorAdapter
+    from clean_architecture_linter.infrastructure.daemon import EvictingResultCache
+    from clean_architecture_linter.infrastructure.watcher import PollingWatcher, diff_diagnostics
+
+    # Same warm setup as the daemon: parsed modules survive between rounds and
+    # only stale files (plus their reverse dependencies) are re-linted.
+    cache = EvictingResultCache(_config_fingerprint(telemetry) or uuid.uuid4().hex)
+    adapter = ExcelsiorAdapter(
+        in_process=True,
+        cache=cache,
+        dependency_tracker=ExcelsiorContainer.get_instance().get("AstroidGateway"),
+    )
+    watcher = PollingWatcher(target_path, interval)
+
+    current = list(adapter.iter_diagnostics(target_path))
+    telemetry.step(f"👀 Watching {target_path}: {len(current)} violation(s). Press Ctrl+C to stop.")
+    try:
+        while True:
+            changed = watcher.wait()
+            misses = cache.misses
+            started = time.perf_counter()
+            latest = list(adapter.iter_diagnostics(target_path))
+            introduced, resolved = diff_diagnostics(current, latest)
+            telemetry.step(
+                f"🔁 {len(changed)} file(s) changed, {cache.misses - misses} re-checked "
+                f"in {time.perf_counter() - started:.2f}s: +{len(introduced)} -{len(resolved)} "
+                f"({len(latest)} total)"
+            )
+            for diagnostic in resolved:
+                telemetry.step(f"  ✅ {diagnostic.location} {diagnostic.code} {diagnostic.message}")
+            for diagnostic in introduced:
+                telemetry.step(f"  ❌ {diagnostic.location} {diagnostic.code} {diagnostic.message}")
+            current = latest
+    except KeyboardInterrupt:
+        telemetry.step("Watch stopped.")
+
+def history_command(
+    telemetry: "TelemetryPort",
+    rule: Optional[str] = None,
+    top: Optional[int] = None,
+    regressions: bool = False,
+    limit: int = 20,
+    prune: Optional[int] = None,
+    headless: bool = False,
+) -> None:
+    """Answer trend and top-offender questions from the runs recorded by 'check --history'."""
+    import sqlite3
+
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.audit_history import HISTORY_PATH, AuditHistory
+
+    if not HISTORY_PATH.exists():
+        telemetry.warning("No audit history yet; record runs with 'excelsior check --history'.")
+        return
+    reporter = _new_reporter(headless)
+    try:
+        with AuditHistory() as history:
+            if prune is not None:
+                telemetry.step(f"🧹 Removed {history.prune(prune)} run(s); kept the newest {prune}.")
+            elif regressions:
+                rows = history.regressions(rule, limit)
+                if not rows:
+                    print("\n✅ No file regressed since the previous run.")
+                    return
+                reporter.generate_report(rows, _report_schema(
+                    reporter,
+                    f"[HISTORY] Regressions since the previous run{f' ({rule})' if rule else ''}",
+                    [("File", "path", None), ("Before", "before", "#00EEFF"), ("After", "after", "bold #C41E3A")],
+                    "bold #F9A602",
+                ))
+            elif top is not None:
+                reporter.generate_report(history.top_files(rule, top), _report_schema(
+                    reporter,
+                    f"[HISTORY] Top offenders in the latest run{f' ({rule})' if rule else ''}",
+                    [("File", "path", None), ("Count", "violations", "bold #007BFF")],
+                    "bold #F9A602",
+                ))
+            elif rule:
+                rows = [dict(row, started=_format_time(row["started_at"])) for row in history.rule_trend(rule, limit)]
+                reporter.generate_report(rows, _report_schema(
+                    reporter,
+                    f"[HISTORY] {rule} per run",
+                    [("Run", "run", "#7B68EE"), ("Started", "started", None), ("Count", "violations", "bold #007BFF")],
+                    "bold #F9A602",
+                ))
+            else:
+                rows = [dict(row, started=_format_time(row["started_at"])) for row in history.runs(limit)]
+                reporter.generate_report(rows, _report_schema(
+                    reporter,
+                    "[HISTORY] Recent runs",
+                    [
+                        ("Run", "run", "#7B68EE"),
+                        ("Started", "started", None),
+                        ("Target", "target", None),
+                        ("Architectural", "architectural", "bold #C41E3A"),
+                        ("Type Integrity", "type_integrity", "bold #007BFF"),
+                        ("Contracts", "contracts", "bold #7B68EE"),
+                        ("Failed Tools", "failed", "bold #F9A602"),
+                    ],
+                    "bold #F9A602",
+                ))
+    except sqlite3.Error as e:
+        telemetry.error(f"Cannot read audit history {HISTORY_PATH}: {e}")
+        sys.exit(1)
+
+def bench_command(telemetry: "TelemetryPort", runs: int = 5, headless: bool = False) -> None:
+    """Measure CLI start-up in fresh interpreters and flag heavy imports on the fast paths."""
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.startup_bench import measure_startup
+
+    telemetry.step(f"⏱️ Measuring start-up ({runs} run(s) per scenario)...")
+    try:
+        samples = measure_startup(runs)
+    except RuntimeError as e:
+        telemetry.error(str(e))
+        sys.exit(1)
+    rows = [
+        {
+            "scenario": sample.scenario,
+            "process_ms": sample.process_ms,
+            "import_ms": sample.import_ms,
+            "heavy": ", ".join(sample.heavy_modules) or "-",
         }
-    }
+        for sample in samples
+    ]
+    reporter = _new_reporter(headless)
+    reporter.generate_report(rows, _report_schema(
+        reporter,
+        "[BENCH] CLI start-up (median)",
+        [
+            ("Scenario", "scenario", None),
+            ("Process (ms)", "process_ms", "bold #007BFF"),
+            ("Import + run (ms)", "import_ms", "#00EEFF"),
+            ("Heavy modules loaded", "heavy", "#C41E3A"),
+        ],
+        "bold #F9A602",
+    ))
+    for sample in samples:
+        if sample.heavy_modules:
+            telemetry.warning(f"'{sample.scenario}' imports {', '.join(sample.heavy_modules)}")
+
+def _format_time(timestamp: object) -> str:
+    """Local wall-clock time of a stored epoch timestamp."""
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(float(cast(float, timestamp))))
+
+def _open_history(
+    telemetry: "TelemetryPort", enabled: bool
+) -> Union["AuditHistory", ContextManager[None]]:
+    """The history store for this check, or a no-op context when it is disabled or unusable."""
+    if not enabled:
+        return nullcontext()
+    import sqlite3
+
+    # JUSTIFICATION: CLI is the Composition Root and must wire up Infrastructure to Interface.
+    from clean_architecture_linter.infrastructure.audit_history import AuditHistory
 
-    json_path = excelsior_dir / "last_audit.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(audit_data, f, indent=2)
+    try:
+        return AuditHistory()
+    except sqlite3.Error as e:
+        telemetry.warning(f"Audit history disabled for this run: {e}")
+        return nullcontext()
+
+def _run_timed(
+    adapter: "LinterAdapterProtocol",
+    target_path: str,
+    on_diagnostic: Optional[Callable[["Diagnostic"], None]] = None,
+) -> Tuple[List["LinterResult"], float]:
+    """Run a single adapter and return its results with the wall time it took."""
+    started = time.perf_counter()
+    results = adapter.gather_results(target_path, on_diagnostic=on_diagnostic)
+    return results, time.perf_counter() - started
+
+class _LiveProgress:
+    """
+    Early feedback while the audits are still running.
+    The first few violations of each tool are echoed immediately, then a running
+    count is reported at most once per interval. Sinks may be called from worker threads.
+    """
+
+    PREVIEW_LIMIT: int = 3
+    INTERVAL: float = 1.0
+
+    def __init__(self, telemetry: "TelemetryPort") -> None:
+        self._telemetry = telemetry
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self._last_report: float = time.monotonic()
+
+    def sink(self, key: str) -> Callable[["Diagnostic"], None]:
+        """Callback for one audit, suitable for gather_results(on_diagnostic=...)."""
+        def on_diagnostic(diagnostic: "Diagnostic") -> None:
+            self._record(key, diagnostic)
+        return on_diagnostic
+
+    def _record(self, key: str, diagnostic: "Diagnostic") -> None:
+        with self._lock:
+            count = self._counts.get(key, 0) + 1
+            self._counts[key] = count
+            if count <= self.PREVIEW_LIMIT:
+                where = f" {diagnostic.location}" if diagnostic.path else ""
+                self._telemetry.step(f"⚡ {key}:{where} {diagnostic.code} {diagnostic.message}")
+                return
+            now = time.monotonic()
+            if now - self._last_report >= self.INTERVAL:
+                self._last_report = now
+                summary = ", ".join(f"{k}={v}" for k, v in sorted(self._counts.items()))
+                self._telemetry.step(f"… violations so far: {summary}")
+
+def _process_results(results: List["LinterResult"]) -> List[Dict[str, object]]:
+    """Attach occurrence counts and sort by count, descending."""
+    processed = []
+    for r in results:
+        d: Dict[str, object] = dict(r.to_dict())
+        d["count"] = len(r.locations) if r.locations else 1
+        processed.append(d)
+    return sorted(processed, key=lambda x: int(x["count"]) if isinstance(x["count"], int) else 0, reverse=True)
+
+def _new_reporter(headless: bool = False) -> Union["TerminalReporter", PlainReporter]:
+    """Rich tables on a terminal, plain tab-separated rows in headless mode."""
+    if headless:
+        return PlainReporter()
+    from stellar_ui_kit import TerminalReporter
+
+    return TerminalReporter()
+
+def _report_schema(
+    reporter: Union["TerminalReporter", PlainReporter],
+    title: str,
+    columns: List[Tuple[str, str, Optional[str]]],
+    header_style: str,
+) -> Union["ReportSchema", PlainSchema]:
+    """
+    Table layout from (header, key, style) columns. Plain reporters get plain stand-ins,
+    so headless runs never import stellar_ui_kit or rich.
+    """
+    if isinstance(reporter, PlainReporter):
+        return PlainSchema(title, [PlainColumn(header, key) for header, key, _ in columns])
+    from stellar_ui_kit import ColumnDefinition, ReportSchema
+
+    return ReportSchema(
+        title=title,
+        columns=[
+            ColumnDefinition(header=header, key=key, style=style) if style else ColumnDefinition(header=header, key=key)
+            for header, key, style in columns
+        ],
+        header_style=header_style,
+    )
 
+def _render_audit_table(
+    reporter: Union["TerminalReporter", PlainReporter], key: str, results: List["LinterResult"]
+) -> None:
+    """Render the report table for one audit as soon as its results are available."""
+    if key == "type_integrity":
+        # Table 1: Type Integrity
+        mypy_schema = _report_schema(
+            reporter,
+            "[MYPY] Type Integrity Audit",
+            [("Error Code", "code", "#00EEFF"), ("Count", "count", "bold #007BFF"), ("Message", "message", None)],
+            "bold #007BFF",
+        )
+        if results:
+            reporter.generate_report(_process_results(results), mypy_schema)
+        else:
+            print("\n✅ No Type Integrity violations detected.")
+    elif key == "architectural":
+        # Table 2: Architectural Governance
+        excelsior_schema = _report_schema(
+            reporter,
+            "[EXCELSIOR] Architectural Governance Audit",
+            [
+                ("Rule ID", "code", "#C41E3A"),
+                ("Count", "count", "bold #007BFF"),
+                ("Violation Description", "message", None),
+            ],
+            "bold #F9A602",
+        )
+        if results:
+            reporter.generate_report(_process_results(results), excelsior_schema)
+        else:
+            print("\n✅ No Architectural violations detected.")
+    elif results:
+        # Table 3: Package Contracts
+        il_schema = _report_schema(
+            reporter,
+            "[IMPORT-LINTER] Package Boundary Audit",
+            [("Rule ID", "code", "#7B68EE"), ("Contract Violation", "message", None)],
+            "bold #7B68EE",
+        )
+        reporter.generate_report([r.to_dict() for r in results], il_schema)
+
+def _save_audit_trail(
+    telemetry: "TelemetryPort",
+    trail: AuditTrailWriter,
+    mypy: List["LinterResult"],
+    excelsior: List["LinterResult"],
+    il: List["LinterResult"],
+    timings: Optional[Dict[str, float]] = None,
+) -> None:
+    """Close the streamed audit trail and write its human readable companion for human/AI review."""
+    trail.write_summary(timings)
+    trail.close()
+
+    excelsior_dir = trail.path.parent
     # Human readable summary
     txt_path = excelsior_dir / "last_audit.txt"
     with open(txt_path, "w", encoding="utf-8") as f:
@@ -273,7 +779,7 @@ def _save_audit_trail(telemetry: "TelemetryPort", mypy: List["LinterResult"], ex
                 for loc in r.locations:
                     f.write(f"  - {loc}\n")
 
-    telemetry.step(f"💾 Audit Trail persisted to: {json_path} and {txt_path}")
+    telemetry.step(f"💾 Audit Trail persisted to: {trail.path} and {txt_path}")
 
 def init_command(telemetry: "TelemetryPort") -> None:
     """Initialize Excelsior configuration."""
@@ -506,23 +1012,110 @@ enable = ["clean-arch-classes", "clean-arch-imports", "clean-arch-layers"] # and
         """
     )
 
-def main() -> None:
-    """Main entry point."""
-    container = ExcelsiorContainer()
-    # JUSTIFICATION: Bootstrapping the DI container requires direct access.
-    # casting to Any to avoid circular import at runtime, relying on TYPE_CHECKING
-    telemetry: "TelemetryPort" = container.get("TelemetryPort")
-
+def _build_parser() -> argparse.ArgumentParser:
+    """The `excelsior` argument parser with all of its subcommands."""
     parser = argparse.ArgumentParser(
         description=f"{BANNER}\nEXCELSIOR v2: Architectural Autopilot for Clean Architecture.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Plain output for CI: no rich rendering, no prompts (also EXCELSIOR_HEADLESS=1 or CI=true)",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Check
     check_parser = subparsers.add_parser("check", help="Run multi-tool audit")
     check_parser.add_argument("path", nargs="?", default=".", help="Target path to audit")
+    check_parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run Mypy, Excelsior and Import-Linter one after another instead of concurrently",
+    )
+    check_parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run the Excelsior checkers in a separate pylint process instead of in-process",
+    )
+    check_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for the Excelsior checkers (default: sized from CPUs, free memory and file count)",
+    )
+    check_parser.add_argument(
+        "--mypy",
+        choices=MYPY_MODES,
+        default="subprocess",
+        help="How to run mypy: a fresh process, in-process via mypy.api, or the dmypy daemon (default: subprocess)",
+    )
+    check_parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Ask a running 'excelsior serve' daemon for the Excelsior results (falls back to a local run)",
+    )
+    check_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyse every file instead of reusing results from .excelsior/cache",
+    )
+    check_parser.add_argument(
+        "--audit-compression",
+        choices=sorted(AUDIT_COMPRESSIONS),
+        default="none",
+        help="Compress the NDJSON audit trail in .excelsior (default: none)",
+    )
+    check_parser.add_argument(
+        "--baseline",
+        metavar="PATH",
+        help="Report and fail only on violations missing from this baseline (created on first use)",
+    )
+    check_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Rewrite the --baseline file from this run, accepting all current violations",
+    )
+    check_parser.add_argument(
+        "--history",
+        action="store_true",
+        help="Also record this run in the local audit history (.excelsior/history.sqlite3)",
+    )
+
+    # Serve
+    serve_parser = subparsers.add_parser("serve", help="Keep a warm analysis daemon for 'check --daemon'")
+    serve_parser.add_argument("--stop", action="store_true", help="Stop the running daemon")
+
+    # Watch
+    watch_parser = subparsers.add_parser("watch", help="Re-check changed modules on save")
+    watch_parser.add_argument("path", nargs="?", default=".", help="Target path to watch")
+    watch_parser.add_argument(
+        "--interval", type=float, default=0.5, help="Polling interval in seconds (default: 0.5)"
+    )
+
+    # History
+    history_parser = subparsers.add_parser("history", help="Query audits recorded with 'check --history'")
+    history_parser.add_argument("--rule", help="Restrict to one rule code (e.g. W9006)")
+    history_mode = history_parser.add_mutually_exclusive_group()
+    history_mode.add_argument(
+        "--top", type=int, metavar="N", help="Show the N files with the most violations in the latest run"
+    )
+    history_mode.add_argument(
+        "--regressions", action="store_true", help="Show files that got worse since the previous run"
+    )
+    history_mode.add_argument("--prune", type=int, metavar="KEEP", help="Delete all but the newest KEEP runs")
+    history_parser.add_argument(
+        "--limit", type=int, default=20, help="How many runs (or files) to show (default: 20)"
+    )
+
+    # Bench
+    bench_parser = subparsers.add_parser("bench", help="Measure Excelsior's own overhead")
+    bench_parser.add_argument("target", choices=["startup"], help="What to measure")
+    bench_parser.add_argument(
+        "--runs", type=int, default=5, help="Fresh interpreters per scenario; medians are reported (default: 5)"
+    )
 
     # Fix
     fix_parser = subparsers.add_parser("fix", help="Auto-fix common violations")
@@ -531,23 +1124,74 @@ def main() -> None:
     # Init
     subparsers.add_parser("init", help="Initialize configuration")
 
-    args = parser.parse_args()
+    return parser
 
+def _dispatch(
+    args: argparse.Namespace, telemetry: "TelemetryPort", headless: bool, parser: argparse.ArgumentParser
+) -> None:
+    """Run the subcommand chosen on the command line."""
+    if args.command in ("check", "fix", "init") and "-h" not in sys.argv and "--help" not in sys.argv:
+        telemetry.handshake()
     if args.command == "check":
-        if "-h" not in sys.argv and "--help" not in sys.argv:
-            telemetry.handshake()
-        check_command(telemetry, args.path)
+        check_command(
+            telemetry,
+            args.path,
+            CheckOptions(
+                concurrent=not args.sequential,
+                in_process=not args.isolated,
+                use_cache=not args.no_cache,
+                daemon=args.daemon,
+                jobs=args.jobs,
+                mypy_mode=args.mypy,
+                audit_compression=args.audit_compression,
+                record_history=args.history,
+                baseline_path=args.baseline,
+                update_baseline=args.update_baseline,
+                headless=headless,
+            ),
+        )
+    elif args.command == "serve":
+        serve_command(telemetry, stop=args.stop)
+    elif args.command == "watch":
+        watch_command(telemetry, args.path, interval=args.interval)
+    elif args.command == "history":
+        history_command(
+            telemetry,
+            rule=args.rule,
+            top=args.top,
+            regressions=args.regressions,
+            limit=args.limit,
+            prune=args.prune,
+            headless=headless,
+        )
+    elif args.command == "bench":
+        bench_command(telemetry, runs=args.runs, headless=headless)
     elif args.command == "fix":
         from clean_architecture_linter.fixer import excelsior_fix
-        if "-h" not in sys.argv and "--help" not in sys.argv:
-            telemetry.handshake()
         excelsior_fix(telemetry, args.path)
     elif args.command == "init":
-        if "-h" not in sys.argv and "--help" not in sys.argv:
-            telemetry.handshake()
         init_command(telemetry)
     elif args.command is None:
         parser.print_help()
 
+def main() -> None:
+    """Main entry point."""
+    # The global instance is shared with the in-process pylint run of `check`,
+    # so the plugin reuses these gateways instead of building its own.
+    container = ExcelsiorContainer.get_instance()
+    container.mark_embedded()
+
+    parser = _build_parser()
+    args = parser.parse_args()
+
+    # Telemetry is built only now: `--help` exits above without constructing it.
+    headless: bool = args.headless or headless_requested()
+    if headless:
+        container.register_singleton("TelemetryPort", HeadlessTelemetry())
+    # JUSTIFICATION: Bootstrapping the DI container requires direct access.
+    telemetry: "TelemetryPort" = container.get("TelemetryPort")
+
+    _dispatch(args, telemetry, headless, parser)
+
 if __name__ == "__main__":
     main()
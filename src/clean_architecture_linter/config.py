@@ -1,10 +1,9 @@
 """Configuration loader for linter settings."""
 
 import sys
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import ClassVar, Optional, Union
-
-import astroid  # type: ignore[import-untyped]
+from typing import TYPE_CHECKING, ClassVar, FrozenSet, Optional, Union
 
 if sys.version_info >= (3, 11):
     import tomllib as toml_lib
@@ -17,6 +16,42 @@ else:
 
 from clean_architecture_linter.layer_registry import LayerRegistry, LayerRegistryConfig
 
+if TYPE_CHECKING:
+    import astroid  # type: ignore[import-untyped]
+
+
+@dataclass(frozen=True)
+class PluginState:
+    """
+    Everything the checkers derive from the environment, computed once per pylint run.
+
+    It is stored on the linter, so `pylint -j N` pickles it to every worker along
+    with the linter; workers install it instead of searching for and parsing
+    pyproject.toml and rebuilding the layer registry themselves.
+    """
+
+    config: dict[str, object]
+    registry: LayerRegistry
+    stdlib_modules: FrozenSet[str]
+
+
+@dataclass(frozen=True)
+class InferenceBudget:
+    """
+    Limits on astroid inference, for one inferred node and for one checked module; 0 means
+    no limit. Steps are astroid's own count of values inferred along the way. astroid
+    stops that count for a node at InferenceContext.max_inferred (100) and yields
+    Uninferable past it, so node_steps only has an effect below about 100; the default
+    cuts a node off just before astroid would truncate it. The millisecond limits are
+    off by default: a verdict that depends on machine load would not be reproducible,
+    while step counts are.
+    """
+
+    node_steps: int = 90
+    node_ms: int = 0
+    module_steps: int = 500000
+    module_ms: int = 0
+
 
 class ConfigurationLoader:
     """
@@ -33,38 +68,23 @@ class ConfigurationLoader:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance.load_config()
+            cls._registry = _build_registry(cls._config)
+        return cls._instance
 
-            # Extract custom layer mappings from config
-            # Config format: [tool.clean-arch.layer_map]
-            # Key = Layer Name (e.g. "Infrastructure"), Value = Directory/Suffix (e.g. "gateways")
-            # We need to flip this for LayerRegistry: Pattern -> Layer Name
-            raw_layer_map = cls._config.get("layer_map", {})
-            directory_map_override: dict[str, str] = {}
-
-            if isinstance(raw_layer_map, dict):
-                for layer_name, pattern_or_list in raw_layer_map.items():
-                    if not isinstance(layer_name, str):
-                        continue
-                    if isinstance(pattern_or_list, list):
-                        for pattern in pattern_or_list:
-                            if isinstance(pattern, str):
-                                directory_map_override[pattern] = layer_name
-                    elif isinstance(pattern_or_list, str):
-                        directory_map_override[pattern_or_list] = layer_name
-
-            base_class_map = cls._config.get("base_class_map", {})
-            module_map = cls._config.get("module_map", {})
-
-            registry_config = LayerRegistryConfig(
-                project_type=str(cls._config.get("project_type", "generic")),
-                directory_map=directory_map_override,
-                base_class_map=_invert_map(base_class_map),
-                module_map=_invert_map(module_map),
-            )
-
-            cls._registry = LayerRegistry(config=registry_config)
+    @classmethod
+    def install(cls, state: PluginState) -> "ConfigurationLoader":
+        """Adopt a precomputed state without touching the filesystem."""
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        cls._config = state.config
+        cls._registry = state.registry
         return cls._instance
 
+    def snapshot(self) -> PluginState:
+        """The loaded configuration as a picklable PluginState."""
+        stdlib_modules = frozenset(getattr(sys, "stdlib_module_names", ())).union(sys.builtin_module_names)
+        return PluginState(dict(self.config), self.registry, stdlib_modules)
+
     def set_registry(self, registry: LayerRegistry) -> None:
         """Set the layer registry."""
         ConfigurationLoader._registry = registry
@@ -181,6 +201,24 @@ class ConfigurationLoader:
         val = self._config.get("visibility_enforcement", True)
         return bool(val)
 
+    @property
+    def ast_cache(self) -> bool:
+        """Whether to keep built stdlib and stub ASTs on disk between runs."""
+        val = self._config.get("ast_cache", False)
+        return bool(val)
+
+    @property
+    def inference_budget(self) -> InferenceBudget:
+        """Inference limits from [tool.clean-arch.inference_budget]; missing keys keep their defaults."""
+        raw = self._config.get("inference_budget", {})
+        limits: dict[str, int] = {}
+        if isinstance(raw, dict):
+            for field in fields(InferenceBudget):
+                value = raw.get(field.name)
+                if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+                    limits[field.name] = value
+        return InferenceBudget(**limits)
+
     def _get_set(self, key: str, defaults: Optional[set[str]] = None) -> set[str]:
         """Helper to safely get a set of strings from config."""
         raw = self._config.get(key, [])
@@ -242,15 +280,46 @@ class ConfigurationLoader:
         """Return list of modules considered Shared Kernel."""
         return self._get_set("shared_kernel_modules")
 
-    def get_layer_for_class_node(self, node: astroid.nodes.ClassDef) -> Optional[str]:
+    def get_layer_for_class_node(self, node: "astroid.nodes.ClassDef") -> Optional[str]:
         """Delegate to registry for LoD compliance."""
         return self.registry.get_layer_for_class_node(node)
 
-    def resolve_layer(self, node_name: str, file_path: str, node: Optional[astroid.nodes.NodeNG] = None) -> Optional[str]:
+    def resolve_layer(
+        self, node_name: str, file_path: str, node: Optional["astroid.nodes.NodeNG"] = None
+    ) -> Optional[str]:
         """Delegate to registry for LoD compliance."""
         return self.registry.resolve_layer(node_name, file_path, node=node)
 
 
+def _build_registry(config: dict[str, object]) -> LayerRegistry:
+    """Compile the layer rules of a [tool.clean-arch] section into a LayerRegistry."""
+    # Extract custom layer mappings from config
+    # Config format: [tool.clean-arch.layer_map]
+    # Key = Layer Name (e.g. "Infrastructure"), Value = Directory/Suffix (e.g. "gateways")
+    # We need to flip this for LayerRegistry: Pattern -> Layer Name
+    raw_layer_map = config.get("layer_map", {})
+    directory_map_override: dict[str, str] = {}
+
+    if isinstance(raw_layer_map, dict):
+        for layer_name, pattern_or_list in raw_layer_map.items():
+            if not isinstance(layer_name, str):
+                continue
+            if isinstance(pattern_or_list, list):
+                for pattern in pattern_or_list:
+                    if isinstance(pattern, str):
+                        directory_map_override[pattern] = layer_name
+            elif isinstance(pattern_or_list, str):
+                directory_map_override[pattern_or_list] = layer_name
+
+    registry_config = LayerRegistryConfig(
+        project_type=str(config.get("project_type", "generic")),
+        directory_map=directory_map_override,
+        base_class_map=_invert_map(config.get("base_class_map", {})),
+        module_map=_invert_map(config.get("module_map", {})),
+    )
+    return LayerRegistry(config=registry_config)
+
+
 def _invert_map(config_map: object) -> dict[str, str]:
     """Invert config map (Layer -> Items) to (Item -> Layer)."""
     inverted: dict[str, str] = {}
@@ -1,38 +1,88 @@
-from typing import Dict, Any, TypeVar, Optional
-from clean_architecture_linter.interface.telemetry import ProjectTelemetry
-from clean_architecture_linter.infrastructure.gateways.astroid_gateway import AstroidGateway
-from clean_architecture_linter.infrastructure.gateways.python_gateway import PythonGateway
+from typing import Callable, Dict, Any, TypeVar, Optional
 
 T = TypeVar("T")
 
 
+def _telemetry() -> Any:  # pylint: disable=banned-any-usage
+    # JUSTIFICATION: Imported on first use; rich is only needed once something is printed.
+    from clean_architecture_linter.interface.telemetry import ProjectTelemetry
+
+    return ProjectTelemetry("EXCELSIOR", "red", "Command Cruiser Online")
+
+
+def _astroid_gateway() -> Any:  # pylint: disable=banned-any-usage
+    # JUSTIFICATION: Imported on first use; astroid and typeshed are only needed for analysis.
+    from clean_architecture_linter.infrastructure.gateways.astroid_gateway import AstroidGateway
+
+    return AstroidGateway()
+
+
+def _python_gateway() -> Any:  # pylint: disable=banned-any-usage
+    # JUSTIFICATION: Imported on first use, like the other gateways.
+    from clean_architecture_linter.infrastructure.gateways.python_gateway import PythonGateway
+
+    return PythonGateway()
+
+
 class ExcelsiorContainer:
-    """Dependency Injection Container for the Excelsior Linter."""
+    """
+    Dependency Injection Container for the Excelsior Linter.
+
+    Defaults are registered as factories and built on first `get`, so commands
+    that never touch a gateway (`--help`, `init`) never import or construct one.
+    """
 
     _instance: Optional["ExcelsiorContainer"] = None
 
     def __init__(self) -> None:
         self._singletons: Dict[str, Any] = {}
+        # JUSTIFICATION: DI Container must handle any type of service
+        self._factories: Dict[str, Callable[[], Any]] = {}  # pylint: disable=banned-any-usage
+        self._embedded: bool = False
         self._register_defaults()
 
     def _register_defaults(self) -> None:
         """Register default implementations for protocols."""
-        self.register_singleton("TelemetryPort", ProjectTelemetry("EXCELSIOR", "red", "Command Cruiser Online"))
-        self.register_singleton("AstroidGateway", AstroidGateway())
-        self.register_singleton("PythonGateway", PythonGateway())
+        self.register_factory("TelemetryPort", _telemetry)
+        self.register_factory("AstroidGateway", _astroid_gateway)
+        self.register_factory("PythonGateway", _python_gateway)
 
     # JUSTIFICATION: DI Container must handle any type of service
     def register_singleton(self, key: str, instance: Any) -> None:  # pylint: disable=banned-any-usage
         """Register a singleton instance."""
+        self._factories.pop(key, None)
         self._singletons[key] = instance
 
+    # JUSTIFICATION: DI Container must handle any type of service
+    def register_factory(self, key: str, factory: Callable[[], Any]) -> None:  # pylint: disable=banned-any-usage
+        """Register a singleton that is built by `factory` the first time it is requested."""
+        self._singletons.pop(key, None)
+        self._factories[key] = factory
+
     # JUSTIFICATION: DI Container must return any type of service
     def get(self, key: str) -> Any:  # pylint: disable=banned-any-usage
         """Retrieve a dependency by key."""
         if key in self._singletons:
             return self._singletons[key]
+        factory = self._factories.pop(key, None)
+        if factory is not None:
+            self._singletons[key] = factory()
+            return self._singletons[key]
         raise ValueError(f"Dependency '{key}' not registered.")
 
+    def is_built(self, key: str) -> bool:
+        """Whether the dependency has been constructed (always true for registered instances)."""
+        return key in self._singletons
+
+    @property
+    def embedded(self) -> bool:
+        """Whether pylint is being driven in-process by the Excelsior CLI."""
+        return self._embedded
+
+    def mark_embedded(self) -> None:
+        """Flag that the plugin runs inside the Excelsior CLI (no banner, shared gateways)."""
+        self._embedded = True
+
     @classmethod
     def get_instance(cls) -> "ExcelsiorContainer":
         """Get or create global container instance."""
@@ -1,5 +1,34 @@
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Union
+from typing import Dict, Iterable, List, Union
+
+@dataclass(frozen = True)
+class Diagnostic:
+    """A single tool finding at one source location."""
+    code: str
+    message: str
+    path: str
+    line: int
+    column: int = 0
+    # Enclosing function or class, when the tool reports one.
+    symbol: str = ""
+    # Stable identity for baselines: rule, path, symbol and source snippet, never the line number.
+    fingerprint: str = field(default="", compare=False)
+
+    @property
+    def location(self) -> str:
+        """Location in the 'path:line' form used by LinterResult.locations."""
+        return f"{self.path}:{self.line}"
+
+    def to_dict(self) -> Dict[str, Union[str, int]]:
+        """Convert to dictionary for the audit trail."""
+        return {
+            "path": self.path,
+            "line": self.line,
+            "column": self.column,
+            "symbol": self.symbol,
+            "message": self.message,
+        }
 
 @dataclass(frozen = True)
 class LinterResult:
@@ -7,6 +36,7 @@ class LinterResult:
     code: str
     message: str
     locations: List[str] = field(default_factory=list)
+    diagnostics: List[Diagnostic] = field(default_factory=list)
 
     def add_location(self, location: str) -> 'LinterResult':
         """
@@ -19,11 +49,34 @@ class LinterResult:
         import dataclasses
         return dataclasses.replace(self, locations=new_locations)
 
-    def to_dict(self) -> Dict[str, Union[str, List[str]]]:
+    @classmethod
+    def group(cls, diagnostics: Iterable[Diagnostic]) -> List['LinterResult']:
+        """
+        Fold diagnostics into one result per code.
+        The last message seen for a code wins; locations are de-duplicated and sorted.
+        """
+        messages: Dict[str, str] = {}
+        by_code: Dict[str, List[Diagnostic]] = defaultdict(list)
+        for diagnostic in diagnostics:
+            messages[diagnostic.code] = diagnostic.message
+            by_code[diagnostic.code].append(diagnostic)
+
+        results = []
+        for code, entries in by_code.items():
+            entries.sort(key=lambda d: (d.path, d.line, d.column))
+            # JUSTIFICATION: Converting set to sorted list for deterministic reporting.
+            locations = sorted({d.location for d in entries if d.path})
+            results.append(cls(code, messages[code], locations, entries))
+        return results
+
+    def to_dict(self) -> Dict[str, Union[str, List[str], List[Dict[str, Union[str, int]]]]]:
         """Convert to dictionary for reporter."""
-        return {
+        data: Dict[str, Union[str, List[str], List[Dict[str, Union[str, int]]]]] = {
             "code": self.code,
             "message": self.message,
             "location": ", ".join(self.locations) if self.locations else "N/A",
             "locations": self.locations
         }
+        if self.diagnostics:
+            data["diagnostics"] = [d.to_dict() for d in self.diagnostics]
+        return data
@@ -1,11 +1,11 @@
-from typing import Protocol, Optional, TYPE_CHECKING
+from typing import Callable, Iterator, Protocol, Optional, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     # JUSTIFICATION: Type checking imports for Domain Protocol definitions
     import astroid # type: ignore[import-untyped] # pylint: disable=clean-arch-resources
     # JUSTIFICATION: Type checking imports for Domain Protocol definitions
     from clean_architecture_linter.config import ConfigurationLoader # pylint: disable=clean-arch-resources
-    from clean_architecture_linter.domain.entities import LinterResult
+    from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
 
 
 
@@ -39,6 +39,24 @@ class AstroidProtocol(Protocol):
     def get_call_name(self, node: "astroid.nodes.Call") -> Optional[str]:
         ...
 
+    def clear_memo(self) -> None:
+        ...
+
+    def infer(self, node: "astroid.nodes.NodeNG") -> Iterator["astroid.nodes.NodeNG"]:
+        ...
+
+    def inference_degradation(self, module: "astroid.nodes.Module") -> Optional[str]:
+        ...
+
+
+class DependencyTrackerProtocol(Protocol):
+    """Records which source files each module's analysis consulted."""
+    def dependencies_of(self, file_path: str) -> Set[str]: ...
+
+    def reset_dependencies(self) -> None: ...
+
+    def is_degraded(self, file_path: str) -> bool: ...
+
 
 class PythonProtocol(Protocol):
     def is_std_lib_module(self, module_name: str) -> bool:
@@ -49,4 +67,8 @@ class PythonProtocol(Protocol):
 
 class LinterAdapterProtocol(Protocol):
     """Protocol for linter adapters."""
-    def gather_results(self, target_path: str) -> list["LinterResult"]: ...
+    def gather_results(
+        self, target_path: str, on_diagnostic: Optional[Callable[["Diagnostic"], None]] = None
+    ) -> list["LinterResult"]: ...
+
+    def iter_diagnostics(self, target_path: str) -> Iterator["Diagnostic"]: ...
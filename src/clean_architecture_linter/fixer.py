@@ -3,8 +3,10 @@
 import re
 import os
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Dict, Optional, Any, Set
-import json
+from typing import IO, TYPE_CHECKING, List, Dict, Optional, Any, Set, Iterator
+
+# JUSTIFICATION: The fix command reads the audit trail that the check command wrote.
+from clean_architecture_linter.infrastructure.audit_trail import load_audit_records
 
 if TYPE_CHECKING:
     from stellar_ui_kit import TelemetryPort
@@ -17,7 +19,7 @@ def excelsior_fix(telemetry: "TelemetryPort", target_path: str) -> None:
     cwd = Path.cwd()
 
     # 0. Load Audit Trail if exists to guide Stage 3
-    audit_data = _load_audit_trail()
+    audit_records = _load_audit_trail()
     ambiguous_violations = []
 
     # 1. Structural Fixes (py.typed, __init__.py)
@@ -54,7 +56,7 @@ def excelsior_fix(telemetry: "TelemetryPort", target_path: str) -> None:
             modified_files += 1
 
     # 3. Generate Fix Manifest (Stage 3)
-    _generate_fix_manifest(telemetry, audit_data)
+    _generate_fix_manifest(telemetry, audit_records)
 
     telemetry.step(f"🛠️ Fix Suite complete. Files repaired: {modified_files}")
 
@@ -209,55 +211,57 @@ def _fix_deterministic_type_hints(content: str) -> str:
 
     return content
 
-def _generate_fix_manifest(telemetry: "TelemetryPort", audit_data: Optional[dict[str, object]]) -> None:
+def _generate_fix_manifest(telemetry: "TelemetryPort", audit_records: Optional[Iterator[Dict[str, object]]]) -> None:
     """Stage 3: Record ambiguous violations in a fix manifest."""
-    if not audit_data:
+    if audit_records is None:
         return
 
     manifest_path = Path(".excelsior/fix_manifest.md")
-    lines = ["# 🛡️ Excelsior Fix Manifest", "", "The following violations require manual review or AI-assisted resolution.", ""]
+    header = [
+        "# 🛡️ Excelsior Fix Manifest",
+        "",
+        "The following violations require manual review or AI-assisted resolution.",
+        "",
+    ]
 
     def strip_ansi(text: str) -> str:
         ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
         return ansi_escape.sub('', text)
 
-    found_ambiguous: bool = False
-    for category, violations in audit_data.get("violations", {}).items():
-        if not violations:
-            continue
-
-        lines.append(f"## {category.replace('_', ' ').title()}")
-        for v in violations:
-            found_ambiguous: bool = True
-            lines.append(f"### ❓ {strip_ansi(v['code'])}")
-            lines.append(f"- **Message**: {strip_ansi(v['message'])}")
-
-            locations = v.get("locations", [])
-            if not locations and "location" in v and v["location"] != "N/A":
-                # Fallback to string-based parsing if list is missing
-                locations = [loc.strip() for loc in v["location"].split(",") if loc.strip()]
-
-            if locations:
+    # The trail is consumed in one pass and the manifest written as it goes; each tool's
+    # records are contiguous, so a heading is emitted whenever the category changes.
+    manifest: Optional[IO[str]] = None
+    category: Optional[object] = None
+    try:
+        for v in audit_records:
+            if v.get("type") != "violation":
+                continue
+            lines: List[str] = []
+            if manifest is None:
+                manifest = open(manifest_path, "w", encoding = "utf-8")
+                lines.extend(header)
+            if v.get("category") != category:
+                category = v.get("category")
+                lines.append(f"## {str(category).replace('_', ' ').title()}")
+            lines.append(f"### ❓ {strip_ansi(str(v.get('code', '')))}")
+            lines.append(f"- **Message**: {strip_ansi(str(v.get('message', '')))}")
+
+            locations = v.get("locations") or []
+            if isinstance(locations, list) and locations:
                 lines.append("- **Locations**:")
                 for loc in locations:
-                    lines.append(f"  - `{strip_ansi(loc)}`")
+                    lines.append(f"  - `{strip_ansi(str(loc))}`")
             lines.append("")
+            manifest.write("\n".join(lines) + "\n")
+    finally:
+        if manifest is not None:
+            manifest.close()
 
-    if not found_ambiguous:
+    if manifest is None:
         return
 
-    with open(manifest_path, "w", encoding = "utf-8") as f:
-        f.write("\n".join(lines))
-
     telemetry.step(f"📝 Fix Manifest generated: {manifest_path}")
 
-def _load_audit_trail() -> Optional[dict[str, object]]:
-    """Load the latest audit trail from .excelsior/last_audit.json."""
-    path = Path(".excelsior/last_audit.json")
-    if not path.exists():
-        return None
-    try:
-        with open(path, "r", encoding = "utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return None
+def _load_audit_trail() -> Optional[Iterator[Dict[str, object]]]:
+    """Lazily read the latest audit trail from .excelsior (NDJSON, or a legacy last_audit.json)."""
+    return load_audit_records()
@@ -0,0 +1,91 @@
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+from clean_architecture_linter.domain.protocols import LinterAdapterProtocol
+
+DEFAULT_SOCKET_PATH: Path = Path(".excelsior") / "daemon.sock"
+
+
+class DaemonClient:
+    """
+    Thin client for `excelsior serve`.
+
+    The wire protocol is JSON lines over a Unix socket: one request object per
+    connection, answered by a stream of reply objects ending with {"done": ...}
+    or {"error": ...}.
+    """
+
+    def __init__(self, socket_path: Path = DEFAULT_SOCKET_PATH, timeout: Optional[float] = None) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+
+    def ping(self) -> bool:
+        """Whether a daemon is listening on the socket."""
+        if not hasattr(socket, "AF_UNIX") or not self.socket_path.exists():
+            return False
+        try:
+            return any(reply.get("ok") for reply in self.request({"command": "ping"}, timeout=1.0))
+        except (OSError, ValueError):
+            return False
+
+    def shutdown(self) -> None:
+        """Ask the daemon to exit once the current request is answered."""
+        for _ in self.request({"command": "shutdown"}):
+            pass
+
+    def request(self, payload: Dict[str, object], timeout: Optional[float] = None) -> Iterator[Dict[str, object]]:
+        """Send one request and yield the replies as they arrive."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(timeout if timeout is not None else self.timeout)
+            conn.connect(str(self.socket_path))
+            conn.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with conn.makefile("r", encoding="utf-8") as replies:
+                for line in replies:
+                    reply = json.loads(line)
+                    if isinstance(reply, dict):
+                        yield reply
+
+
+class DaemonAdapter(LinterAdapterProtocol):
+    """Adapter that takes Excelsior results from a running `excelsior serve` daemon."""
+
+    def __init__(self, client: DaemonClient) -> None:
+        self.client = client
+        self.stats: Dict[str, object] = {}
+
+    def gather_results(
+        self, target_path: str, on_diagnostic: Optional[Callable[[Diagnostic], None]] = None
+    ) -> List[LinterResult]:
+        """Ask the daemon to check target_path and gather results."""
+        try:
+            diagnostics: List[Diagnostic] = []
+            for diagnostic in self.iter_diagnostics(target_path):
+                if on_diagnostic:
+                    on_diagnostic(diagnostic)
+                diagnostics.append(diagnostic)
+            return LinterResult.group(diagnostics)
+        except (OSError, ValueError, RuntimeError) as e:
+            # JUSTIFICATION: Error message wrapping requires explicit list creation.
+            return [LinterResult("EXCELSIOR_ERROR", str(e), [])]
+
+    def iter_diagnostics(self, target_path: str) -> Iterator[Diagnostic]:
+        """Stream diagnostics from the daemon, with paths relative to this process's cwd."""
+        payload: Dict[str, object] = {
+            "command": "check",
+            "paths": [os.path.abspath(target_path)],
+            "cwd": os.getcwd(),
+        }
+        for reply in self.client.request(payload):
+            if "error" in reply:
+                raise RuntimeError(f"excelsior daemon: {reply['error']}")
+            record = reply.get("diagnostic")
+            if isinstance(record, dict):
+                yield Diagnostic(**record)
+            elif reply.get("done"):
+                self.stats = reply
+                return
+        raise RuntimeError("excelsior daemon closed the connection before finishing")
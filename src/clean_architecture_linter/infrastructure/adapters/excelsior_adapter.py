@@ -1,66 +1,268 @@
-import re
-import subprocess
+import multiprocessing
 import os
+import re
 import sys
-from collections import defaultdict
-from typing import List, Dict, Set
-from clean_architecture_linter.domain.protocols import LinterAdapterProtocol
-from clean_architecture_linter.domain.entities import LinterResult
+from concurrent.futures import ProcessPoolExecutor
+from queue import Queue
+from threading import Thread
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Set, cast
+
+from pylint.reporters import BaseReporter
+
+from clean_architecture_linter.config import ConfigurationLoader
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+from clean_architecture_linter.domain.protocols import DependencyTrackerProtocol, LinterAdapterProtocol
+from clean_architecture_linter.infrastructure.adapters.json_stream import JsonStreamDecoder
+from clean_architecture_linter.infrastructure.adapters.parallel import (
+    default_workers,
+    init_worker,
+    lint_shard,
+    shard_by_package,
+)
+from clean_architecture_linter.infrastructure.adapters.process_stream import ProcessLineStream
+from clean_architecture_linter.infrastructure.baseline import with_fingerprint
+
+if TYPE_CHECKING:
+    from pylint.message import Message
+
+    from clean_architecture_linter.infrastructure.adapters.result_cache import ResultCache
+
+# Text fallback. Pattern: path:line: msg_id: msg (symbol)
+_TEXT_MESSAGE = re.compile(r"^(.*?):(\d+): (.*?): (.*)$")
+# End-of-run marker for the in-process message queue.
+_DONE = object()
+
+
+def discover_python_files(target_path: str) -> List[str]:
+    """Python files under the target, skipping hidden and bytecode directories."""
+    if os.path.isfile(target_path):
+        return [target_path]
+    found: List[str] = []
+    for root, dirs, files in os.walk(target_path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d != "__pycache__")
+        found.extend(os.path.join(root, name) for name in sorted(files) if name.endswith(".py"))
+    return found
+
+
+class _StreamingReporter(BaseReporter):
+    """Pylint reporter that forwards every message to a sink instead of printing it."""
+
+    name: str = "excelsior-stream"
+
+    def __init__(self, sink: Callable[["Message"], None]) -> None:
+        super().__init__()
+        self._sink = sink
+
+    def handle_message(self, msg: "Message") -> None:
+        """Forward the message as soon as pylint emits it."""
+        self._sink(msg)
+
+    # JUSTIFICATION: Pylint API requires generic layout
+    def _display(self, layout: object) -> None:
+        """Nothing to render; messages were already forwarded."""
 
 class ExcelsiorAdapter(LinterAdapterProtocol):
     """Adapter for Pylint Clean Architecture output."""
 
-    def gather_results(self, target_path: str) -> List[LinterResult]:
+    def __init__(
+        self,
+        in_process: bool = True,
+        cache: Optional["ResultCache"] = None,
+        dependency_tracker: Optional[DependencyTrackerProtocol] = None,
+        jobs: Optional[int] = 1,
+    ) -> None:
+        # In-process runs reuse the already imported pylint/astroid and the warm
+        # ExcelsiorContainer; the subprocess mode is kept for isolation/debugging.
+        self.in_process = in_process
+        self.cache = cache
+        # Cross-module inference is only observable in-process; see AstroidGateway.dependencies_of.
+        self.dependency_tracker = dependency_tracker
+        # Worker processes for in-process runs; None sizes the pool from CPUs, memory and workload.
+        self.jobs = jobs
+        # Dependencies reported back by pool workers for the files they linted,
+        # and the files whose inference ran over budget there.
+        self._shard_dependencies: Dict[str, Set[str]] = {}
+        self._shard_degraded: Set[str] = set()
+        self._decoder = JsonStreamDecoder()
+
+    def gather_results(
+        self, target_path: str, on_diagnostic: Optional[Callable[[Diagnostic], None]] = None
+    ) -> List[LinterResult]:
         """Run pylint with Clean Architecture and gather results."""
-        env = os.environ.copy()
-        env["PYTHONPATH"] = "src"
         try:
-            # We use --output-format=text to get standard output
-            result = subprocess.run(
-                [
-                    sys.executable,
-                    "-m",
-                    "pylint",
-                    target_path,
-                    "--load-plugins=clean_architecture_linter",
-                    "--msg-template={path}:{line}: {msg_id}: {msg} ({symbol})",
-                ],
-                env=env,
-                capture_output = True,
-                text = True,
-                check = False,
-            )
-            return self._parse_output(result.stdout)
-        except Exception as e:
+            diagnostics: List[Diagnostic] = []
+            for diagnostic in self.iter_diagnostics(target_path):
+                if on_diagnostic:
+                    on_diagnostic(diagnostic)
+                diagnostics.append(diagnostic)
+            return LinterResult.group(diagnostics)
+        except (Exception, SystemExit) as e:
             # JUSTIFICATION: Error message wrapping requires explicit list creation.
             return [LinterResult("EXCELSIOR_ERROR", str(e), [])]
 
+    def iter_diagnostics(self, target_path: str) -> Iterator[Diagnostic]:
+        """Yield each pylint message as soon as the linter emits it."""
+        if self.cache is not None:
+            return self._iter_cached(target_path, self.cache)
+        return self.lint([target_path])
+
+    def lint(self, targets: List[str]) -> Iterator[Diagnostic]:
+        """Run the checkers over the given files or directories, bypassing the cache."""
+        if not self.in_process:
+            return self._iter_subprocess(targets)
+        if self.jobs == 1:
+            return self._iter_in_process(targets)
+        files = [f for target in targets for f in discover_python_files(target)]
+        shards = shard_by_package(files, self.jobs or default_workers(len(files)))
+        if len(shards) < 2:
+            return self._iter_in_process(targets)
+        return self._iter_parallel(shards)
+
+    def _iter_parallel(self, shards: List[List[str]]) -> Iterator[Diagnostic]:
+        """
+        Lint package-aligned shards in a process pool.
+        Results are yielded shard by shard in submission order, each shard sorted, so the
+        output is identical from run to run whatever order the workers finish in.
+        """
+        # spawn, not fork: check_command runs the other tools on threads, and forking a
+        # threaded process can leave the child holding locks nobody will release.
+        context = multiprocessing.get_context("spawn")
+        state = ConfigurationLoader().snapshot()
+        with ProcessPoolExecutor(
+            max_workers=len(shards), mp_context=context, initializer=init_worker, initargs=(state,)
+        ) as pool:
+            for diagnostics, dependencies, degraded in pool.map(lint_shard, shards):
+                for file_path, found in dependencies.items():
+                    self._shard_dependencies[file_path] = set(found)
+                self._shard_degraded.update(degraded)
+                yield from diagnostics
+
+    def _iter_cached(self, target_path: str, cache: "ResultCache") -> Iterator[Diagnostic]:
+        """Replay cached results for unaffected files and lint only the rest."""
+        files = discover_python_files(target_path)
+        replayed, stale = cache.partition(files)
+        yield from replayed
+        if not stale:
+            return
+
+        if self.dependency_tracker is not None:
+            self.dependency_tracker.reset_dependencies()
+        self._shard_dependencies.clear()
+        self._shard_degraded.clear()
+        # A cold cache lints the target as given so pylint's own discovery is unchanged.
+        targets = stale if len(stale) < len(files) else [target_path]
+        fresh: Dict[str, List[Diagnostic]] = {os.path.abspath(p): [] for p in stale}
+        for diagnostic in self.lint(targets):
+            # Fingerprinted once here and stored with the entry, so replayed files never re-read source.
+            diagnostic = with_fingerprint(diagnostic)
+            bucket = fresh.get(os.path.abspath(diagnostic.path))
+            if bucket is not None:
+                bucket.append(diagnostic)
+            yield diagnostic
+        # Only a completed run is recorded; an interrupted one leaves the files stale.
+        # So are files whose inference ran over budget: their results are not the full analysis.
+        project = {os.path.abspath(p) for p in files}
+        for file_path in stale:
+            if self._is_degraded(file_path):
+                continue
+            cache.store(file_path, fresh[os.path.abspath(file_path)], self._project_dependencies(file_path, project))
+
+    def _is_degraded(self, file_path: str) -> bool:
+        if os.path.abspath(file_path) in self._shard_degraded:
+            return True
+        return self.dependency_tracker is not None and self.dependency_tracker.is_degraded(file_path)
+
+    def _project_dependencies(self, file_path: str, project: Set[str]) -> Set[str]:
+        """Project files the analysis of file_path consulted; stdlib and third-party modules are ignored."""
+        path = os.path.abspath(file_path)
+        if path in self._shard_dependencies:
+            return self._shard_dependencies[path] & project
+        if self.dependency_tracker is None:
+            return set()
+        return self.dependency_tracker.dependencies_of(file_path) & project
+
+    def _iter_in_process(self, targets: List[str]) -> Iterator[Diagnostic]:
+        """Drive pylint through its programmatic API and stream Message objects from a worker thread."""
+        from pylint.lint import Run
+
+        queue: "Queue[object]" = Queue()
+
+        def run() -> None:
+            try:
+                Run(
+                    [*targets, "--load-plugins=clean_architecture_linter", "--score=n"],
+                    reporter=_StreamingReporter(queue.put),
+                    exit=False,
+                )
+            except (Exception, SystemExit) as e:
+                queue.put(e)
+            queue.put(_DONE)
+
+        Thread(target=run, name="excelsior-pylint", daemon=True).start()
+        while True:
+            item = queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield self._from_message(cast("Message", item))
+
+    def _iter_subprocess(self, targets: List[str]) -> Iterator[Diagnostic]:
+        """Run pylint in a child interpreter and decode its JSON report as it is written."""
+        env = os.environ.copy()
+        env["PYTHONPATH"] = "src"
+        stream = ProcessLineStream(
+            [
+                sys.executable,
+                "-m",
+                "pylint",
+                *targets,
+                "--load-plugins=clean_architecture_linter",
+                "--output-format=json",
+            ],
+            env,
+        )
+        return self._iter_json_diagnostics(stream)
+
+    def _from_message(self, msg: "Message") -> Diagnostic:
+        """Map a pylint Message to a Diagnostic."""
+        return Diagnostic(
+            msg.msg_id, f"{msg.msg} ({msg.symbol})", msg.path, msg.line, msg.column or 0, msg.obj or ""
+        )
+
     def _parse_output(self, output: str) -> List[LinterResult]:
-        # Structure: {msg_id: {"message": str, "locations": set}}
-        collected: Dict[str, Dict[str, object]] = defaultdict(lambda: {"message": "", "locations": set()})
-        # Pattern: path:line: msg_id: msg (symbol)
-        pattern = re.compile(r"^(.*?):(\d+): (.*?): (.*)$")
+        """Parse pylint's JSON reporter output, or the legacy text template."""
+        lines = output.splitlines(keepends=True)
+        if any(line.lstrip().startswith("[") for line in lines):
+            return LinterResult.group(self._iter_json_diagnostics(lines))
+        return LinterResult.group(self._iter_text_diagnostics(lines))
 
-        for line in output.splitlines():
-            match = pattern.match(line)
+    def _iter_json_diagnostics(self, lines: Iterable[str]) -> Iterator[Diagnostic]:
+        for record in self._decoder.iter_array(lines):
+            diagnostic = self._from_record(record)
+            if diagnostic:
+                yield diagnostic
+
+    def _iter_text_diagnostics(self, lines: Iterable[str]) -> Iterator[Diagnostic]:
+        for line in lines:
+            match = _TEXT_MESSAGE.match(line.rstrip("\n"))
             if match:
                 # JUSTIFICATION: Regex match groups access is permitted for standard library utilities.
                 file_path, line_num, msg_id, message = match.groups()
-                location = f"{file_path}:{line_num}"
-
-                # JUSTIFICATION: Type casting is necessary due to defaultdict(dict) structure.
-                entry = collected[msg_id]
-                entry["message"] = message
-                # JUSTIFICATION: Type-safe access to the locations set.
-                locations_set = entry["locations"]
-                if isinstance(locations_set, set):
-                    locations_set.add(location)
-
-        results = []
-        for msg_id, data in collected.items():
-            # JUSTIFICATION: Converting set to sorted list for deterministic reporting.
-            locations_set = data["locations"]
-            sorted_locations = sorted(list(locations_set)) if isinstance(locations_set, set) else []
-            results.append(LinterResult(msg_id, str(data["message"]), sorted_locations))
-
-        return results
+                yield Diagnostic(msg_id, message, file_path, int(line_num))
+
+    def _from_record(self, record: dict[str, object]) -> Optional[Diagnostic]:
+        """Map one pylint JSON reporter record to a Diagnostic."""
+        msg_id = record.get("message-id")
+        if not msg_id:
+            return None
+        line = record.get("line")
+        column = record.get("column")
+        return Diagnostic(
+            str(msg_id),
+            f"{record.get('message', '')} ({record.get('symbol', '')})",
+            str(record.get("path", "")),
+            line if isinstance(line, int) else 0,
+            column if isinstance(column, int) else 0,
+            str(record.get("obj") or ""),
+        )
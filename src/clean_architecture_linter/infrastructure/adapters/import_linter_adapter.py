@@ -1,50 +1,46 @@
-import subprocess
-import os
+import shutil
 import sys
-from typing import List
-from clean_architecture_linter.domain.entities import LinterResult
+from typing import Callable, Iterable, Iterator, List, Optional
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
 from clean_architecture_linter.domain.protocols import LinterAdapterProtocol
+from clean_architecture_linter.infrastructure.adapters.process_stream import ProcessLineStream
 
 class ImportLinterAdapter(LinterAdapterProtocol):
     """Adapter for Import Linter output."""
 
-    def gather_results(self, target_path: str) -> List[LinterResult]:
+    def gather_results(
+        self, target_path: str, on_diagnostic: Optional[Callable[[Diagnostic], None]] = None
+    ) -> List[LinterResult]:
         """Run import-linter and gather results."""
-        # Note: import-linter usually looks for a configuration file (.importlinter or setup.cfg)
-        # It doesn't typically take a target path as a CLI arg in the same way,
-        # but we can try to run it.
         try:
-            # Try lint-imports first, then fallback to python -m
-            cmd = ["lint-imports"]
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-            except FileNotFoundError:
-                result = subprocess.run(
-                    [sys.executable, "-m", "importlinter", "lint"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-            return self._parse_output(result.stdout)
+            results: List[LinterResult] = []
+            for diagnostic in self.iter_diagnostics(target_path):
+                if on_diagnostic:
+                    on_diagnostic(diagnostic)
+                # Every broken import is its own result; they are not grouped by code.
+                results.append(LinterResult(diagnostic.code, diagnostic.message, [], [diagnostic]))
+            return results
         except Exception as e:
             return [LinterResult("IMPORT_LINTER_ERROR", str(e), [])]
 
+    def iter_diagnostics(self, target_path: str) -> Iterator[Diagnostic]:
+        """Run import-linter and yield contract violations as they are printed."""
+        # Note: import-linter usually looks for a configuration file (.importlinter or setup.cfg)
+        # It doesn't typically take a target path as a CLI arg in the same way,
+        # but we can try to run it.
+        # Try lint-imports first, then fallback to python -m
+        cmd = ["lint-imports"] if shutil.which("lint-imports") else [sys.executable, "-m", "importlinter", "lint"]
+        return self._iter_diagnostics(ProcessLineStream(cmd))
+
     def _parse_output(self, output: str) -> List[LinterResult]:
-        results = []
+        return [LinterResult(d.code, d.message, [], [d]) for d in self._iter_diagnostics(output.splitlines())]
+
+    def _iter_diagnostics(self, lines: Iterable[str]) -> Iterator[Diagnostic]:
         # Import Linter output is usually human-readable text describing contract failures.
         # This is a very basic parser for its "Broken contract" sections.
-        if "Broken contract" in output:
-            lines = output.splitlines()
-            current_contract: str = ""
-            for line in lines:
-                if "Broken contract" in line:
-                    current_contract = line.strip()
-                elif "is not allowed to import" in line:
-                    results.append(LinterResult("IL001", f"{current_contract}: {line.strip()}", []))
-
-        return results
+        current_contract: str = ""
+        for line in lines:
+            if "Broken contract" in line:
+                current_contract = line.strip()
+            elif current_contract and "is not allowed to import" in line:
+                yield Diagnostic("IL001", f"{current_contract}: {line.strip()}", "", 0)
@@ -0,0 +1,53 @@
+import json
+from typing import Dict, Iterable, Iterator
+
+
+class JsonStreamDecoder:
+    """Incremental decoder for the JSON shapes emitted by linters (arrays and JSON lines)."""
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+
+    def iter_array(self, lines: Iterable[str]) -> Iterator[Dict[str, object]]:
+        """
+        Yield the objects of a top-level JSON array one by one.
+        Anything printed before the array (e.g. plugin banners) is skipped.
+        """
+        buffer: str = ""
+        started: bool = False
+        for line in lines:
+            if not started:
+                stripped = line.lstrip()
+                if not stripped.startswith("["):
+                    continue
+                started = True
+                line = stripped[1:]
+            buffer += line
+            if "}" not in line and "]" not in line:
+                continue
+            while True:
+                buffer = buffer.lstrip().lstrip(",").lstrip()
+                if not buffer or buffer.startswith("]"):
+                    break
+                try:
+                    obj, end = self._decoder.raw_decode(buffer)
+                except ValueError:
+                    break  # Object not complete yet, wait for more lines
+                buffer = buffer[end:]
+                if isinstance(obj, dict):
+                    yield obj
+            if buffer.startswith("]"):
+                return
+
+    def iter_lines(self, lines: Iterable[str]) -> Iterator[Dict[str, object]]:
+        """Yield one object per JSON line, ignoring lines that are not JSON objects."""
+        for line in lines:
+            stripped = line.strip()
+            if not stripped.startswith("{"):
+                continue
+            try:
+                obj = json.loads(stripped)
+            except ValueError:
+                continue
+            if isinstance(obj, dict):
+                yield obj
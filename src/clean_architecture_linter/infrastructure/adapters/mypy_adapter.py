@@ -1,69 +1,147 @@
 import re
-import subprocess
 import os
 import sys
-from collections import defaultdict
-from typing import List, Dict, Set
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 from clean_architecture_linter.domain.protocols import LinterAdapterProtocol
-from clean_architecture_linter.domain.entities import LinterResult
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+from clean_architecture_linter.infrastructure.adapters.json_stream import JsonStreamDecoder
+from clean_architecture_linter.infrastructure.adapters.process_stream import ProcessLineStream
+
+# Text fallbacks for mypy versions without JSON output (< 1.11).
+# Pattern: file:line: error: message [code]
+_CODED_ERROR = re.compile(r"^(.*?):(\d+): error: (.*?)  \[(.*?)\]$")
+# Pattern: file:line: error: message
+_UNCODED_ERROR = re.compile(r"^(.*?):(\d+): error: (.*)$")
+
+# Kept next to the other Excelsior state so repeated audits are incremental.
+MYPY_CACHE_DIR: Path = Path(".excelsior") / "mypy_cache"
+DMYPY_STATUS_FILE: Path = Path(".excelsior") / "dmypy.json"
+MYPY_MODES: Tuple[str, ...] = ("subprocess", "api", "daemon")
+
+
+def _rejects_json_output(status: Optional[int], stderr: str) -> bool:
+    """Whether mypy stopped on a usage error about -O, as versions before 1.11 do."""
+    # Exit status 2 alone also covers fatal errors (bad target, broken config, crashed daemon).
+    return status == 2 and ("-O" in stderr or "unrecognized arguments" in stderr)
 
 class MypyAdapter(LinterAdapterProtocol):
-    """Adapter for mypy output."""
+    """
+    Adapter for mypy output.
+
+    Modes:
+    - subprocess: a fresh `python -m mypy` per audit (streams errors as they are printed).
+    - api: mypy.api.run in this process; skips interpreter start-up and mypy's imports.
+    - daemon: `dmypy run`, which keeps the type-checked program in memory between audits
+      and only re-checks changed modules and their dependents.
+    All modes share the incremental cache in .excelsior/mypy_cache.
+    """
 
-    def gather_results(self, target_path: str) -> List[LinterResult]:
+    def __init__(
+        self,
+        mode: str = "subprocess",
+        cache_dir: Optional[Path] = MYPY_CACHE_DIR,
+        status_file: Path = DMYPY_STATUS_FILE,
+    ) -> None:
+        if mode not in MYPY_MODES:
+            raise ValueError(f"Unknown mypy mode '{mode}'; expected one of {', '.join(MYPY_MODES)}")
+        self.mode = mode
+        self.cache_dir = cache_dir
+        self.status_file = status_file
+        self._decoder = JsonStreamDecoder()
+
+    def gather_results(
+        self, target_path: str, on_diagnostic: Optional[Callable[[Diagnostic], None]] = None
+    ) -> List[LinterResult]:
         """Run mypy and gather results."""
-        env = os.environ.copy()
         try:
-            result = subprocess.run(
-                [sys.executable, "-m", "mypy", target_path, "--strict"],
-                capture_output = True,
-                text = True,
-                check = False,
-                env=env,
-            )
-            return self._parse_output(result.stdout)
+            diagnostics: List[Diagnostic] = []
+            for diagnostic in self.iter_diagnostics(target_path):
+                if on_diagnostic:
+                    on_diagnostic(diagnostic)
+                diagnostics.append(diagnostic)
+            return LinterResult.group(diagnostics)
         except Exception as e:
             # JUSTIFICATION: Error message wrapping requires explicit list creation.
             return [LinterResult("MYPY_ERROR", str(e), [])]
 
+    def iter_diagnostics(self, target_path: str) -> Iterator[Diagnostic]:
+        """Run mypy and yield each error as soon as mypy reports it."""
+        if self.mode == "api":
+            return self._iter_api(target_path)
+        if self.mode == "daemon":
+            dmypy = [sys.executable, "-m", "mypy.dmypy", "--status-file", str(self.status_file), "run", "--"]
+            return self._iter_command(dmypy, target_path)
+        return self._iter_command([sys.executable, "-m", "mypy"], target_path)
+
+    def _mypy_args(self, target_path: str, json_output: bool = True) -> List[str]:
+        args = [target_path, "--strict"]
+        if self.cache_dir is not None:
+            args += ["--cache-dir", str(self.cache_dir)]
+        if json_output:
+            args += ["-O", "json"]
+        return args
+
+    def _iter_command(self, prefix: List[str], target_path: str) -> Iterator[Diagnostic]:
+        env = os.environ.copy()
+        stream = ProcessLineStream(prefix + self._mypy_args(target_path), env)
+        seen: bool = False
+        for diagnostic in self._iter_diagnostics(stream):
+            seen = True
+            yield diagnostic
+
+        if not seen and _rejects_json_output(stream.returncode, stream.stderr):
+            # Older mypy rejects the JSON output flag; fall back to text.
+            yield from self._iter_diagnostics(
+                ProcessLineStream(prefix + self._mypy_args(target_path, json_output=False), env)
+            )
+
+    def _iter_api(self, target_path: str) -> Iterator[Diagnostic]:
+        """Type-check through mypy's programmatic API; the report is available only once mypy finishes."""
+        from mypy import api
+
+        stdout, stderr, status = api.run(self._mypy_args(target_path))
+        if not stdout.strip() and _rejects_json_output(status, stderr):
+            stdout, _, status = api.run(self._mypy_args(target_path, json_output=False))
+        return self._iter_diagnostics(stdout.splitlines())
+
     def _parse_output(self, output: str) -> List[LinterResult]:
-        # Structure: {error_code: {"message": str, "locations": set}}
-        collected: Dict[str, Dict[str, object]] = defaultdict(lambda: {"message": "", "locations": set()})
+        return LinterResult.group(self._iter_diagnostics(output.splitlines()))
 
-        # Pattern: file:line: error: message [code]
-        pattern = re.compile(r"^(.*?):(\d+): error: (.*?)  \[(.*?)\]$")
+    def _iter_diagnostics(self, lines: Iterable[str]) -> Iterator[Diagnostic]:
+        """Decode JSON records, falling back to the text format line by line."""
+        for line in lines:
+            if line.lstrip().startswith("{"):
+                for record in self._decoder.iter_lines([line]):
+                    diagnostic = self._from_record(record)
+                    if diagnostic:
+                        yield diagnostic
+                continue
 
-        for line in output.splitlines():
-            match = pattern.match(line)
+            match = _CODED_ERROR.match(line)
             if match:
                 # JUSTIFICATION: Regex match groups access is permitted for standard library utilities.
                 file_path, line_num, message, error_code = match.groups()
-                location = f"{file_path}:{line_num}"
-
-                entry = collected[error_code]
-                entry["message"] = message
-                locations_set = entry["locations"]
-                if isinstance(locations_set, set):
-                    locations_set.add(location)
-            else:
-                # Fallback for lines without error codes
-                fallback_pattern = re.compile(r"^(.*?):(\d+): error: (.*)$")
-                fallback_match = fallback_pattern.match(line)
-                if fallback_match:
-                    # JUSTIFICATION: Regex match groups access is permitted for standard library utilities.
-                    file_path, line_num, message = fallback_match.groups()
-                    location = f"{file_path}:{line_num}"
-                    key: str = "MYPY"
-                    entry = collected[key]
-                    entry["message"] = message
-                    locations_set = entry["locations"]
-                    if isinstance(locations_set, set):
-                        locations_set.add(location)
-
-        results = []
-        for code, data in collected.items():
-            locations_set = data["locations"]
-            sorted_locations = sorted(list(locations_set)) if isinstance(locations_set, set) else []
-            results.append(LinterResult(code, str(data["message"]), sorted_locations))
-
-        return results
+                yield Diagnostic(error_code, message, file_path, int(line_num))
+                continue
+
+            # Fallback for lines without error codes
+            fallback_match = _UNCODED_ERROR.match(line)
+            if fallback_match:
+                # JUSTIFICATION: Regex match groups access is permitted for standard library utilities.
+                file_path, line_num, message = fallback_match.groups()
+                yield Diagnostic("MYPY", message, file_path, int(line_num))
+
+    def _from_record(self, record: dict[str, object]) -> Optional[Diagnostic]:
+        """Map one `mypy -O json` record to a Diagnostic (notes are skipped)."""
+        if record.get("severity") != "error":
+            return None
+        line = record.get("line")
+        column = record.get("column")
+        return Diagnostic(
+            str(record.get("code") or "MYPY"),
+            str(record.get("message", "")),
+            str(record.get("file", "")),
+            line if isinstance(line, int) else 0,
+            column if isinstance(column, int) else 0,
+        )
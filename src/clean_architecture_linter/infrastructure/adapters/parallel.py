@@ -0,0 +1,112 @@
+import os
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from clean_architecture_linter.domain.entities import Diagnostic
+
+if TYPE_CHECKING:
+    from clean_architecture_linter.config import PluginState
+
+# Rough peak RSS of one pylint+astroid worker on a large package.
+WORKER_MEMORY_BYTES: int = 512 * 1024 * 1024
+# Below this many files per worker, process start-up costs more than it saves.
+MIN_FILES_PER_WORKER: int = 20
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects affinity masks and cgroup-pinned containers)."""
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def available_memory() -> Optional[int]:
+    """Free physical memory in bytes, or None where the platform does not report it."""
+    try:
+        return int(os.sysconf("SC_AVPHYS_PAGES")) * int(os.sysconf("SC_PAGE_SIZE"))
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def default_workers(file_count: int) -> int:
+    """Worker count bounded by CPUs, free memory and the amount of work."""
+    workers = min(available_cpus(), max(1, file_count // MIN_FILES_PER_WORKER))
+    memory = available_memory()
+    if memory is not None:
+        workers = min(workers, max(1, memory // WORKER_MEMORY_BYTES))
+    return max(1, workers)
+
+
+def shard_by_package(files: List[str], shards: int) -> List[List[str]]:
+    """
+    Split files into at most `shards` groups without splitting a package.
+    Modules of one package mostly infer against each other, so keeping them together
+    lets each worker's astroid cache do the most good. Packages are placed largest
+    first on the lightest shard (by bytes), which is deterministic for a given tree.
+    """
+    packages: Dict[str, List[str]] = defaultdict(list)
+    for file_path in files:
+        packages[os.path.dirname(file_path)].append(file_path)
+
+    def weight(members: List[str]) -> int:
+        total = 0
+        for member in members:
+            try:
+                total += os.path.getsize(member)
+            except OSError:
+                pass
+        return max(total, 1)
+
+    ordered = sorted(packages.items(), key=lambda item: (-weight(item[1]), item[0]))
+    bins: List[Tuple[int, int, List[str]]] = [(0, index, []) for index in range(max(1, shards))]
+    for _, members in ordered:
+        load, index, shard = min(bins)
+        shard.extend(sorted(members))
+        bins[index] = (load + weight(members), index, shard)
+    return [sorted(shard) for _, _, shard in sorted(bins, key=lambda b: b[1]) if shard]
+
+
+def init_worker(state: Optional["PluginState"] = None) -> None:
+    """
+    Process-pool initializer: build the plugin's singletons once per worker.
+    Every shard a worker lints then reuses the loaded config, typeshed index and gateways.
+    The parent's PluginState, when given, replaces the worker's own pyproject.toml lookup.
+    """
+    # Imported here so the parent only pays for what it already loaded.
+    import pylint.lint  # noqa: F401  # pylint: disable=unused-import
+
+    from clean_architecture_linter.config import ConfigurationLoader
+    from clean_architecture_linter.di.container import ExcelsiorContainer
+
+    container = ExcelsiorContainer.get_instance()
+    container.mark_embedded()
+    container.get("AstroidGateway")
+    container.get("PythonGateway")
+    if state is not None:
+        ConfigurationLoader.install(state)
+    else:
+        ConfigurationLoader()
+
+
+def lint_shard(files: List[str]) -> Tuple[List[Diagnostic], Dict[str, List[str]], List[str]]:
+    """
+    Lint one shard in a worker; returns its diagnostics, each file's recorded dependencies
+    and the files whose inference ran over budget.
+    """
+    from clean_architecture_linter.di.container import ExcelsiorContainer
+    from clean_architecture_linter.infrastructure.adapters.excelsior_adapter import ExcelsiorAdapter
+
+    tracker = ExcelsiorContainer.get_instance().get("AstroidGateway")
+    tracker.reset_dependencies()
+    diagnostics = sorted(
+        ExcelsiorAdapter(in_process=True).lint(files),
+        key=lambda d: (d.path, d.line, d.column, d.code, d.message),
+    )
+    dependencies: Dict[str, List[str]] = {}
+    degraded: List[str] = []
+    for file_path in files:
+        found: Set[str] = tracker.dependencies_of(file_path)
+        dependencies[os.path.abspath(file_path)] = sorted(found)
+        if tracker.is_degraded(file_path):
+            degraded.append(os.path.abspath(file_path))
+    return diagnostics, dependencies, degraded
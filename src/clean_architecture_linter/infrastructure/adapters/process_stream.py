@@ -0,0 +1,41 @@
+import subprocess
+import tempfile
+from typing import Dict, Iterator, List, Optional
+
+
+class ProcessLineStream:
+    """
+    Run a command and expose its stdout as lines while the child is still running.
+    Once the lines are exhausted, returncode and stderr describe how the child ended.
+    """
+
+    def __init__(self, cmd: List[str], env: Optional[Dict[str, str]] = None) -> None:
+        self.cmd = cmd
+        self.env = env
+        self.returncode: Optional[int] = None
+        self.stderr: str = ""
+
+    def __iter__(self) -> Iterator[str]:
+        # stderr goes to a file rather than a pipe: interleaving it with a JSON stdout would
+        # corrupt the decode, and an undrained pipe could block the child.
+        with tempfile.TemporaryFile("w+", encoding="utf-8", errors="replace") as errors:
+            with subprocess.Popen(
+                self.cmd,
+                stdout=subprocess.PIPE,
+                stderr=errors,
+                text=True,
+                bufsize=1,
+                env=self.env,
+            ) as proc:
+                exhausted: bool = False
+                try:
+                    if proc.stdout is not None:
+                        yield from proc.stdout
+                    exhausted = True
+                finally:
+                    # Consumer stopped early: don't block on a child that is still writing.
+                    if not exhausted and proc.poll() is None:
+                        proc.kill()
+            self.returncode = proc.returncode
+            errors.seek(0)
+            self.stderr = errors.read()
@@ -0,0 +1,215 @@
+import dataclasses
+import hashlib
+import json
+import os
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from clean_architecture_linter.domain.entities import Diagnostic
+
+# Bump when the entry layout changes so old caches are ignored rather than misread.
+CACHE_FORMAT: int = 3
+DEFAULT_CACHE_DIR: Path = Path(".excelsior") / "cache"
+
+
+def plugin_version() -> str:
+    """Installed version of the plugin, or a marker when running from a source tree."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        return "unknown"
+    try:
+        return version("pylint-clean-architecture")
+    except PackageNotFoundError:
+        return "source"
+
+
+def pylint_settings() -> Dict[str, object]:
+    """
+    The pylint side of a run: the pylint and astroid versions and a digest of the
+    configuration file pylint would read (message control included). The file is hashed
+    as bytes, without registering the plugin or validating the options, so a
+    configuration pylint rejects changes the fingerprint instead of ending the run.
+    """
+    from astroid import __version__ as astroid_version
+    from pylint import __version__ as pylint_version
+    from pylint.config import find_default_config_files
+
+    config_file = next(iter(find_default_config_files()), None)
+    return {
+        "pylint": pylint_version,
+        "astroid": astroid_version,
+        "config_file": str(config_file) if config_file else None,
+        "config_digest": hashlib.sha256(Path(config_file).read_bytes()).hexdigest() if config_file else None,
+    }
+
+
+def config_fingerprint(
+    config: Mapping[str, object], version: Optional[str] = None, pylint: Optional[Mapping[str, object]] = None
+) -> str:
+    """
+    Digest of everything that shapes a set of results: the [tool.clean-arch] settings, the
+    plugin version and the pylint configuration and versions (see pylint_settings, read when not given).
+    """
+    payload = json.dumps(
+        {
+            "format": CACHE_FORMAT,
+            "version": version or plugin_version(),
+            "config": config,
+            "pylint": pylint if pylint is not None else pylint_settings(),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Per-file Excelsior results on disk, keyed by content hash and configuration fingerprint.
+
+    Each source file has one entry named after its path. Besides the diagnostics, an
+    entry records the content hash of every project file the analysis consulted
+    (inferred types, class hierarchies). An entry is reused only when the file itself,
+    the fingerprint and all of those dependencies are unchanged, and when none of its
+    dependencies is itself being re-analysed.
+
+    Entries are written to a temporary file and renamed into place, so concurrent
+    runs never observe a partially written entry; the last writer wins.
+    """
+
+    def __init__(self, fingerprint: str, root: Path = DEFAULT_CACHE_DIR) -> None:
+        self.fingerprint = fingerprint
+        self.root = root
+        self.hits: int = 0
+        self.misses: int = 0
+        # Content digests for the current run; a file edited mid-run keeps its first digest,
+        # so its stored entry is already stale on the next run.
+        self._digests: Dict[str, Optional[str]] = {}
+        # (mtime_ns, size) -> digest, kept across runs so a long-lived cache only
+        # re-hashes files whose stat changed.
+        self._stamps: Dict[str, Tuple[int, int, str]] = {}
+
+    def partition(self, files: Iterable[str]) -> Tuple[List[Diagnostic], List[str]]:
+        """
+        Split files into replayable diagnostics and the files that must be re-analysed.
+        Invalidation follows reverse dependencies to a fixpoint: a file is stale when it
+        changed, when a recorded dependency changed, or when a dependency is stale.
+        """
+        self._digests.clear()
+        paths = {os.path.abspath(f): f for f in files}
+        stale: Set[str] = set()
+        valid: Dict[str, Dict[str, object]] = {}
+        for path, file_path in paths.items():
+            entry = self._read_entry(file_path)
+            if entry is None or entry.get("key") != self._content_key(file_path) or self._deps_changed(entry):
+                stale.add(path)
+            else:
+                valid[path] = entry
+
+        dependents: Dict[str, Set[str]] = defaultdict(set)
+        for path, entry in valid.items():
+            for dependency in self._deps(entry):
+                dependents[dependency].add(path)
+        pending = list(stale)
+        while pending:
+            for dependent in dependents.pop(pending.pop(), ()):
+                if dependent not in stale:
+                    stale.add(dependent)
+                    pending.append(dependent)
+
+        replayed: List[Diagnostic] = []
+        for path in sorted(valid.keys() - stale):
+            records = valid[path].get("diagnostics", [])
+            if isinstance(records, list):
+                replayed.extend(Diagnostic(**record) for record in records)
+        self.hits += len(paths) - len(stale)
+        self.misses += len(stale)
+        return replayed, [f for path, f in paths.items() if path in stale]
+
+    def lookup(self, file_path: str) -> Optional[List[Diagnostic]]:
+        """Cached diagnostics for a single unchanged file, or None when it must be re-analysed."""
+        replayed, stale = self.partition([file_path])
+        return None if stale else replayed
+
+    def store(self, file_path: str, diagnostics: List[Diagnostic], dependencies: Iterable[str] = ()) -> None:
+        """Record the diagnostics found for a file and the project files its analysis consulted."""
+        key = self._content_key(file_path)
+        if key is None:
+            return
+        entry = {
+            "key": key,
+            "path": file_path,
+            "deps": {dep: self._digest(dep) for dep in sorted(dependencies)},
+            "diagnostics": [dataclasses.asdict(d) for d in diagnostics],
+        }
+        self._write_atomic(self._entry_path(file_path), json.dumps(entry))
+
+    def _deps(self, entry: Mapping[str, object]) -> List[str]:
+        deps = entry.get("deps", {})
+        return list(deps) if isinstance(deps, dict) else []
+
+    def _deps_changed(self, entry: Mapping[str, object]) -> bool:
+        deps = entry.get("deps", {})
+        if not isinstance(deps, dict):
+            return True
+        return any(self._digest(dep) != digest for dep, digest in deps.items())
+
+    def _digest(self, file_path: str) -> Optional[str]:
+        path = os.path.abspath(file_path)
+        if path not in self._digests:
+            self._digests[path] = self._hash_file(path)
+        return self._digests[path]
+
+    def _hash_file(self, path: str) -> Optional[str]:
+        try:
+            stat = os.stat(path)
+            stamp = self._stamps.get(path)
+            if stamp and stamp[:2] == (stat.st_mtime_ns, stat.st_size):
+                return stamp[2]
+            digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            # Deleted dependencies hash to None and therefore never match a stored digest.
+            self._stamps.pop(path, None)
+            return None
+        self._stamps[path] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def _content_key(self, file_path: str) -> Optional[str]:
+        digest = self._digest(file_path)
+        if digest is None:
+            return None
+        return hashlib.sha256(f"{self.fingerprint}:{digest}".encode("ascii")).hexdigest()
+
+    def _entry_path(self, file_path: str) -> Path:
+        name = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()
+        # Fan out over sub-directories to keep directory listings short on large trees.
+        return self.root / name[:2] / f"{name}.json"
+
+    def _read_entry(self, file_path: str) -> Optional[Dict[str, object]]:
+        try:
+            with self._entry_path(file_path).open(encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if isinstance(entry, dict) else None
+
+    def _write_atomic(self, target: Path, content: str) -> None:
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-", suffix=".json")
+        except OSError:
+            # A read-only checkout simply runs uncached.
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            # JUSTIFICATION: os.replace is atomic on POSIX and Windows for same-directory renames.
+            os.replace(tmp_name, target)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
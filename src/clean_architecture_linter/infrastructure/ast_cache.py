@@ -0,0 +1,200 @@
+"""Opt-in on-disk cache of built astroid modules for the standard library and stub files."""
+
+import contextlib
+import functools
+import gc
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import sysconfig
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, Optional, Tuple
+
+import astroid  # type: ignore[import-untyped]
+import dill  # type: ignore[import-untyped]
+from astroid import util  # type: ignore[import-untyped]
+from astroid.manager import AstroidManager  # type: ignore[import-untyped]
+
+AST_CACHE_DIR: Path = Path(".excelsior") / "ast_cache"
+
+# Persistent ids for objects that must stay singletons across a pickle round trip.
+_UNINFERABLE = "uninferable"
+
+
+class _ForeignNode(Exception):
+    """A module references a node of another module; storing it would copy that module."""
+
+
+class _ModulePickler(dill.Pickler):  # type: ignore[misc]
+    def __init__(self, file: BinaryIO, module: astroid.nodes.Module) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._module = module
+
+    def persistent_id(self, obj: object) -> Optional[str]:
+        if isinstance(obj, util.UninferableBase):
+            return _UNINFERABLE
+        if isinstance(obj, astroid.nodes.NodeNG):
+            root = obj.root()
+            # Nodes brain extensions parse from strings hang off a nameless scratch module; they are copied.
+            if root is not self._module and getattr(root, "name", ""):
+                raise _ForeignNode(root.name)
+        return None
+
+
+class _ModuleUnpickler(dill.Unpickler):  # type: ignore[misc]
+    def persistent_load(self, pid: object) -> object:
+        if pid == _UNINFERABLE:
+            # Looked up at load time: pylint -j workers receive this module's globals as copies.
+            return util.Uninferable
+        raise pickle.UnpicklingError(f"unknown persistent id {pid!r}")
+
+
+@contextlib.contextmanager
+def _collector_paused() -> Iterator[None]:
+    """(Un)pickling a tree allocates thousands of linked objects; collections midway only cost time."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class AstCache:
+    """
+    Built astroid modules for stdlib files and `.pyi` stubs, pickled under a directory.
+
+    Installed as a wrapper around the manager's `ast_from_file`, so a module is read
+    from disk only when astroid first asks for it. Entries are keyed by the Python and
+    astroid versions, the registered transforms, the module name and the file's content
+    hash (and path): an upgrade or an edited stub is simply a miss. Modules are stored straight
+    after they are built, before inference has attached anything from other modules.
+    """
+
+    def __init__(self, directory: Path = AST_CACHE_DIR) -> None:
+        self.directory = directory
+        self._original: Optional[Callable[..., astroid.nodes.Module]] = None
+        stdlib_dirs = {sysconfig.get_path("stdlib"), sysconfig.get_path("platstdlib")}
+        self._stdlib = tuple(os.path.join(os.path.abspath(p), "") for p in stdlib_dirs)
+        # Computed on first use, once every plugin has registered its transforms.
+        self._environment: Optional[str] = None
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stored: int = 0
+
+    def install(self) -> None:
+        """Route the manager's file builds through the cache; idempotent."""
+        if self._original is not None:
+            return
+        # Patched on the class: astroid creates fresh AstroidManager() instances (they share
+        # their caches, not their attributes), e.g. when resolving imports during inference.
+        self._original = AstroidManager.ast_from_file
+        original = self._original
+
+        @functools.wraps(original)
+        def ast_from_file(manager: AstroidManager, *args: object, **kwargs: object) -> astroid.nodes.Module:
+            return self._ast_from_file(manager, original, *args, **kwargs)
+
+        AstroidManager.ast_from_file = ast_from_file
+
+    def uninstall(self) -> None:
+        """Restore the manager's own ast_from_file."""
+        if self._original is not None:
+            AstroidManager.ast_from_file = self._original
+            self._original = None
+
+    def cacheable(self, path: str) -> bool:
+        """Stub files anywhere, and stdlib sources outside site-packages."""
+        if path.endswith(".pyi"):
+            return True
+        path = os.path.abspath(path)
+        if "site-packages" in path or "dist-packages" in path:
+            return False
+        return path.endswith(".py") and path.startswith(self._stdlib)
+
+    def _ast_from_file(
+        self,
+        manager: AstroidManager,
+        original: Callable[..., astroid.nodes.Module],
+        filepath: str,
+        modname: Optional[str] = None,
+        fallback: bool = True,
+        source: bool = False,
+    ) -> astroid.nodes.Module:
+        """The manager's ast_from_file, answered from disk for cacheable files."""
+        cached = manager.astroid_cache.get(modname) if modname else None
+        if not modname or not self.cacheable(filepath) or (cached is not None and cached.file == filepath):
+            return original(manager, filepath, modname, fallback, source)
+        try:
+            entry = self._entry(manager, filepath, modname)
+        except OSError:
+            return original(manager, filepath, modname, fallback, source)
+        module = self._load(entry)
+        if module is not None:
+            self.hits += 1
+            manager.cache_module(module)
+            return module
+        self.misses += 1
+        module = original(manager, filepath, modname, fallback, source)
+        if module.file == filepath:
+            self._store(entry, module)
+        return module
+
+    def _entry(self, manager: AstroidManager, filepath: str, modname: str) -> Path:
+        with open(filepath, "rb") as f:
+            content = hashlib.sha1(f.read()).hexdigest()
+        key_parts = (self._environment_key(manager), os.path.abspath(filepath), modname, content)
+        return self.directory / f"{hashlib.sha1(chr(0).join(key_parts).encode('utf-8')).hexdigest()}.pickle"
+
+    def _environment_key(self, manager: AstroidManager) -> str:
+        if self._environment is None:
+            # JUSTIFICATION: astroid exposes no public view of the registered transforms.
+            visitor = manager._transform  # pylint: disable=protected-access,clean-arch-visibility
+            transforms = sorted(
+                f"{getattr(function, '__module__', '')}.{getattr(function, '__qualname__', repr(function))}"
+                for registered in visitor.transforms.values()
+                for function, _ in registered
+            )
+            parts = [sys.version, astroid.__version__, str(manager.prefer_stubs), *transforms]
+            self._environment = hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+        return self._environment
+
+    def _load(self, entry: Path) -> Optional[astroid.nodes.Module]:
+        try:
+            with entry.open("rb") as f, _collector_paused():
+                unpickler = _ModuleUnpickler(f)
+                module = unpickler.load()
+        except FileNotFoundError:
+            return None
+        except Exception as e:  # A truncated or incompatible entry is a miss.
+            logging.debug("Ignoring unreadable AST cache entry %s: %s", entry, e)
+            return None
+        return module if isinstance(module, astroid.nodes.Module) else None
+
+    def _store(self, entry: Path, module: astroid.nodes.Module) -> None:
+        try:
+            directory = entry.parent
+            directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".pickle")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f, _collector_paused():
+                pickler = _ModulePickler(f, module)
+                pickler.dump(module)
+            os.replace(tmp_name, entry)
+            self.stored += 1
+        except (_ForeignNode, RecursionError, pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            logging.debug("Not caching the AST of %s: %s", module.name, e)
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+    def stats(self) -> Tuple[int, int, int]:
+        """(hits, misses, stored) since the cache was created."""
+        return self.hits, self.misses, self.stored
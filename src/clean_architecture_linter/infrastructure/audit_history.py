@@ -0,0 +1,274 @@
+"""SQLite store of past audits behind `excelsior check --history` and `excelsior history`."""
+
+import sqlite3
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Type
+
+if TYPE_CHECKING:
+    from clean_architecture_linter.domain.entities import LinterResult
+
+HISTORY_PATH: Path = Path(".excelsior") / "history.sqlite3"
+# Stored in PRAGMA user_version; bump when the schema changes. Version 1 stores are migrated on open.
+SCHEMA_VERSION: int = 2
+
+_SCHEMA: str = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    target TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    failed TEXT
+);
+CREATE TABLE IF NOT EXISTS rules (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    code TEXT NOT NULL,
+    message TEXT NOT NULL DEFAULT '',
+    UNIQUE (category, code)
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS locations (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    rule_id INTEGER NOT NULL REFERENCES rules (id),
+    file_id INTEGER REFERENCES files (id),
+    line INTEGER
+);
+CREATE INDEX IF NOT EXISTS locations_by_run ON locations (run_id, rule_id, file_id);
+CREATE INDEX IF NOT EXISTS locations_by_rule ON locations (rule_id, run_id, file_id);
+CREATE INDEX IF NOT EXISTS locations_by_file ON locations (file_id, run_id);
+CREATE TABLE IF NOT EXISTS run_rule_counts (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    rule_id INTEGER NOT NULL REFERENCES rules (id),
+    violations INTEGER NOT NULL,
+    PRIMARY KEY (run_id, rule_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS run_rule_counts_by_rule ON run_rule_counts (rule_id, run_id);
+"""
+
+
+# Version 1 had no runs.failed and required a file for every violation.
+_MIGRATE_FROM_V1: str = """
+ALTER TABLE runs ADD COLUMN failed TEXT;
+CREATE TABLE locations_v2 (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    rule_id INTEGER NOT NULL REFERENCES rules (id),
+    file_id INTEGER REFERENCES files (id),
+    line INTEGER
+);
+INSERT INTO locations_v2 SELECT run_id, rule_id, file_id, line FROM locations;
+DROP TABLE locations;
+ALTER TABLE locations_v2 RENAME TO locations;
+"""
+
+
+def _split_location(location: str) -> Tuple[str, Optional[int]]:
+    path, _, line = location.rpartition(":")
+    if path and line.isdigit():
+        return path, int(line)
+    return location, None
+
+
+class AuditHistory:
+    """
+    Every recorded audit, one row per violation.
+
+    Rule and file names are interned so a location row is four integers (file and
+    line are NULL for project-wide findings such as import contracts), and each
+    finished run gets per-rule totals in run_rule_counts, so trend queries read a
+    few rows per run instead of every location. A run becomes visible to queries
+    only once it is finished; an interrupted check leaves no partial run behind.
+    A run in which a tool failed names the failed categories in runs.failed, so its
+    missing violations do not read as a clean result.
+    """
+
+    def __init__(self, path: Path = HISTORY_PATH) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, 1, SCHEMA_VERSION):
+            self._conn.close()
+            raise sqlite3.DatabaseError(
+                f"{path} was written by an incompatible Excelsior (schema {version}, expected {SCHEMA_VERSION})"
+            )
+        if version == 1:
+            self._conn.executescript(_MIGRATE_FROM_V1)
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._rule_ids: Dict[Tuple[str, str], int] = {}
+        self._file_ids: Dict[str, int] = {}
+
+    def __enter__(self) -> "AuditHistory":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the database; an unfinished run is rolled back."""
+        self._conn.rollback()
+        self._conn.close()
+
+    def begin_run(self, target: str, started_at: Optional[float] = None) -> int:
+        """Open a run; its rows are committed together by finish_run()."""
+        cursor = self._conn.execute(
+            "INSERT INTO runs (target, started_at) VALUES (?, ?)",
+            (target, time.time() if started_at is None else started_at),
+        )
+        return int(cursor.lastrowid or 0)
+
+    def record_results(self, run_id: int, category: str, results: Iterable["LinterResult"]) -> None:
+        """Add one tool's grouped results to an open run: a row per diagnostic, or the failure of the tool."""
+        for result in results:
+            if result.code.endswith("_ERROR"):
+                self._conn.execute(
+                    "UPDATE runs SET failed = COALESCE(failed || ',', '') || ? WHERE id = ?", (category, run_id)
+                )
+                continue
+            rule_id = self._rule_id(category, result.code, result.message)
+            rows: List[Tuple[int, int, Optional[int], Optional[int]]] = []
+            for diagnostic in result.diagnostics:
+                if diagnostic.path:
+                    rows.append((run_id, rule_id, self._file_id(diagnostic.path), diagnostic.line))
+                else:
+                    rows.append((run_id, rule_id, None, None))
+            if not result.diagnostics:
+                # Results carrying only locations; a project-wide one without any still counts once.
+                for location in result.locations:
+                    path, line = _split_location(location)
+                    rows.append((run_id, rule_id, self._file_id(path), line))
+                if not rows:
+                    rows.append((run_id, rule_id, None, None))
+            self._conn.executemany(
+                "INSERT INTO locations (run_id, rule_id, file_id, line) VALUES (?, ?, ?, ?)", rows
+            )
+
+    def finish_run(self, run_id: int) -> None:
+        """Store the run's per-rule totals and commit it."""
+        self._conn.execute(
+            "INSERT INTO run_rule_counts (run_id, rule_id, violations) "
+            "SELECT run_id, rule_id, COUNT(*) FROM locations WHERE run_id = ? GROUP BY rule_id",
+            (run_id,),
+        )
+        self._conn.execute("UPDATE runs SET finished_at = ? WHERE id = ?", (time.time(), run_id))
+        self._conn.commit()
+
+    def prune(self, keep: int) -> int:
+        """Delete all but the newest `keep` runs; returns how many were removed."""
+        cursor = self._conn.execute(
+            "DELETE FROM runs WHERE id NOT IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)", (keep,)
+        )
+        self._conn.commit()
+        return cursor.rowcount
+
+    def runs(self, limit: int = 20) -> List[Dict[str, object]]:
+        """The newest finished runs, oldest first, with violation totals per category and any failed tools."""
+        recent = self._conn.execute(
+            "SELECT id, target, started_at, failed FROM runs WHERE finished_at IS NOT NULL ORDER BY id DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        rows: List[Dict[str, object]] = []
+        for run_id, target, started_at, failed in reversed(recent):
+            row: Dict[str, object] = {"run": run_id, "target": target, "started_at": started_at, "failed": failed or ""}
+            for category, violations in self._conn.execute(
+                "SELECT rules.category, SUM(c.violations) FROM run_rule_counts AS c "
+                "JOIN rules ON rules.id = c.rule_id WHERE c.run_id = ? GROUP BY rules.category",
+                (run_id,),
+            ):
+                row[category] = violations
+            rows.append(row)
+        return rows
+
+    def rule_trend(self, code: str, limit: int = 20) -> List[Dict[str, object]]:
+        """Occurrences of one rule in each of the newest finished runs, oldest first."""
+        recent = self._conn.execute(
+            "SELECT runs.id, runs.started_at, "
+            "  (SELECT COALESCE(SUM(c.violations), 0) FROM run_rule_counts AS c "
+            "   JOIN rules ON rules.id = c.rule_id WHERE c.run_id = runs.id AND rules.code = ?) "
+            "FROM runs WHERE finished_at IS NOT NULL ORDER BY runs.id DESC LIMIT ?",
+            (code, limit),
+        ).fetchall()
+        return [
+            {"run": run_id, "started_at": started_at, "violations": violations}
+            for run_id, started_at, violations in reversed(recent)
+        ]
+
+    def top_files(self, code: Optional[str] = None, limit: int = 10) -> List[Dict[str, object]]:
+        """Files with the most violations in the latest run, optionally for one rule."""
+        run_id = self.latest_run()
+        if run_id is None:
+            return []
+        query = (
+            "SELECT files.path, COUNT(*) AS violations FROM locations "
+            "JOIN files ON files.id = locations.file_id "
+            "JOIN rules ON rules.id = locations.rule_id "
+            "WHERE locations.run_id = ?"
+        )
+        params: List[object] = [run_id]
+        if code:
+            query += " AND rules.code = ?"
+            params.append(code)
+        query += " GROUP BY locations.file_id ORDER BY violations DESC, files.path LIMIT ?"
+        params.append(limit)
+        return [{"path": path, "violations": count} for path, count in self._conn.execute(query, params)]
+
+    def regressions(self, code: Optional[str] = None, limit: int = 20) -> List[Dict[str, object]]:
+        """Files with more violations in the latest run than in the one before, worst first."""
+        recent = [row[0] for row in self._conn.execute(
+            "SELECT id FROM runs WHERE finished_at IS NOT NULL ORDER BY id DESC LIMIT 2"
+        )]
+        if len(recent) < 2:
+            return []
+        latest, previous = recent
+        rule_filter = " AND rule_id IN (SELECT id FROM rules WHERE code = ?)" if code else ""
+        per_file = f"SELECT file_id, COUNT(*) AS n FROM locations WHERE run_id = ?{rule_filter} GROUP BY file_id"
+        params: List[object] = [latest] + ([code] if code else []) + [previous] + ([code] if code else [])
+        params.append(limit)
+        rows = self._conn.execute(
+            f"SELECT files.path, COALESCE(old.n, 0), new.n FROM ({per_file}) AS new "
+            f"LEFT JOIN ({per_file}) AS old ON old.file_id = new.file_id "
+            "JOIN files ON files.id = new.file_id "
+            "WHERE new.n > COALESCE(old.n, 0) "
+            "ORDER BY new.n - COALESCE(old.n, 0) DESC, files.path LIMIT ?",
+            params,
+        )
+        return [{"path": path, "before": before, "after": after} for path, before, after in rows]
+
+    def latest_run(self) -> Optional[int]:
+        """Id of the newest finished run, or None when nothing has been recorded."""
+        row = self._conn.execute("SELECT MAX(id) FROM runs WHERE finished_at IS NOT NULL").fetchone()
+        return None if row is None or row[0] is None else int(row[0])
+
+    def _rule_id(self, category: str, code: str, message: str) -> int:
+        key = (category, code)
+        if key not in self._rule_ids:
+            self._conn.execute(
+                "INSERT INTO rules (category, code, message) VALUES (?, ?, ?) "
+                "ON CONFLICT (category, code) DO UPDATE SET message = excluded.message",
+                (category, code, message),
+            )
+            row = self._conn.execute(
+                "SELECT id FROM rules WHERE category = ? AND code = ?", (category, code)
+            ).fetchone()
+            self._rule_ids[key] = int(row[0])
+        return self._rule_ids[key]
+
+    def _file_id(self, path: str) -> int:
+        if path not in self._file_ids:
+            self._conn.execute("INSERT OR IGNORE INTO files (path) VALUES (?)", (path,))
+            row = self._conn.execute("SELECT id FROM files WHERE path = ?", (path,)).fetchone()
+            self._file_ids[path] = int(row[0])
+        return self._file_ids[path]
@@ -0,0 +1,207 @@
+"""Streaming NDJSON audit trail written by `excelsior check` and read back by `excelsior fix`."""
+
+import gzip
+import json
+import lzma
+import os
+import tempfile
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import IO, TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Type
+
+if TYPE_CHECKING:
+    from clean_architecture_linter.domain.entities import LinterResult
+
+# 3.1.0: violation records carry either diagnostics or locations, no longer both.
+AUDIT_FORMAT_VERSION: str = "3.1.0"
+AUDIT_DIR: Path = Path(".excelsior")
+AUDIT_BASENAME: str = "last_audit.ndjson"
+# Written by 2.x releases as one indented JSON document; still read when no NDJSON trail exists.
+LEGACY_AUDIT_NAME: str = "last_audit.json"
+AUDIT_COMPRESSIONS: Dict[str, str] = {"none": "", "gzip": ".gz", "lzma": ".xz"}
+
+
+def audit_trail_path(compression: str = "none", directory: Path = AUDIT_DIR) -> Path:
+    """Where the audit trail goes for a compression scheme (the suffix selects the codec)."""
+    if compression not in AUDIT_COMPRESSIONS:
+        raise ValueError(f"unknown audit compression {compression!r}; expected one of {sorted(AUDIT_COMPRESSIONS)}")
+    return directory / f"{AUDIT_BASENAME}{AUDIT_COMPRESSIONS[compression]}"
+
+
+def _open_text(path: Path, mode: str) -> IO[str]:
+    if path.name.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if path.name.endswith(".xz"):
+        return lzma.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _locations(diagnostics: Iterable[Dict[str, object]]) -> List[str]:
+    """The 'path:line' locations of serialized diagnostics, as LinterResult.group derives them."""
+    return sorted({f"{d['path']}:{d.get('line', 0)}" for d in diagnostics if isinstance(d, dict) and d.get("path")})
+
+
+class AuditTrailWriter:
+    """
+    Writes the audit trail one JSON record per line, a tool at a time as soon as that tool finishes.
+
+    The trail is a header record, one "violation" record per grouped result (its
+    diagnostics, or its locations when it has no diagnostics to derive them from) and a
+    closing "summary" record, so neither side ever holds the whole audit as one
+    document. It is written to a temporary file and renamed into place on close;
+    an interrupted run leaves the previous trail untouched.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.counts: Dict[str, int] = {}
+        self._stream: Optional[IO[str]] = None
+        self._tmp_name: Optional[str] = None
+
+    def __enter__(self) -> "AuditTrailWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_name = tempfile.mkstemp(dir=self.path.parent, prefix=".tmp-", suffix=self.path.name)
+        os.close(fd)
+        self._stream = _open_text(Path(self._tmp_name), "w")
+        self._write({"type": "header", "version": AUDIT_FORMAT_VERSION, "timestamp": time.time()})
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
+
+    def write_results(self, category: str, results: Iterable["LinterResult"]) -> None:
+        """Append one record per grouped result of a tool, with its per-location diagnostics."""
+        count = self.counts.setdefault(category, 0)
+        for result in results:
+            record: Dict[str, object] = {
+                "type": "violation",
+                "category": category,
+                "code": result.code,
+                "message": result.message,
+            }
+            diagnostics = [diagnostic.to_dict() for diagnostic in result.diagnostics]
+            if diagnostics:
+                record["diagnostics"] = diagnostics
+            # Readers derive locations from the diagnostics; they are written only when they add something.
+            if list(result.locations) != _locations(diagnostics):
+                record["locations"] = list(result.locations)
+            self._write(record)
+            count += 1
+        self.counts[category] = count
+
+    def write_summary(self, timings: Optional[Dict[str, float]] = None) -> None:
+        """Append the closing record: violation counts and wall time (seconds) per tool."""
+        self._write({
+            "type": "summary",
+            "summary": dict(self.counts),
+            "timings": {key: round(seconds, 3) for key, seconds in (timings or {}).items()},
+        })
+
+    def close(self) -> None:
+        """Finish the trail and move it into place, replacing trails in any other compression."""
+        if self._stream is None or self._tmp_name is None:
+            return
+        self._stream.close()
+        self._stream = None
+        os.replace(self._tmp_name, self.path)
+        self._tmp_name = None
+        for suffix in AUDIT_COMPRESSIONS.values():
+            sibling = self.path.parent / f"{AUDIT_BASENAME}{suffix}"
+            if sibling != self.path:
+                try:
+                    sibling.unlink()
+                except OSError:
+                    pass
+
+    def _discard(self) -> None:
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+        if self._tmp_name is not None:
+            try:
+                os.unlink(self._tmp_name)
+            except OSError:
+                pass
+            self._tmp_name = None
+
+    def _write(self, record: Dict[str, object]) -> None:
+        if self._stream is None:
+            raise ValueError("audit trail is not open")
+        self._stream.write(json.dumps(record) + "\n")
+
+
+def find_audit_trail(directory: Path = AUDIT_DIR) -> Optional[Path]:
+    """The current audit trail in whichever compression it was written, or None."""
+    for compression in AUDIT_COMPRESSIONS:
+        path = audit_trail_path(compression, directory)
+        if path.exists():
+            return path
+    return None
+
+
+def iter_audit_records(path: Path) -> Iterator[Dict[str, object]]:
+    """
+    Yield the records of an audit trail lazily; every violation record has its "locations".
+    A truncated or corrupt tail ends the iteration instead of failing the caller.
+    """
+    try:
+        with _open_text(path, "r") as stream:
+            for line in stream:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    continue
+                diagnostics = record.get("diagnostics")
+                if record.get("type") == "violation" and "locations" not in record:
+                    record["locations"] = _locations(diagnostics) if isinstance(diagnostics, list) else []
+                yield record
+    except (OSError, EOFError, lzma.LZMAError, ValueError):
+        return
+
+
+def iter_legacy_records(path: Path) -> Iterator[Dict[str, object]]:
+    """Present a 2.x `last_audit.json` document as the same records the NDJSON trail holds."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            audit_data = json.load(f)
+    except (OSError, ValueError):
+        return
+    violations = audit_data.get("violations", {}) if isinstance(audit_data, dict) else {}
+    if not isinstance(violations, dict):
+        return
+    for category, items in violations.items():
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+            locations: List[str] = item.get("locations") or []
+            location = item.get("location")
+            if not locations and isinstance(location, str) and location != "N/A":
+                locations = [loc.strip() for loc in location.split(",") if loc.strip()]
+            yield {
+                "type": "violation",
+                "category": category,
+                "code": item.get("code", ""),
+                "message": item.get("message", ""),
+                "locations": locations,
+            }
+
+
+def load_audit_records(directory: Path = AUDIT_DIR) -> Optional[Iterator[Dict[str, object]]]:
+    """Lazy records of the latest audit, falling back to a legacy JSON trail; None if there is none."""
+    path = find_audit_trail(directory)
+    if path is not None:
+        return iter_audit_records(path)
+    legacy = directory / LEGACY_AUDIT_NAME
+    if legacy.exists():
+        return iter_legacy_records(legacy)
+    return None
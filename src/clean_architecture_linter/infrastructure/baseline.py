@@ -0,0 +1,148 @@
+"""Fingerprinted violation baselines for `excelsior check --baseline`."""
+
+import dataclasses
+import hashlib
+import linecache
+import os
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+
+BASELINE_HEADER: str = "# excelsior baseline v1: <fingerprint>.<occurrence> <rule> <path>"
+
+
+def _portable_path(path: str) -> str:
+    if not path:
+        return ""
+    try:
+        path = os.path.relpath(os.path.abspath(path))
+    except ValueError:
+        # Another drive on Windows; keep the path as reported.
+        pass
+    return Path(path).as_posix()
+
+
+def compute_fingerprint(diagnostic: Diagnostic) -> str:
+    """
+    Digest of rule, path, enclosing symbol and the whitespace-normalised source line.
+    The line number is left out, so edits elsewhere in the file do not change it.
+    """
+    if diagnostic.path and diagnostic.line > 0:
+        linecache.checkcache(diagnostic.path)
+        snippet = " ".join(linecache.getline(diagnostic.path, diagnostic.line).split())
+    else:
+        # Project-wide findings (import contracts) have no source line; their message identifies them.
+        snippet = diagnostic.message
+    payload = "\0".join((diagnostic.code, _portable_path(diagnostic.path), diagnostic.symbol, snippet))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def with_fingerprint(diagnostic: Diagnostic) -> Diagnostic:
+    """The diagnostic with its fingerprint filled in (reused when it already carries one)."""
+    if diagnostic.fingerprint:
+        return diagnostic
+    return dataclasses.replace(diagnostic, fingerprint=compute_fingerprint(diagnostic))
+
+
+def fingerprint_keys(diagnostics: Iterable[Diagnostic]) -> List[Tuple[str, Diagnostic]]:
+    """
+    Baseline keys in source order: the fingerprint plus its occurrence number, so
+    identical lines (say, two `a.b.c()` calls in one function) stay distinct.
+    """
+    ordered = sorted(diagnostics, key=lambda d: (d.path, d.line, d.column, d.code))
+    seen: Counter[str] = Counter()
+    keys: List[Tuple[str, Diagnostic]] = []
+    for diagnostic in ordered:
+        diagnostic = with_fingerprint(diagnostic)
+        seen[diagnostic.fingerprint] += 1
+        keys.append((f"{diagnostic.fingerprint}.{seen[diagnostic.fingerprint]}", diagnostic))
+    return keys
+
+
+class Baseline:
+    """
+    Known violations, one key per line in a plain text file meant to be committed.
+
+    Lookups are a set membership test per violation. The baseline only ratchets
+    down on its own: entries for fixed violations are dropped, new violations are
+    added only when it is rewritten explicitly.
+    """
+
+    def __init__(self, entries: Optional[Dict[str, Tuple[str, str]]] = None) -> None:
+        # key -> (rule, path); rule and path keep the file reviewable and scope the ratchet.
+        self.entries: Dict[str, Tuple[str, str]] = dict(entries or {})
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.entries
+
+    @classmethod
+    def load(cls, path: Path) -> "Baseline":
+        """Read a baseline file; raises OSError when it does not exist."""
+        entries: Dict[str, Tuple[str, str]] = {}
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line or line.startswith("#"):
+                    continue
+                key, _, rest = line.partition(" ")
+                code, _, file_path = rest.partition(" ")
+                entries[key] = (code, file_path)
+        return cls(entries)
+
+    def save(self, path: Path) -> None:
+        """Write the baseline sorted by path, atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [BASELINE_HEADER]
+        for key, (code, file_path) in sorted(self.entries.items(), key=lambda item: (item[1][1], item[1][0], item[0])):
+            lines.append(f"{key} {code} {file_path}")
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".baseline")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            os.replace(tmp_name, path)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+
+    def add(self, results: Iterable[LinterResult]) -> None:
+        """Accept every violation in results as known."""
+        for key, diagnostic in fingerprint_keys(d for r in results for d in r.diagnostics):
+            self.entries[key] = (diagnostic.code, _portable_path(diagnostic.path))
+
+    def partition(self, results: List[LinterResult]) -> Tuple[List[LinterResult], int, Set[str]]:
+        """
+        Split one tool's results into (new results, number of known violations, keys seen).
+        Results without diagnostics, such as tool errors, are always reported. Project-wide
+        findings (import contracts, no path) stay one result each, as their adapter reports them.
+        """
+        passthrough = [r for r in results if not r.diagnostics]
+        new: List[Diagnostic] = []
+        seen: Set[str] = set()
+        for key, diagnostic in fingerprint_keys(d for r in results for d in r.diagnostics):
+            if key in self.entries:
+                seen.add(key)
+            else:
+                new.append(diagnostic)
+        project_wide = [LinterResult(d.code, d.message, [], [d]) for d in new if not d.path]
+        return LinterResult.group(d for d in new if d.path) + project_wide + passthrough, len(seen), seen
+
+    def ratchet(self, seen: Set[str], scope: str) -> int:
+        """Forget entries under scope that were not seen in a complete run; returns how many."""
+        prefix = _portable_path(scope).rstrip("/")
+        fixed = [
+            key for key, (_, file_path) in self.entries.items()
+            if key not in seen
+            and (not file_path or prefix == "." or file_path == prefix or file_path.startswith(prefix + "/"))
+        ]
+        for key in fixed:
+            del self.entries[key]
+        return len(fixed)
@@ -0,0 +1,236 @@
+"""Long-lived analysis server behind `excelsior serve`."""
+
+import dataclasses
+import functools
+import importlib
+import json
+import os
+import socket
+import socketserver
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import astroid  # type: ignore[import-untyped]
+
+from clean_architecture_linter.domain.entities import Diagnostic
+from clean_architecture_linter.domain.protocols import DependencyTrackerProtocol
+from clean_architecture_linter.infrastructure.adapters.daemon_adapter import DaemonClient
+from clean_architecture_linter.infrastructure.adapters.excelsior_adapter import ExcelsiorAdapter
+from clean_architecture_linter.infrastructure.adapters.result_cache import ResultCache
+
+
+def evict_modules(paths: Set[str]) -> int:
+    """
+    Drop the given source files, and any module whose file has disappeared, from
+    astroid's in-memory cache so the next inference re-parses them.
+    Returns the number of modules evicted.
+    """
+    manager = astroid.MANAGER
+    evicted = 0
+    for name, module in list(manager.astroid_cache.items()):
+        file_path = getattr(module, "file", None)
+        if not file_path:
+            continue
+        path = os.path.abspath(file_path)
+        if path in paths or not os.path.exists(path):
+            del manager.astroid_cache[name]
+            evicted += 1
+    if evicted:
+        _clear_inference_caches()
+    return evicted
+
+
+# The lru caches AstroidManager.clear_cache() resets, as (module, attribute path). Their
+# names move between astroid releases, so each one is looked up rather than imported.
+_ASTROID_LRU_CACHES: Tuple[Tuple[str, str], ...] = (
+    ("astroid.nodes._base_nodes", "LookupMixIn.lookup"),
+    ("astroid.modutils", "_cache_normalize_path_"),
+    ("astroid.modutils", "_has_init"),
+    ("astroid.modutils", "cached_os_path_isfile"),
+    ("astroid.interpreter._import.util", "is_namespace"),
+    ("astroid.interpreter.objectmodel", "ObjectModel.attributes"),
+    ("astroid.nodes.scoped_nodes", "ClassDef._metaclass_lookup_attribute"),
+    ("astroid.interpreter._import.spec", "_find_spec"),
+    ("astroid.interpreter._import.spec", "_is_setuptools_namespace"),
+)
+
+
+def _lookup(module_name: str, attribute_path: str) -> Optional[object]:
+    """An attribute of an astroid module, or None when this astroid version lacks it."""
+    try:
+        target: object = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    for name in attribute_path.split("."):
+        target = getattr(target, name, None)
+        if target is None:
+            return None
+    return target
+
+
+@functools.lru_cache(maxsize=None)
+def _cache_clearers() -> Optional[Tuple[Callable[[], None], ...]]:
+    """
+    Everything AstroidManager.clear_cache() resets except the parsed modules and the
+    registered transforms, or None when any of it is missing from this astroid version.
+    """
+    clearers: List[Callable[[], None]] = []
+    for module_name, attribute_path in (
+        ("astroid.inference_tip", "clear_inference_tip_cache"),
+        ("astroid.context", "_invalidate_cache"),
+    ):
+        clear = _lookup(module_name, attribute_path)
+        if not callable(clear):
+            return None
+        clearers.append(clear)
+    for module_name, attribute_path in _ASTROID_LRU_CACHES:
+        clear = getattr(_lookup(module_name, attribute_path), "cache_clear", None)
+        if clear is None:
+            return None
+        clearers.append(clear)
+    # Per-finder caches of import failures, e.g. for a module created after a failed import.
+    finders = _lookup("astroid.interpreter._import.spec", "_SPEC_FINDERS")
+    for finder in finders if isinstance(finders, (list, tuple)) else ():
+        clear = getattr(getattr(finder, "find_module", None), "cache_clear", None)
+        if clear is None:
+            return None
+        clearers.append(clear)
+    mod_file_cache = getattr(astroid.MANAGER, "_mod_file_cache", None)
+    if finders is None or not isinstance(mod_file_cache, dict):
+        return None
+    # Module name -> file resolution, including cached import failures for files that now exist.
+    clearers.append(mod_file_cache.clear)
+    return tuple(clearers)
+
+
+def _clear_inference_caches() -> None:
+    """Forget inference and import-resolution results that may point into evicted modules."""
+    # JUSTIFICATION: astroid exposes no public per-module invalidation; these are the
+    # caches AstroidManager.clear_cache() resets, minus the parsed modules we keep.
+    clearers = _cache_clearers()
+    if clearers is None:
+        # An astroid whose caches we do not know: start over rather than serve stale answers.
+        astroid.MANAGER.clear_cache()
+        return
+    for clear in clearers:
+        clear()
+
+
+class EvictingResultCache(ResultCache):
+    """ResultCache whose stale files are also evicted from the warm astroid manager."""
+
+    def partition(self, files: Iterable[str]) -> Tuple[List[Diagnostic], List[str]]:
+        replayed, stale = super().partition(files)
+        evict_modules({os.path.abspath(f) for f in stale})
+        return replayed, stale
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """One JSON request per connection; replies are streamed back as JSON lines."""
+
+    server: "AnalysisServer"
+
+    def handle(self) -> None:
+        def send(reply: Dict[str, object]) -> None:
+            self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+        try:
+            request = json.loads(self.rfile.readline())
+            if not isinstance(request, dict):
+                raise ValueError("request must be a JSON object")
+            self.server.dispatch(request, send)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away; nothing left to answer.
+            pass
+        except Exception as e:
+            send({"error": str(e)})
+
+
+class AnalysisServer(socketserver.UnixStreamServer):
+    """
+    Keeps pylint, astroid, the gateways and the configuration loaded between checks.
+    Requests are served one at a time: pylint and the astroid manager are not thread-safe.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        cache: ResultCache,
+        dependency_tracker: Optional[DependencyTrackerProtocol] = None,
+    ) -> None:
+        self.socket_path = socket_path
+        self.cache = cache
+        self.adapter = ExcelsiorAdapter(in_process=True, cache=cache, dependency_tracker=dependency_tracker)
+        self.requests_served: int = 0
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def dispatch(self, request: Dict[str, object], send: Callable[[Dict[str, object]], None]) -> None:
+        """Answer one decoded request."""
+        command = request.get("command")
+        if command == "ping":
+            send({"ok": True, "pid": os.getpid(), "requests": self.requests_served})
+        elif command == "shutdown":
+            send({"ok": True})
+            # shutdown() blocks until serve_forever() returns, so it cannot run on this thread.
+            threading.Thread(target=self.shutdown, daemon=True).start()
+        elif command == "check":
+            self._check(request, send)
+        else:
+            send({"error": f"unknown command: {command!r}"})
+
+    def _check(self, request: Dict[str, object], send: Callable[[Dict[str, object]], None]) -> None:
+        paths = request.get("paths")
+        if not isinstance(paths, list) or not paths:
+            send({"error": "check needs a non-empty 'paths' list"})
+            return
+        cwd = str(request.get("cwd") or os.getcwd())
+        hits, misses = self.cache.hits, self.cache.misses
+        count = 0
+        for path in paths:
+            for diagnostic in self.adapter.iter_diagnostics(str(path)):
+                relative = os.path.relpath(os.path.abspath(diagnostic.path), cwd) if diagnostic.path else ""
+                # Fingerprints embed the path as seen from the daemon; a client elsewhere recomputes them.
+                fingerprint = diagnostic.fingerprint if cwd == os.getcwd() else ""
+                reply = dataclasses.replace(diagnostic, path=relative, fingerprint=fingerprint)
+                send({"diagnostic": dataclasses.asdict(reply)})
+                count += 1
+        self.requests_served += 1
+        send({
+            "done": True,
+            "diagnostics": count,
+            "reused": self.cache.hits - hits,
+            "analysed": self.cache.misses - misses,
+        })
+
+
+def serve(
+    socket_path: Path,
+    cache: ResultCache,
+    dependency_tracker: Optional[DependencyTrackerProtocol] = None,
+    on_ready: Optional[Callable[[AnalysisServer], None]] = None,
+) -> None:
+    """Run the analysis server until it is asked to shut down or interrupted."""
+    if not hasattr(socket, "AF_UNIX"):
+        raise OSError("excelsior serve needs Unix domain sockets, which this platform does not provide")
+    if socket_path.exists():
+        if DaemonClient(socket_path).ping():
+            raise OSError(f"an excelsior daemon is already listening on {socket_path}")
+        # Left behind by a daemon that did not exit cleanly.
+        socket_path.unlink()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+    server = AnalysisServer(socket_path, cache, dependency_tracker)
+    try:
+        if on_ready:
+            on_ready(server)
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            socket_path.unlink()
+        except OSError:
+            pass
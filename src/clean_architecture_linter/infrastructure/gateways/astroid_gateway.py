@@ -1,19 +1,442 @@
-from typing import Optional, Set, List, Union
+import functools
+import os
+import time
+from collections import defaultdict
+from typing import (
+    Callable, Dict, FrozenSet, Hashable, Iterable, Iterator, Optional, Set, List, Tuple, TypeVar, Union, cast
+)
 import astroid # type: ignore[import-untyped]
+from astroid.context import InferenceContext  # type: ignore[import-untyped]
+from clean_architecture_linter.config import ConfigurationLoader, InferenceBudget
 from clean_architecture_linter.domain.protocols import AstroidProtocol
+from clean_architecture_linter.infrastructure.symbol_index import SymbolIndex
 from clean_architecture_linter.infrastructure.typeshed_integration import TypeshedService
 
+T = TypeVar("T")
+N = TypeVar("N", bound=Hashable)
+
+# Module prefixes whose methods are trusted not to expose internals.
+_AUTHORITIES = ("builtins.", "typing.", "collections.", "pathlib.", "re.", "json.", "datetime.", "abc.", "os.")
+
+
+def _module_file(node: astroid.nodes.NodeNG) -> Optional[str]:
+    """Absolute path of the file defining node, if it came from one."""
+    try:
+        file_path = node.root().file
+    except AttributeError:
+        return None
+    return os.path.abspath(file_path) if file_path else None
+
+
+def _attributed(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Mark a public query as an analysis entry point.
+    Dependencies noted while it runs, including in nested queries on nodes from other
+    modules, are charged to the module of the node the checker asked about.
+    """
+    @functools.wraps(method)
+    def wrapper(self: "AstroidGateway", node: astroid.nodes.NodeNG, *args: object, **kwargs: object) -> T:
+        if self._analysed is not None:
+            return method(self, node, *args, **kwargs)
+        self._analysed = _module_file(node)
+        try:
+            return method(self, node, *args, **kwargs)
+        finally:
+            self._analysed = None
+    return wrapper
+
+
+def _memoized(method: Callable[..., T]) -> Callable[..., T]:
+    """
+    Cache a public query per node until clear_memo() (called from the checkers' leave_module).
+    Only plain `query(node)` calls are cached; a caller-supplied `visited` set can make the
+    answer depend on the path taken to the node.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: "AstroidGateway", node: astroid.nodes.NodeNG, *args: object, **kwargs: object) -> T:
+        if args or kwargs:
+            return method(self, node, *args, **kwargs)
+        key = (name, id(node))
+        entry = self._memo.get(key)
+        # The entry holds the node, so its id cannot be reused by another node while cached.
+        if entry is not None and entry[0] is node:
+            self.memo_hits += 1
+            return cast(T, entry[1])
+        self.memo_misses += 1
+        result = method(self, node)
+        self._memo[key] = (node, result)
+        return result
+    return wrapper
+
+
+def _chained_call(node: astroid.nodes.Call) -> Optional[astroid.nodes.Call]:
+    """The call that node is a method call on, as `a()` in `a().b()`."""
+    func = node.func
+    if isinstance(func, astroid.nodes.Attribute) and isinstance(func.expr, astroid.nodes.Call):
+        return func.expr
+    return None
+
+
+def _same_type(receiver_qname: str, return_qname: Optional[str]) -> bool:
+    """Whether a call returns its receiver's type, tolerating differently qualified names."""
+    if not return_qname:
+        return False
+    # Direct match or structural match (e.g. both are 'DataFrame')
+    if receiver_qname == return_qname:
+        return True
+    # Check base names if qnames are messy (e.g. '.DataFrame' vs 'pyspark.sql.DataFrame')
+    rec_base: str = receiver_qname.split(".")[-1]
+    ret_base: str = return_qname.split(".")[-1]
+    return rec_base == ret_base and rec_base != "NoneType"
+
+
+def _annotation_key(anno: astroid.nodes.NodeNG) -> Tuple[str, Tuple[object, ...]]:
+    """
+    The annotation's source, with the definitions each name in it is bound to and, for
+    `Self`, the enclosing class; annotations with equal keys resolve to the same type.
+    """
+    bindings: List[object] = []
+    for name in anno.nodes_of_class(astroid.nodes.Name):
+        _scope, assignments = name.lookup(name.name)
+        bindings.append(tuple(assignments))
+    source = anno.as_string()
+    if "Self" in source:
+        scope = anno.scope()
+        while scope is not None and not isinstance(scope, astroid.nodes.ClassDef):
+            scope = scope.parent.scope() if scope.parent is not None else None
+        bindings.append(scope)
+    return source, tuple(bindings)
+
+
+# A summarised return value: its type, or the unannotated function whose result it is.
+_Term = Union[str, astroid.nodes.FunctionDef]
+
+# Return values whose type is known without inference.
+_LITERAL_TYPES = (
+    (astroid.nodes.List, "builtins.list"),
+    (astroid.nodes.Tuple, "builtins.tuple"),
+    (astroid.nodes.Set, "builtins.set"),
+    (astroid.nodes.Dict, "builtins.dict"),
+)
+
+
+def _falls_through(body: List[astroid.nodes.NodeNG]) -> bool:
+    """Whether control may reach the end of a block, returning None implicitly from a function."""
+    if not body:
+        return True
+    last = body[-1]
+    if isinstance(last, (astroid.nodes.Return, astroid.nodes.Raise)):
+        return False
+    if isinstance(last, astroid.nodes.If):
+        return _falls_through(last.body) or _falls_through(last.orelse)
+    if isinstance(last, astroid.nodes.With):
+        return _falls_through(last.body)
+    # Loops, try blocks and match statements are not followed.
+    return True
+
+
+def _strongly_connected(root: N, successors: Callable[[N], Iterable[N]]) -> List[List[N]]:
+    """
+    Strongly connected components reachable from root, callees before callers
+    (Tarjan's algorithm, with an explicit stack so deep call graphs do not recurse).
+    """
+    index: Dict[N, int] = {root: 0}
+    low: Dict[N, int] = {root: 0}
+    stack: List[N] = [root]
+    on_stack: Set[N] = {root}
+    components: List[List[N]] = []
+    work: List[Tuple[N, Iterator[N]]] = [(root, iter(successors(root)))]
+    while work:
+        node, children = work[-1]
+        for child in children:
+            if child not in index:
+                index[child] = low[child] = len(index)
+                stack.append(child)
+                on_stack.add(child)
+                work.append((child, iter(successors(child))))
+                break
+            if child in on_stack:
+                low[node] = min(low[node], index[child])
+        else:
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                component: List[N] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member is node:
+                        break
+                components.append(component)
+    return components
+
+
+class InferenceBudgetExceeded(astroid.InferenceError):  # type: ignore[misc]
+    """Inference was cut short by the InferenceBudget; callers fall back as for any failed inference."""
+
+
+class _ModuleBudget:
+    """Inference spent on one checked module, against its InferenceBudget."""
+
+    def __init__(self, limits: InferenceBudget) -> None:
+        self.limits = limits
+        self.steps: int = 0
+        self.seconds: float = 0.0
+        # Nodes whose own budget ran out; and, once the module's ran out, why.
+        self.cut_nodes: int = 0
+        self.exhausted: Optional[str] = None
+
+    def overrun(self, steps: int, seconds: float) -> Optional[str]:
+        """Why inference of a node that has used steps and seconds so far must stop, if it must."""
+        limits = self.limits
+        if limits.module_steps and self.steps + steps > limits.module_steps:
+            self.exhausted = f"module over {limits.module_steps} inference steps"
+        elif limits.module_ms and (self.seconds + seconds) * 1000 > limits.module_ms:
+            self.exhausted = f"module over {limits.module_ms} ms of inference"
+        if self.exhausted:
+            return self.exhausted
+        if (limits.node_steps and steps > limits.node_steps) or (limits.node_ms and seconds * 1000 > limits.node_ms):
+            return f"node over {self.node_limits()}"
+        return None
+
+    def node_limits(self) -> str:
+        """The per-node limits in force, as 'N steps or M ms'."""
+        limits = [f"{self.limits.node_steps} steps" if self.limits.node_steps else ""]
+        limits.append(f"{self.limits.node_ms} ms" if self.limits.node_ms else "")
+        return " or ".join(limit for limit in limits if limit)
+
+    def charge(self, steps: int, seconds: float) -> None:
+        """Add a finished inference to the module's spending; a spent budget stops the next one."""
+        self.steps += steps
+        self.seconds += seconds
+        limits = self.limits
+        if self.exhausted:
+            return
+        if limits.module_steps and self.steps >= limits.module_steps:
+            self.exhausted = f"module over {limits.module_steps} inference steps"
+        elif limits.module_ms and self.seconds * 1000 >= limits.module_ms:
+            self.exhausted = f"module over {limits.module_ms} ms of inference"
+
+    def summary(self) -> Optional[str]:
+        """What was cut short, for the degraded-module message; None when nothing was."""
+        parts: List[str] = []
+        if self.cut_nodes:
+            parts.append(f"{self.cut_nodes} node(s) over {self.node_limits()}")
+        if self.exhausted:
+            parts.append(self.exhausted)
+        return "; ".join(parts) or None
+
+
+class _StepCounter(list):  # type: ignore[type-arg]
+    """
+    The nodes_inferred cell an InferenceContext shares with its clones. astroid bumps it
+    for every value inferred along the way, so the budget is checked inside the inference.
+    """
+
+    def __init__(self, budget: _ModuleBudget) -> None:
+        super().__init__([0])
+        self.budget = budget
+        # Time spent in earlier resumptions of the inference, and when the current one began.
+        self.seconds: float = 0.0
+        self.started: float = time.perf_counter()
+        self.overrun: Optional[str] = None
+
+    def __setitem__(self, index: int, value: int) -> None:  # type: ignore[override]
+        super().__setitem__(index, value)
+        if self.overrun is None:
+            self.overrun = self.budget.overrun(value, self.seconds + time.perf_counter() - self.started)
+        if self.overrun is not None:
+            raise InferenceBudgetExceeded(self.overrun)
+
 
 class AstroidGateway(AstroidProtocol):
     """AST Intelligence Gateway for true inference and discovery."""
 
-    def __init__(self) -> None:
+    def __init__(self, symbols: Optional[SymbolIndex] = None) -> None:
         # Enable preferring stubs
         astroid.MANAGER.prefer_stubs = True
         # Clear cache to ensure stubs are loaded if they exist
         astroid.MANAGER.clear_cache()
         self.typeshed = TypeshedService()
-
+        # Module file -> other source files consulted while analysing it.
+        self._dependencies: Dict[str, Set[str]] = defaultdict(set)
+        self._analysed: Optional[str] = None
+        # (query, id(node)) -> (node, answer) for the module being checked.
+        self._memo: Dict[Tuple[str, int], Tuple[astroid.nodes.NodeNG, object]] = {}
+        self.memo_hits: int = 0
+        self.memo_misses: int = 0
+        # Class and method lookups by qualified name; loaded from .excelsior/ when the CLI persists it.
+        self.symbols: SymbolIndex = symbols if symbols is not None else SymbolIndex()
+        # Open file sets collecting every module consulted while a lookup is being indexed.
+        self._recorders: List[Set[str]] = []
+        # Unannotated function -> (summarised return type, files it was derived from), for the whole run.
+        self._summaries: Dict[astroid.nodes.FunctionDef, Tuple[Optional[str], FrozenSet[str]]] = {}
+        # Inference spent on the module being checked (see InferenceBudget); it is released
+        # when inference moves on to another module, keeping only why a degraded one was cut short.
+        self._budget_key: Optional[str] = None
+        self._budget: Optional[_ModuleBudget] = None
+        self._degraded: Dict[str, str] = {}
+        self.budget_trips: int = 0
+        # Calls into astroid inference made through _infer, for the counters below.
+        self.inference_calls: int = 0
+        # (annotation source, what its names are bound to) -> (qname, files consulted, inferences it took),
+        # for the module being checked.
+        self._annotations: Dict[Tuple[str, Tuple[object, ...]], Tuple[Optional[str], FrozenSet[str], int]] = {}
+        self.annotation_hits: int = 0
+        self.annotation_misses: int = 0
+        self.annotation_inferences_saved: int = 0
+
+    def clear_memo(self) -> None:
+        """Drop the answers cached for the current module; the hit/miss counters keep running."""
+        self._memo.clear()
+        self._annotations.clear()
+
+    def memo_stats(self) -> Dict[str, int]:
+        """Memoization counters, for profiling."""
+        return {"hits": self.memo_hits, "misses": self.memo_misses, "cached": len(self._memo)}
+
+    def annotation_stats(self) -> Dict[str, int]:
+        """Annotation cache counters, including the inference calls its hits avoided, for profiling."""
+        return {
+            "hits": self.annotation_hits,
+            "misses": self.annotation_misses,
+            "cached": len(self._annotations),
+            "inferences_saved": self.annotation_inferences_saved,
+        }
+
+    def dependencies_of(self, file_path: str) -> Set[str]:
+        """
+        Source files the verdicts for the given module may depend on: the modules it
+        imports (inference only crosses modules along imports) plus every file whose
+        definitions were consulted while analysing it.
+        """
+        path = os.path.abspath(file_path)
+        return self._imported_files(path) | self._dependencies.get(path, set())
+
+    def reset_dependencies(self) -> None:
+        """Forget recorded dependencies, and indexed symbols that went stale, before a fresh analysis run."""
+        self._dependencies.clear()
+        self.symbols.refresh()
+        self._summaries.clear()
+        self._budget_key, self._budget = None, None
+        self._degraded.clear()
+
+    def inference_degradation(self, module: astroid.nodes.Module) -> Optional[str]:
+        """Why inference in module was cut short during this run, if it was."""
+        return self._degradation_of(_module_file(module) or "")
+
+    def is_degraded(self, file_path: str) -> bool:
+        """Whether inference in the file was cut short during this run, making its results load-dependent."""
+        return self._degradation_of(os.path.abspath(file_path)) is not None
+
+    def _degradation_of(self, key: str) -> Optional[str]:
+        if key == self._budget_key and self._budget is not None:
+            return self._budget.summary()
+        return self._degraded.get(key)
+
+    def _note_dependency(self, context: astroid.nodes.NodeNG, target: astroid.nodes.NodeNG) -> None:
+        """Record that the module under analysis depends on the module defining `target`."""
+        source = self._analysed or _module_file(context)
+        origin = _module_file(target)
+        if origin:
+            for files in self._recorders:
+                files.add(origin)
+        if source and origin and source != origin:
+            self._dependencies[source].add(origin)
+
+    def _note_dependency_files(self, context: astroid.nodes.NodeNG, files: FrozenSet[str]) -> None:
+        """Replay the dependencies recorded with an indexed or cached answer."""
+        source = self._analysed or _module_file(context)
+        for origin in files:
+            for recording in self._recorders:
+                recording.add(origin)
+            if source and source != origin:
+                self._dependencies[source].add(origin)
+
+    def _imported_files(self, path: str) -> Set[str]:
+        """Files of the modules imported by the (already parsed) module at path."""
+        try:
+            module = astroid.MANAGER.ast_from_file(path)
+        except (astroid.AstroidBuildingError, SyntaxError):
+            return set()
+        files: Set[str] = set()
+        for node in module.nodes_of_class((astroid.nodes.Import, astroid.nodes.ImportFrom)):
+            if isinstance(node, astroid.nodes.ImportFrom):
+                # `from pkg import sub` may name a submodule rather than an attribute of pkg.
+                candidates = [node.modname] + [f"{node.modname}.{name}" for name, _ in node.names if name != "*"]
+            else:
+                candidates = [name for name, _ in node.names]
+            for candidate in candidates:
+                try:
+                    imported = node.do_import_module(candidate)
+                except (astroid.AstroidBuildingError, astroid.InferenceError):
+                    continue
+                origin = _module_file(imported)
+                if origin and origin != path:
+                    files.add(origin)
+        return files
+
+    def infer(self, node: astroid.nodes.NodeNG) -> Iterator[astroid.nodes.NodeNG]:
+        """node.infer() for the checkers, within the same budget as the gateway's own queries."""
+        return self._infer(node)
+
+    def _module_budget(self, node: astroid.nodes.NodeNG) -> _ModuleBudget:
+        key = self._analysed or _module_file(node) or ""
+        if self._budget is None or key != self._budget_key:
+            if self._budget_key is not None and self._budget is not None:
+                summary = self._budget.summary()
+                if summary:
+                    self._degraded[self._budget_key] = summary
+            self._budget_key, self._budget = key, _ModuleBudget(ConfigurationLoader().inference_budget)
+        return self._budget
+
+    def _infer(self, node: astroid.nodes.NodeNG) -> Iterator[astroid.nodes.NodeNG]:
+        """
+        node.infer() within the checked module's inference budget, recording the modules
+        the inferred values come from. Once a budget is spent it raises InferenceBudgetExceeded;
+        after the module's own runs out, every further inference in it fails straight away.
+        """
+        budget = self._module_budget(node)
+        if budget.exhausted:
+            self.budget_trips += 1
+            raise InferenceBudgetExceeded(budget.exhausted)
+        self.inference_calls += 1
+        counter = _StepCounter(budget)
+        values = iter(node.infer(context=InferenceContext(nodes_inferred=counter)))
+        # astroid counts a value only once it is asked for the next one; callers often stop early.
+        yielded = 0
+        try:
+            while True:
+                # Only time spent inferring counts, not the caller's work between values.
+                counter.started = time.perf_counter()
+                try:
+                    inferred = next(values)
+                except StopIteration:
+                    return
+                finally:
+                    counter.seconds += time.perf_counter() - counter.started
+                # astroid may have swallowed the exception raised from the counter.
+                if counter.overrun is not None:
+                    raise InferenceBudgetExceeded(counter.overrun)
+                if inferred is not astroid.Uninferable:
+                    self._note_dependency(node, inferred)
+                yielded += 1
+                yield inferred
+        except InferenceBudgetExceeded:
+            self.budget_trips += 1
+            if not budget.exhausted:
+                budget.cut_nodes += 1
+            raise
+        finally:
+            budget.charge(max(counter[0], yielded), counter.seconds)
+
+    @_memoized
+    @_attributed
     def get_node_return_type_qname(self, node: astroid.nodes.NodeNG) -> Optional[str]:
         """Dynamically discovers fully qualified names using AST inference and signature hints."""
         # 1. Sticker Reading (Explicit Annotations / Casts)
@@ -29,7 +452,7 @@ class AstroidGateway(AstroidProtocol):
 
         # 3. Direct Inference (True Inference)
         try:
-            for inf in node.infer():
+            for inf in self._infer(node):
                 if inf is not astroid.Uninferable:
                     qname = str(inf.qname())
                     normalized = self._normalize_primitive(qname)
@@ -130,6 +553,8 @@ class AstroidGateway(AstroidProtocol):
                   return "builtins.str" # Propagate safety
 
         return None
+    @_memoized
+    @_attributed
     def get_return_type_qname_from_expr(self, expr: astroid.nodes.NodeNG, visited: Optional[Set[int]] = None) -> Optional[str]:
         """Recursive resolution for complex expressions."""
         if expr is None:
@@ -156,7 +581,7 @@ class AstroidGateway(AstroidProtocol):
     def _is_typing_cast(self, node: astroid.nodes.Call) -> bool:
         """Check if call is typing.cast."""
         try:
-            for inf in node.func.infer():
+            for inf in self._infer(node.func):
                 if getattr(inf, "qname", lambda: "")() == "typing.cast":
                     return True
         except (astroid.InferenceError, AttributeError):
@@ -187,11 +612,13 @@ class AstroidGateway(AstroidProtocol):
         # 1. Try to infer the target directly
         try:
             # JUSTIFICATION: Core AST inference logic.
-            for inf in node.func.infer():
+            for inf in self._infer(node.func):
                 if isinstance(inf, astroid.nodes.ClassDef):
                     return str(inf.qname())
-                if isinstance(inf, astroid.nodes.FunctionDef) and inf.returns:
-                    return self._resolve_annotation(inf.returns)
+                if isinstance(inf, astroid.nodes.FunctionDef):
+                    res = self._function_return(inf, node)
+                    if res:
+                        return res
         except (astroid.InferenceError, StopIteration):
             pass
 
@@ -202,6 +629,140 @@ class AstroidGateway(AstroidProtocol):
                 return self._find_method_in_class_hierarchy(receiver_type, node.func.attrname, node)
         return None
 
+    def _function_return(self, function: astroid.nodes.FunctionDef, context: astroid.nodes.NodeNG) -> Optional[str]:
+        """Declared return type, or the summarised one for an unannotated function."""
+        if function.returns:
+            return self._resolve_annotation(function.returns)
+        return self._return_summary(function, context)
+
+    def _return_summary(self, function: astroid.nodes.FunctionDef, context: astroid.nodes.NodeNG) -> Optional[str]:
+        """
+        Return type of an unannotated function whose every return is simple: a literal,
+        a class instantiation, or a call to another such function or an annotated one.
+        Summaries are computed bottom-up over the call graph, one strongly connected
+        component at a time, the first time any function in it is asked about.
+        """
+        if function in self._summaries:
+            qname, files = self._summaries[function]
+        else:
+            known, trips = len(self._summaries), self.budget_trips
+            self._summarise(function)
+            qname, files = self._summaries[function]
+            if self.budget_trips != trips:
+                # Summaries cut short by the inference budget are not reused by other modules.
+                for stale in list(self._summaries)[known:]:
+                    del self._summaries[stale]
+        self._note_dependency_files(context, files)
+        return qname
+
+    def _summarise(self, root: astroid.nodes.FunctionDef) -> None:
+        """Summarise root and every unsummarised function its returns depend on."""
+        terms: Dict[astroid.nodes.FunctionDef, Optional[List[_Term]]] = {}
+        # Files consulted while reading each function's returns, including its own.
+        deps: Dict[astroid.nodes.FunctionDef, Set[str]] = {}
+
+        def callees(function: astroid.nodes.FunctionDef) -> List[astroid.nodes.FunctionDef]:
+            files: Set[str] = set()
+            self._recorders.append(files)
+            try:
+                terms[function] = self._return_terms(function)
+            finally:
+                self._recorders.pop()
+            own_file = _module_file(function)
+            if own_file:
+                files.add(own_file)
+            deps[function] = files
+            return [t for t in terms[function] or [] if not isinstance(t, str) and t not in self._summaries]
+
+        for component in _strongly_connected(root, callees):
+            files: Set[str] = set()
+            for function in component:
+                files |= deps[function]
+            # Optimistic fixpoint: a call back into the component contributes nothing until
+            # that member has a type. Types only go from unset to set to conflicting (None).
+            unset = object()
+            current: Dict[astroid.nodes.FunctionDef, object] = {function: unset for function in component}
+            changed = True
+            while changed:
+                changed = False
+                for function in component:
+                    value = self._combine(terms[function], current, files, unset)
+                    if value != current[function]:
+                        current[function] = value
+                        changed = True
+            for function in component:
+                value = current[function]
+                self._summaries[function] = (value if isinstance(value, str) else None, frozenset(files))
+
+    def _combine(
+        self,
+        terms: Optional[List[_Term]],
+        current: Dict[astroid.nodes.FunctionDef, object],
+        files: Set[str],
+        unset: object,
+    ) -> object:
+        """The single type all return terms agree on, unset while undecided, else None."""
+        if not terms:
+            return None
+        result: object = unset
+        for term in terms:
+            if isinstance(term, str):
+                value: object = term
+            elif term in current:
+                value = current[term]
+                if value is unset:
+                    continue
+            else:
+                value, callee_files = self._summaries[term]
+                files |= callee_files
+            if value is None or (result is not unset and value != result):
+                return None
+            result = value
+        return result
+
+    def _return_terms(self, function: astroid.nodes.FunctionDef) -> Optional[List[_Term]]:
+        """
+        Each return value of function as a type qname, or as the unannotated function whose
+        result it returns; None when the function does not qualify or any return is not simple.
+        """
+        if function.decorators or function.is_generator() or isinstance(function, astroid.nodes.AsyncFunctionDef):
+            return None
+        returns = list(function.nodes_of_class(
+            astroid.nodes.Return, skip_klass=(astroid.nodes.FunctionDef, astroid.nodes.ClassDef, astroid.nodes.Lambda)
+        ))
+        # No return at all is as likely an abstract stub as a procedure.
+        if not returns:
+            return None
+        terms: List[_Term] = ["builtins.NoneType"] if _falls_through(function.body) else []
+        for ret in returns:
+            term = self._return_term(ret.value)
+            if term is None:
+                return None
+            terms.append(term)
+        return terms
+
+    def _return_term(self, value: Optional[astroid.nodes.NodeNG]) -> Optional[_Term]:
+        """A simple return value's type, the function whose result it is, or None."""
+        if value is None:
+            return "builtins.NoneType"
+        if isinstance(value, astroid.nodes.Const):
+            return str(value.pytype())
+        for literal, qname in _LITERAL_TYPES:
+            if isinstance(value, literal):
+                return qname
+        # Only plain names are followed: `self.x()` depends on which subclass self is.
+        if not (isinstance(value, astroid.nodes.Call) and isinstance(value.func, astroid.nodes.Name)):
+            return None
+        try:
+            inf = next(self._infer(value.func))
+            if isinstance(inf, astroid.nodes.ClassDef):
+                return str(inf.qname())
+            if isinstance(inf, astroid.nodes.FunctionDef) and not inf.is_method():
+                return self._resolve_annotation(inf.returns) if inf.returns else inf
+        except (astroid.InferenceError, StopIteration):
+            pass
+        return None
+
     def _discover_from_name(self, node: Union[astroid.nodes.Name, astroid.nodes.AssignName]) -> Optional[str]:
         """Discovery logic specifically for Name/AssignName nodes."""
         for def_node in node.lookup(node.name)[1]:
@@ -268,44 +829,102 @@ class AstroidGateway(AstroidProtocol):
                 # JUSTIFICATION: Core AST traversal.
                 lookup_res = root.lookup(clean_name)
                 if lookup_res[1] and isinstance(lookup_res[1][0], astroid.nodes.ClassDef):
-                    return self._resolve_method_in_node(lookup_res[1][0], method_name)
+                    return self._resolve_method_in_node(lookup_res[1][0], method_name, context)
 
             # 2. Absolute Lookup
             module_parts: List[str] = class_qname.split(".")
             module_name: str = "builtins" if len(module_parts) < 2 else ".".join(module_parts[:-1])
             class_name: str = module_parts[-1]
             if module_name:
-                try:
-                    module = astroid.MANAGER.ast_from_module_name(module_name)
-                    lookup_res = module.lookup(class_name)
-                    if lookup_res[1] and isinstance(lookup_res[1][0], astroid.nodes.ClassDef):
-                        return self._resolve_method_in_node(lookup_res[1][0], method_name)
-                except astroid.AstroidBuildingError:
-                    pass
+                return self._indexed_method_return(f"{module_name}.{class_name}", method_name, context)
         except Exception:
             pass
         return None
 
+    def _indexed_method_return(
+        self, class_qname: str, method_name: str, context: astroid.nodes.NodeNG
+    ) -> Optional[str]:
+        """Return type of a method of an absolutely named class, through the symbol index."""
+        known = self.symbols.method_return(class_qname, method_name)
+        if known is not None:
+            self._note_dependency_files(context, known[1])
+            return known[0]
+        module_name, _, class_name = class_qname.rpartition(".")
+        module = self.symbols.module(module_name)
+        if module is None:
+            return None
+        files: Set[str] = set()
+        trips = self.budget_trips
+        self._recorders.append(files)
+        try:
+            self._note_dependency(context, module)
+            class_node = self.symbols.class_node(module, class_name)
+            if class_node is None:
+                return None
+            qname = self._resolve_method_in_node(class_node, method_name, context)
+        finally:
+            self._recorders.pop()
+        # An answer cut short by the inference budget is not indexed.
+        if self.budget_trips == trips:
+            self.symbols.remember_method_return(class_qname, method_name, qname, files)
+        return qname
 
-    def _resolve_method_in_node(self, class_node: astroid.nodes.ClassDef, method_name: str) -> Optional[str]:
+    def _resolve_method_in_node(
+        self, class_node: astroid.nodes.ClassDef, method_name: str, context: astroid.nodes.NodeNG
+    ) -> Optional[str]:
         """Recursive discovery of method return type through inheritance."""
         # 1. Search immediate node
+        self._note_dependency(context, class_node)
         for method in class_node.mymethods():
-            if method.name == method_name and method.returns:
-                return self._resolve_annotation(method.returns)
+            if method.name == method_name:
+                res = self._function_return(method, context)
+                if res:
+                    return res
 
         # 2. Search ancestors
         try:
             for ancestor in class_node.ancestors():
+                # Every ancestor searched matters: adding the method to one of them changes the answer.
+                self._note_dependency(context, ancestor)
                 for method in ancestor.mymethods():
-                    if method.name == method_name and method.returns:
-                        return self._resolve_annotation(method.returns)
+                    if method.name == method_name:
+                        res = self._function_return(method, context)
+                        if res:
+                            return res
         except astroid.InferenceError:
             pass
         return None
 
     def _resolve_annotation(self, anno: astroid.nodes.NodeNG) -> Optional[str]:
-        """Resolve a type annotation node to its fully qualified name."""
+        """
+        Resolve a type annotation node to its fully qualified name. Annotations with the same
+        source whose names are bound to the same definitions resolve alike, so the answer is
+        cached per module under that key.
+        """
+        key = _annotation_key(anno)
+        entry = self._annotations.get(key)
+        if entry is not None:
+            qname, files, cost = entry
+            self.annotation_hits += 1
+            self.annotation_inferences_saved += cost
+            self._note_dependency_files(anno, files)
+            return qname
+        self.annotation_misses += 1
+        calls, saved, trips = self.inference_calls, self.annotation_inferences_saved, self.budget_trips
+        consulted: Set[str] = set()
+        self._recorders.append(consulted)
+        try:
+            qname = self._resolve_annotation_node(anno)
+        finally:
+            self._recorders.pop()
+        # An answer cut short by the inference budget is not reused.
+        if self.budget_trips == trips:
+            cost = self.inference_calls - calls + self.annotation_inferences_saved - saved
+            self._annotations[key] = (qname, frozenset(consulted), cost)
+        return qname
+
+    def _resolve_annotation_node(self, anno: astroid.nodes.NodeNG) -> Optional[str]:
+        """Resolve an annotation not found in the cache."""
         if isinstance(anno, astroid.nodes.Subscript):
             return self._resolve_subscript_annotation(anno)
 
@@ -325,7 +944,7 @@ class AstroidGateway(AstroidProtocol):
         """Resolve complex subscript annotations (Optional, Union, List, etc.)."""
         try:
             # JUSTIFICATION: Core AST inference logic.
-            for inf in anno.value.infer():
+            for inf in self._infer(anno.value):
                 if inf is astroid.Uninferable:
                     continue
                 qname = str(inf.qname())
@@ -359,7 +978,7 @@ class AstroidGateway(AstroidProtocol):
             return self._normalize_primitive(anno.value)
 
         try:
-            for inf in anno.infer():
+            for inf in self._infer(anno):
                 if inf is not astroid.Uninferable:
                     return self._normalize_primitive(str(inf.qname()))
         except (astroid.InferenceError, AttributeError):
@@ -431,6 +1050,7 @@ class AstroidGateway(AstroidProtocol):
             return "builtins.float"
         return None
 
+    @_attributed
     def get_call_name(self, node: astroid.nodes.Call) -> Optional[str]:
         """Safely retrieve the name of the function or method being called."""
         if hasattr(node.func, "attrname"):
@@ -439,6 +1059,8 @@ class AstroidGateway(AstroidProtocol):
             return str(node.func.name)
         return None
 
+    @_memoized
+    @_attributed
     def is_protocol(self, node: astroid.nodes.NodeNG) -> bool:
         """Robust detection of Protocols using inference and gateways."""
         # NEW: If we already have a ClassDef, check it directly
@@ -472,7 +1094,7 @@ class AstroidGateway(AstroidProtocol):
 
         # 2. Try raw inference and ancestor check (Fallback)
         try:
-            for inf in node.infer():
+            for inf in self._infer(node):
                 if isinstance(inf, astroid.nodes.ClassDef):
                     inf_qname: str = inf.qname()
                     if inf_qname.endswith(".Protocol"):
@@ -486,42 +1108,15 @@ class AstroidGateway(AstroidProtocol):
 
         return False
 
+    @_memoized
+    @_attributed
     def is_protocol_call(self, node: astroid.nodes.Call) -> bool:
         """Check if the call is being made on a Protocol's method."""
         if not isinstance(node, astroid.nodes.Call):
             return False
-
-        # 1. Direct Inference
-        try:
-            for inf in node.func.infer():
-                if inf is astroid.Uninferable:
-                    continue
-                # If the function is a method, check its parent class
-                parent = getattr(inf, "parent", None)
-                if isinstance(parent, astroid.nodes.ClassDef):
-                    if self.is_protocol(parent):
-                        return True
-        except (astroid.InferenceError, AttributeError):
-            pass
-
-        # 2. Continuity: If the receiver was a Protocol call, the member is trusted.
-        if isinstance(node.func, astroid.nodes.Attribute) and isinstance(node.func.expr, astroid.nodes.Call):
-            if self.is_protocol_call(node.func.expr):
-                return True
-
-        # 3. Receiver-based Fallback (for hinted parameters where infer() fails)
-        if isinstance(node.func, astroid.nodes.Attribute):
-            receiver_qname: Optional[str] = self.get_return_type_qname_from_expr(node.func.expr)
-            if receiver_qname:
-                # Use class lookup to check if it's a Protocol
-                class_node: Optional[astroid.nodes.ClassDef] = self._find_class_node(receiver_qname, node)
-                if class_node and self.is_protocol(class_node):
-                    return True
-
-                if receiver_qname.endswith(".Protocol") or "Protocol" in receiver_qname:
-                    return True
-
-        return False
+        # 1. Direct Inference; 2. Continuity: a member of a Protocol call's result is trusted;
+        # 3. Receiver-based Fallback (for hinted parameters where infer() fails).
+        return self._chain_verdict("is_protocol_call", node, self._is_protocol_method, self._is_protocol_receiver)
 
     def _find_class_node(self, qname: str, context: astroid.nodes.NodeNG) -> Optional[astroid.nodes.ClassDef]:
         """Find a ClassDef node by its fully qualified name."""
@@ -543,6 +1138,7 @@ class AstroidGateway(AstroidProtocol):
             if is_local and hasattr(root, "lookup"):
                 lookup_res = root.lookup(clean_name)
                 if lookup_res[1] and isinstance(lookup_res[1][0], astroid.nodes.ClassDef):
+                    self._note_dependency(context, lookup_res[1][0])
                     return lookup_res[1][0]
 
             # 2. Absolute Lookup
@@ -550,86 +1146,138 @@ class AstroidGateway(AstroidProtocol):
             module_name: str = "builtins" if len(module_parts) < 2 else ".".join(module_parts[:-1])
             class_name: str = module_parts[-1]
             if module_name:
-                try:
-                    module = astroid.MANAGER.ast_from_module_name(module_name)
-                    lookup_res = module.lookup(class_name)
-                    if lookup_res[1] and isinstance(lookup_res[1][0], astroid.nodes.ClassDef):
-                        return lookup_res[1][0]
-                except (astroid.AstroidBuildingError, AttributeError):
-                    pass
+                module = self.symbols.module(module_name)
+                if module is not None:
+                    self._note_dependency(context, module)
+                    class_node = self.symbols.class_node(module, class_name)
+                    if class_node is not None:
+                        self._note_dependency(context, class_node)
+                        return class_node
         except Exception:
             pass
         return None
 
+    @_memoized
+    @_attributed
     def is_fluent_call(self, node: astroid.nodes.Call) -> bool:
         """Check if the call returns the same type as the receiver (Fluent API)."""
         if not isinstance(node, astroid.nodes.Call) or not isinstance(node.func, astroid.nodes.Attribute):
             return False
+        # 1. Recursive Continuity: if the receiver is already fluent, we keep going; 2. Direct match.
+        return self._chain_verdict("is_fluent_call", node, lambda _link: False, self._returns_receiver_type)
 
-        # 1. Recursive Continuity: If receiver is already fluent, we keep going
-        if isinstance(node.func.expr, astroid.nodes.Call):
-             if self.is_fluent_call(node.func.expr):
-                  return True
-
-        # 2. Direct match check
+    @_memoized
+    @_attributed
+    def is_trusted_authority_call(self, node: astroid.nodes.Call) -> bool:
+        """Check if the call's method belongs to a Trusted Authority."""
+        if not isinstance(node, astroid.nodes.Call):
+            return False
+        # 1. Direct Inference; 2a. Continuity; 2b. the receiver is a primitive/stdlib type.
+        return self._chain_verdict(
+            "is_trusted_authority_call", node, self._is_authority_method, self._is_trusted_receiver
+        )
+
+    def _chain_verdict(
+        self,
+        query: str,
+        node: astroid.nodes.Call,
+        direct: Callable[[astroid.nodes.Call], bool],
+        fallback: Callable[[astroid.nodes.Call], bool],
+    ) -> bool:
+        """
+        Evaluate a chain predicate: a call passes if `direct` holds for it, if the call it
+        is made on passes, or else if `fallback` holds for it.
+
+        In `a.b().c().d()` that makes each link depend on the one below it. Instead of
+        recursing once per link, and again when the checker visits each inner call, the
+        chain is walked down once to the first link that is decided or memoized, and the
+        links above it are settled on the way back up. Every link's verdict is memoized,
+        so the whole chain costs one evaluation per link, at any length.
+        """
+        pending: List[astroid.nodes.Call] = []
+        link: Optional[astroid.nodes.Call] = node
+        verdict = False
+        while link is not None:
+            entry = self._memo.get((query, id(link)))
+            if entry is not None and entry[0] is link:
+                verdict = bool(entry[1])
+                break
+            if direct(link):
+                self._memo[(query, id(link))] = (link, True)
+                verdict = True
+                break
+            pending.append(link)
+            link = _chained_call(link)
+        for link in reversed(pending):
+            verdict = verdict or fallback(link)
+            self._memo[(query, id(link))] = (link, verdict)
+        return verdict
+
+    def _inferred_values(self, node: astroid.nodes.NodeNG) -> Iterator[astroid.nodes.NodeNG]:
+        """Lazily, everything node infers to minus Uninferable; stops quietly where inference fails."""
         try:
-            receiver_qname: Optional[str] = self.get_return_type_qname_from_expr(node.func.expr)
-            return_qname: Optional[str] = self.get_node_return_type_qname(node)
+            for inferred in self._infer(node):
+                if inferred is not astroid.Uninferable:
+                    yield inferred
+        except (astroid.InferenceError, AttributeError):
+            return
 
-            if receiver_qname and return_qname:
-                # Direct match or structural match (e.g. both are 'DataFrame')
-                if receiver_qname == return_qname:
-                    return True
+    def _is_authority_method(self, node: astroid.nodes.Call) -> bool:
+        """Whether the called function is defined by a trusted authority module."""
+        return any(
+            str(getattr(inf, "qname", lambda: "")()).startswith(_AUTHORITIES)
+            for inf in self._inferred_values(node.func)
+        )
 
-                # Check base names if qnames are messy (e.g. '.DataFrame' vs 'pyspark.sql.DataFrame')
-                # JUSTIFICATION: Internal name extraction for normalization.
-                rec_parts: List[str] = receiver_qname.split(".")
-                rec_base: str = rec_parts[-1]
-                ret_parts: List[str] = return_qname.split(".")
-                ret_base: str = ret_parts[-1]
-                if rec_base == ret_base and rec_base != "NoneType":
+    def _is_protocol_method(self, node: astroid.nodes.Call) -> bool:
+        """Whether the called function is a method of a Protocol class."""
+        try:
+            for inf in self._inferred_values(node.func):
+                # If the function is a method, check its parent class
+                parent = getattr(inf, "parent", None)
+                if isinstance(parent, astroid.nodes.ClassDef) and self.is_protocol(parent):
                     return True
         except (astroid.InferenceError, AttributeError):
             pass
         return False
 
-    def is_trusted_authority_call(self, node: astroid.nodes.Call) -> bool:
-        """Check if the call's method belongs to a Trusted Authority."""
-        if not isinstance(node, astroid.nodes.Call):
+    def _receiver_qname(self, node: astroid.nodes.Call) -> Optional[str]:
+        """Type of the object a method call is made on."""
+        if not isinstance(node.func, astroid.nodes.Attribute):
+            return None
+        return self.get_return_type_qname_from_expr(node.func.expr)
+
+    def _is_protocol_receiver(self, node: astroid.nodes.Call) -> bool:
+        """Whether the receiver is hinted as a Protocol."""
+        receiver_qname = self._receiver_qname(node)
+        if not receiver_qname:
             return False
+        # Use class lookup to check if it's a Protocol
+        class_node: Optional[astroid.nodes.ClassDef] = self._find_class_node(receiver_qname, node)
+        if class_node and self.is_protocol(class_node):
+            return True
+        return "Protocol" in receiver_qname
 
-        # 1. Try Direct Inference
+    def _returns_receiver_type(self, node: astroid.nodes.Call) -> bool:
+        """Whether the call returns the same type as its receiver."""
         try:
-            for inf in node.func.infer():
-                qname: str = getattr(inf, "qname", lambda: "")()
-                if qname.startswith(("builtins.", "typing.", "collections.", "pathlib.", "re.", "json.", "datetime.", "abc.", "os.")):
-                    return True
+            receiver_qname = self._receiver_qname(node)
+            return bool(receiver_qname) and _same_type(str(receiver_qname), self.get_node_return_type_qname(node))
         except (astroid.InferenceError, AttributeError):
-            pass
-
-        # 2. Structural/Authority Trust Fallback
-        # If we know the receiver is a primitive/stdlib type, we trust the call.
-        if isinstance(node.func, astroid.nodes.Attribute):
-            # a) Direct check for trusted calls (Continuity)
-            if isinstance(node.func.expr, astroid.nodes.Call):
-                if self.is_trusted_authority_call(node.func.expr):
-                    return True
+            return False
 
-            # b) Check receiver type
-            receiver_qname: Optional[str] = self.get_return_type_qname_from_expr(node.func.expr)
-            if receiver_qname:
-                # If receiver is builtins, any method on it is considered trusted
-                authorities = ("builtins.", "typing.", "collections.", "pathlib.", "re.", "json.", "datetime.", "abc.", "os.")
-                if any(receiver_qname.startswith(p) for p in authorities):
-                    return True
-                # Use Typeshed to see if the receiver class belongs to stdlib
-                mod_name = receiver_qname.split(".")[0]
-                if self.typeshed.is_stdlib_module(mod_name):
-                    return True
-                # Handle bare names
-                if receiver_qname in ("str", "int", "float", "list", "dict", "set", "bool", "bytes", "tuple"):
-                    return True
-        return False
+    def _is_trusted_receiver(self, node: astroid.nodes.Call) -> bool:
+        """If we know the receiver is a primitive/stdlib type, any method on it is trusted."""
+        receiver_qname = self._receiver_qname(node)
+        if not receiver_qname:
+            return False
+        if receiver_qname.startswith(_AUTHORITIES):
+            return True
+        # Use Typeshed to see if the receiver class belongs to stdlib
+        if self.typeshed.is_stdlib_module(receiver_qname.split(".")[0]):
+            return True
+        # Handle bare names
+        return receiver_qname in ("str", "int", "float", "list", "dict", "set", "bool", "bytes", "tuple")
 
     def is_primitive(self, qname: str) -> bool:
         """Identify if a type belongs to the primitive trust circle."""
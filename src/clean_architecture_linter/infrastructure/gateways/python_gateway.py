@@ -1,6 +1,8 @@
 import sys
 import sysconfig
-from typing import Optional, TYPE_CHECKING
+from collections import OrderedDict
+from importlib.machinery import ModuleSpec, PathFinder
+from typing import FrozenSet, List, Optional, TYPE_CHECKING
 import astroid # type: ignore[import-untyped]
 from clean_architecture_linter.domain.protocols import PythonProtocol
 
@@ -8,11 +10,73 @@ if TYPE_CHECKING:
     from clean_architecture_linter.config import ConfigurationLoader
 
 
+class ModuleLocator:
+    """
+    File a module would be imported from, found through import specs: nothing is
+    imported, parsed or built. Answers, including "not found", are kept in a bounded
+    LRU until sys.path changes.
+    """
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._cache: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._search_path: List[str] = list(sys.path)
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def locate(self, module_name: str) -> Optional[str]:
+        """Path of the module's source or extension file, or None (not found, namespace package)."""
+        if sys.path != self._search_path:
+            # pylint adds the linted project's roots while it runs; earlier answers may not hold.
+            self._cache.clear()
+            self._search_path = list(sys.path)
+        if module_name in self._cache:
+            self._cache.move_to_end(module_name)
+            self.hits += 1
+            return self._cache[module_name]
+        self.misses += 1
+        origin = self._find(module_name)
+        self._cache[module_name] = origin
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return origin
+
+    @staticmethod
+    def _find(module_name: str) -> Optional[str]:
+        """Walk the package path down to the module, as the import system would, without importing."""
+        spec: Optional[ModuleSpec] = None
+        search: Optional[List[str]] = None
+        parts = module_name.split(".")
+        for depth in range(1, len(parts) + 1):
+            if depth > 1:
+                if spec is None or spec.submodule_search_locations is None:
+                    return None
+                search = list(spec.submodule_search_locations)
+            try:
+                spec = PathFinder.find_spec(".".join(parts[:depth]), search)
+            except (ImportError, ValueError):
+                return None
+            if spec is None:
+                return None
+        if spec is None or not spec.has_location:
+            return None
+        return spec.origin
+
+
 class PythonGateway(PythonProtocol):
     """Environment interrogation using sysconfig and astroid."""
 
-    def __init__(self) -> None:
+    def __init__(
+        self, stdlib_modules: Optional[FrozenSet[str]] = None, locator: Optional[ModuleLocator] = None
+    ) -> None:
         self._stdlib_path = sysconfig.get_path("stdlib")
+        # JUSTIFICATION: Simple path comparison for stdlib detection.
+        self._prefixes = (self._stdlib_path, getattr(sys, "base_prefix", ""), getattr(sys, "prefix", ""))
+        self._locator = locator if locator is not None else ModuleLocator()
+        # Top-level stdlib names; a hit here skips building the module with astroid.
+        if stdlib_modules is None:
+            stdlib_modules = frozenset(getattr(sys, "stdlib_module_names", ())).union(sys.builtin_module_names)
+        self._stdlib_modules = stdlib_modules
 
     def is_std_lib_module(self, module_name: str) -> bool:
         """Dynamic detection of StdLib modules without hardcoded lists."""
@@ -20,31 +84,18 @@ class PythonGateway(PythonProtocol):
             return False
         if module_name == "builtins":
             return True
-        if module_name in sys.builtin_module_names:
+        if module_name.partition(".")[0] in self._stdlib_modules:
             return True
 
         # Hardcoded trust list for common stdlib modules to handle edge cases
         if module_name in ("sys", "os", "pathlib", "json", "typing", "collections", "datetime", "ast", "abc", "builtins"):
             return True
 
-        try:
-            # Use astroid.MANAGER to find the module's file path
-            module_node = astroid.MANAGER.ast_from_module_name(module_name)
-            if hasattr(module_node, "file") and module_node.file:
-                # Normalizing paths for cross-platform comparison
-                mod_file = str(module_node.file)
-                # JUSTIFICATION: Simple path comparison for stdlib detection.
-                prefixes = [self._stdlib_path]
-                if hasattr(sys, "base_prefix"):
-                    prefixes.append(sys.base_prefix)
-                if hasattr(sys, "prefix"):
-                    prefixes.append(sys.prefix)
-
-                return any(mod_file.startswith(p) for p in prefixes)
-        except (astroid.AstroidBuildingError, AttributeError):
-            pass
-
-        return False
+        # Where the module would be imported from; the module itself is never loaded.
+        mod_file = self._locator.locate(module_name)
+        if not mod_file:
+            return False
+        return any(p and mod_file.startswith(p) for p in self._prefixes)
 
 
 
@@ -0,0 +1,88 @@
+"""Start-up cost measurement behind `excelsior bench startup`."""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Modules whose import dominates start-up; none of them should load for --help or init.
+HEAVY_MODULES: Tuple[str, ...] = ("pylint", "astroid", "mypy", "rich", "typeshed_client")
+
+# Scenario name -> CLI arguments; None only imports the CLI module.
+STARTUP_SCENARIOS: Dict[str, Optional[List[str]]] = {
+    "import cli": None,
+    "excelsior --help": ["--help"],
+    "excelsior init --help": ["init", "--help"],
+    "excelsior check --help": ["check", "--help"],
+}
+
+_MARKER = "EXCELSIOR_BENCH "
+
+# Runs in a fresh interpreter; reports on stderr because --help writes to stdout.
+_PROBE = f"""
+import json, sys, time
+args = json.loads(sys.argv[1])
+started = time.perf_counter()
+try:
+    from clean_architecture_linter.cli import main
+    if args is not None:
+        sys.argv = ["excelsior", *args]
+        main()
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - started
+heavy = sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules)
+sys.stderr.write({_MARKER!r} + json.dumps({{"seconds": elapsed, "heavy": heavy}}) + "\\n")
+"""
+
+
+@dataclass(frozen=True)
+class StartupSample:
+    """Median timings of one scenario over several fresh interpreters."""
+
+    scenario: str
+    process_ms: float
+    import_ms: float
+    heavy_modules: Tuple[str, ...]
+
+
+def measure_startup(runs: int = 5, scenarios: Optional[Dict[str, Optional[List[str]]]] = None) -> List[StartupSample]:
+    """Run every scenario `runs` times in a new interpreter and take the medians."""
+    samples: List[StartupSample] = []
+    for name, args in (scenarios or STARTUP_SCENARIOS).items():
+        process_times: List[float] = []
+        import_times: List[float] = []
+        heavy: Tuple[str, ...] = ()
+        for _ in range(max(1, runs)):
+            started = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, "-c", _PROBE, json.dumps(args)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=False,
+            )
+            process_times.append(time.perf_counter() - started)
+            report = _parse_report(completed.stderr)
+            if report is None:
+                raise RuntimeError(f"start-up probe for {name!r} failed:\n{completed.stderr.strip()}")
+            import_times.append(float(report["seconds"]))
+            heavy = tuple(report["heavy"])
+        samples.append(StartupSample(
+            name,
+            round(statistics.median(process_times) * 1000, 1),
+            round(statistics.median(import_times) * 1000, 1),
+            heavy,
+        ))
+    return samples
+
+
+def _parse_report(stderr: str) -> Optional[Dict[str, object]]:
+    for line in reversed(stderr.splitlines()):
+        if line.startswith(_MARKER):
+            report = json.loads(line[len(_MARKER):])
+            return report if isinstance(report, dict) else None
+    return None
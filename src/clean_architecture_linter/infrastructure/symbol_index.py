@@ -0,0 +1,281 @@
+"""Project symbol index: class lookups, method return types and missing modules, kept across runs."""
+
+import hashlib
+import mmap
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import astroid  # type: ignore[import-untyped]
+
+from clean_architecture_linter.infrastructure.adapters.result_cache import plugin_version
+
+SYMBOL_INDEX_PATH: Path = Path(".excelsior") / "symbols.idx"
+# Bump when the line layout, or what a stored answer means, changes so old index files are
+# ignored rather than misread. 2: unannotated methods store a summarised return type.
+INDEX_FORMAT: int = 2
+
+_MAGIC = b"excelsior-symbols"
+_MISSING = "M:"
+_RETURNS = "R:"
+# Stored in place of a return type when the method has no resolvable annotation.
+_NO_TYPE = "-"
+
+
+def file_stamp(path: str) -> str:
+    """mtime and size of a file or directory; empty when it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return ""
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def environment_stamp() -> str:
+    """Digest of the interpreter and its import path; a saved index only applies to the same one."""
+    parts = [sys.version, sys.prefix, *sys.path]
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _header() -> bytes:
+    """
+    First line of a saved index. Answers depend on the resolver that computed them, so
+    the plugin and astroid versions invalidate the file as much as the environment does.
+    """
+    fields = [INDEX_FORMAT, plugin_version(), astroid.__version__, environment_stamp()]
+    return b" ".join([_MAGIC, *(str(field).replace(" ", "_").encode("utf-8") for field in fields)])
+
+
+def _storable(text: str) -> bool:
+    return "\t" not in text and "\n" not in text
+
+
+class MappedIndex:
+    """
+    Read-only view of a saved index: a header line, then `key<TAB>fields` lines sorted
+    by key. The file is memory-mapped and searched by bisection, so opening it costs
+    nothing up front and a lookup touches only a few pages.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._map: Optional[mmap.mmap] = None
+        self._start = 0
+        try:
+            with path.open("rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        header_end = mapped.find(b"\n")
+        if header_end <= 0 or mapped[:header_end] != _header():
+            # Another format, resolver version or environment: every entry is suspect.
+            mapped.close()
+            return
+        self._map = mapped
+        self._start = header_end + 1
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """The fields stored under key, or None."""
+        if self._map is None:
+            return None
+        data = self._map
+        target = key.encode("utf-8")
+        lo, hi = self._start, len(data)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            line_start = data.rfind(b"\n", self._start - 1, mid) + 1
+            line_end = data.find(b"\n", mid)
+            if line_end < 0:
+                line_end = len(data)
+            line_key, _, fields = data[line_start:line_end].partition(b"\t")
+            if line_key == target:
+                return fields.decode("utf-8").split("\t")
+            if line_key < target:
+                lo = line_end + 1
+            else:
+                hi = line_start
+        return None
+
+    def items(self) -> Iterable[Tuple[str, List[str]]]:
+        """Every stored entry, in key order."""
+        if self._map is None:
+            return
+        for line in self._map[self._start:].decode("utf-8").splitlines():
+            key, _, fields = line.partition("\t")
+            yield key, fields.split("\t")
+
+    def close(self) -> None:
+        """Unmap the file."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+
+class SymbolIndex:
+    """
+    What the AstroidGateway has learnt about the project's symbols during a run:
+    qname -> ClassDef, (class qname, method) -> resolved return type, and modules
+    that could not be built (a negative cache, so a failing import is attempted once).
+
+    Return types and missing modules can be saved and reloaded. Saved entries carry
+    the mtime and size of every file they were derived from and are ignored once any
+    of those changes; missing modules are also tied to the import path.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path
+        self._saved: Optional[MappedIndex] = MappedIndex(path) if path is not None else None
+        self._modules: Dict[str, Optional[astroid.nodes.Module]] = {}
+        self._classes: Dict[str, Optional[astroid.nodes.ClassDef]] = {}
+        self._returns: Dict[Tuple[str, str], Tuple[Optional[str], FrozenSet[str]]] = {}
+        # Entries learnt (or confirmed from the saved file) this run, in their on-disk form.
+        self._entries: Dict[str, List[str]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def module(self, name: str) -> Optional[astroid.nodes.Module]:
+        """The module built by astroid, or None when it cannot be found or built."""
+        if name in self._modules:
+            self.hits += 1
+            return self._modules[name]
+        if self._saved_missing(name):
+            self.hits += 1
+            self._modules[name] = None
+            return None
+        self.misses += 1
+        try:
+            module: Optional[astroid.nodes.Module] = astroid.MANAGER.ast_from_module_name(name)
+        except astroid.AstroidBuildingError:
+            module = None
+            # The directories the module would have to appear in for the import to start working.
+            fields: List[str] = []
+            for directory in self._search_dirs(name):
+                fields.extend((directory, file_stamp(directory)))
+            if _storable(name) and all(_storable(field) for field in fields):
+                self._entries[_MISSING + name] = fields
+        self._modules[name] = module
+        return module
+
+    def class_node(self, module: astroid.nodes.Module, class_name: str) -> Optional[astroid.nodes.ClassDef]:
+        """The class defined (or imported) under class_name in module."""
+        qname = f"{module.name}.{class_name}"
+        if qname not in self._classes:
+            lookup_res = module.lookup(class_name)
+            found = lookup_res[1][0] if lookup_res[1] else None
+            self._classes[qname] = found if isinstance(found, astroid.nodes.ClassDef) else None
+        return self._classes[qname]
+
+    def method_return(self, class_qname: str, method_name: str) -> Optional[Tuple[Optional[str], FrozenSet[str]]]:
+        """(return type, files it was derived from) when known, else None."""
+        key = (class_qname, method_name)
+        if key in self._returns:
+            self.hits += 1
+            return self._returns[key]
+        saved = self._saved_entry(f"{_RETURNS}{class_qname}:{method_name}")
+        if saved is not None:
+            qname = None if saved[0] == _NO_TYPE else saved[0]
+            files = frozenset(saved[1::2])
+            self._returns[key] = (qname, files)
+            self.hits += 1
+            return self._returns[key]
+        return None
+
+    def remember_method_return(
+        self, class_qname: str, method_name: str, qname: Optional[str], files: Iterable[str]
+    ) -> None:
+        """Record a resolved method return type and the files consulted to resolve it."""
+        consulted = frozenset(files)
+        self._returns[(class_qname, method_name)] = (qname, consulted)
+        fields = [qname or _NO_TYPE]
+        for path in sorted(consulted):
+            fields.extend((path, file_stamp(path)))
+        if all(_storable(field) for field in fields) and _storable(class_qname + method_name):
+            self._entries[f"{_RETURNS}{class_qname}:{method_name}"] = fields
+
+    def refresh(self) -> None:
+        """
+        Before another run in the same process (watch, serve): drop the module and class
+        nodes, which astroid may have re-parsed since, and return types whose files changed.
+        """
+        self._modules.clear()
+        self._classes.clear()
+        for key in [k for k, fields in self._entries.items() if not self._valid(k, fields)]:
+            del self._entries[key]
+        self._returns = {
+            (class_qname, method_name): known
+            for (class_qname, method_name), known in self._returns.items()
+            if f"{_RETURNS}{class_qname}:{method_name}" in self._entries
+        }
+
+    def save(self, path: Optional[Path] = None) -> None:
+        """Write still-valid saved entries plus this run's, sorted, replacing the file atomically."""
+        target = path or self.path
+        if target is None:
+            return
+        entries: Dict[str, List[str]] = {}
+        if self._saved is not None:
+            for key, fields in self._saved.items():
+                if self._valid(key, fields):
+                    entries[key] = fields
+            self._saved.close()
+            self._saved = None
+        entries.update((key, fields) for key, fields in self._entries.items() if self._valid(key, fields))
+        lines = [_header()]
+        for key in sorted(entries, key=lambda k: k.encode("utf-8")):
+            lines.append("\t".join([key, *entries[key]]).encode("utf-8"))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=".tmp-", suffix=".idx")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(b"\n".join(lines) + b"\n")
+            os.replace(tmp_name, target)
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        self._saved = MappedIndex(target)
+        self.path = target
+
+    def _saved_missing(self, name: str) -> bool:
+        return self._saved_entry(_MISSING + name) is not None
+
+    def _saved_entry(self, key: str) -> Optional[List[str]]:
+        """A saved entry that is still valid; it is carried over to the next save."""
+        if self._saved is None:
+            return None
+        fields = self._saved.get(key)
+        if fields is None or not self._valid(key, fields):
+            return None
+        self._entries[key] = fields
+        return fields
+
+    @staticmethod
+    def _valid(key: str, fields: List[str]) -> bool:
+        """Whether every file stamp recorded in an entry still matches the file system."""
+        stamps = fields if key.startswith(_MISSING) else fields[1:]
+        if len(stamps) % 2:
+            return False
+        return all(not path or file_stamp(path) == stamp for path, stamp in zip(stamps[::2], stamps[1::2]))
+
+    @staticmethod
+    def _search_dirs(name: str) -> List[str]:
+        """
+        Directory of the deepest importable package above a missing module, or every
+        import path directory for a missing top-level module.
+        """
+        parts = name.split(".")
+        for depth in range(len(parts) - 1, 0, -1):
+            try:
+                init_file = astroid.modutils.file_from_modpath(parts[:depth])
+            except ImportError:
+                continue
+            if init_file and os.path.basename(init_file).startswith("__init__."):
+                return [os.path.dirname(os.path.abspath(init_file))]
+            return []
+        return [os.path.abspath(entry or os.curdir) for entry in sys.path if os.path.isdir(entry or os.curdir)]
@@ -1,15 +1,70 @@
-
-from typing import Optional, Set
+from pathlib import Path
+from typing import FrozenSet, Iterable, List, Optional, Set, Tuple
 import logging
+import sys
 from typeshed_client import finder
 
 from clean_architecture_linter.domain.protocols import TypeshedProtocol
 
+# typeshed's stdlib/VERSIONS, shipped with the package so start-up needs no typeshed lookup.
+# Regenerate with `make stdlib-snapshot` after upgrading typeshed-client.
+STDLIB_SNAPSHOT: Path = Path(__file__).resolve().parent.parent / "data" / "stdlib_versions.txt"
+_SNAPSHOT_HEADER = "# Generated from typeshed stdlib/VERSIONS by `make stdlib-snapshot`; do not edit."
+
+
+def _read_lines(path: Path) -> List[str]:
+    text: str = path.read_text(encoding="utf-8")
+    return text.splitlines()
+
+
+def _installed_versions() -> List[str]:
+    """Lines of the VERSIONS file of the typeshed that typeshed-client resolves."""
+    typeshed = finder.get_search_context().typeshed
+    return _read_lines(Path(typeshed) / "VERSIONS")
+
+
+def parse_stdlib_versions(
+    lines: Iterable[str], version: Tuple[int, int]
+) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """
+    (modules available in `version`, modules listed but not available in it) from
+    VERSIONS lines such as `asyncio.taskgroups: 3.11-` or `distutils: 3.0-3.11`.
+    """
+    available: Set[str] = set()
+    retired: Set[str] = set()
+    for line in lines:
+        entry: str = line.partition("#")[0].strip()
+        module, _, bounds = entry.partition(": ")
+        if not module:
+            continue
+        low, _, high = bounds.partition("-")
+        major, minor = low.split(".")
+        too_old = version < (int(major), int(minor))
+        too_new = False
+        if high:
+            major, minor = high.split(".")
+            too_new = version > (int(major), int(minor))
+        (retired if too_old or too_new else available).add(module)
+    return frozenset(available), frozenset(retired)
+
+
+def write_stdlib_snapshot(path: Path = STDLIB_SNAPSHOT) -> int:
+    """Copy the installed typeshed's VERSIONS entries to path; returns the number of modules."""
+    entries = [line.partition("#")[0].strip() for line in _installed_versions()]
+    entries = [entry for entry in entries if entry]
+    directory = path.parent
+    directory.mkdir(parents=True, exist_ok=True)
+    path.write_text("\n".join([_SNAPSHOT_HEADER, *entries]) + "\n", encoding="utf-8")
+    return len(entries)
+
+
 class TypeshedService(TypeshedProtocol):
     """Service to interact with typeshed stubs via typeshed-client."""
 
     _instance: Optional["TypeshedService"] = None
-    _stdlib_modules: Set[str] = set()
+    _stdlib_modules: FrozenSet[str] = frozenset()
+    # Listed in typeshed but removed from (or not yet in) the running Python.
+    _retired_modules: FrozenSet[str] = frozenset()
 
     def __new__(cls) -> "TypeshedService":
         if cls._instance is None:
@@ -19,52 +74,38 @@ class TypeshedService(TypeshedProtocol):
         return cls._instance
 
     def _load_stdlib_modules(self) -> None:
-        """Cache list of standard library modules from typeshed."""
+        """
+        Build the stdlib module table once: the packaged VERSIONS snapshot (or, failing
+        that, the installed typeshed's) for the running version, plus sys.stdlib_module_names.
+        """
+        version = (sys.version_info[0], sys.version_info[1])
         try:
-             # typeshed-client finder can list all modules in stdlib
-             # We iterate known stdlib versions or just check 'stdlib' folder
-             search_context = finder.get_search_context()
-             # This is a bit implementation dependent, but we want to know
-             # if a module is in the stdlib search path.
-             pass
-        except Exception:
-             logging.warning("Failed to initialize TypeshedService")
+            lines = _read_lines(STDLIB_SNAPSHOT)
+        except OSError:
+            try:
+                lines = _installed_versions()
+            except Exception:
+                logging.warning("Failed to initialize TypeshedService")
+                lines = []
+        available, retired = parse_stdlib_versions(lines, version)
+        runtime = frozenset(getattr(sys, "stdlib_module_names", ())).union(sys.builtin_module_names)
+        type(self)._stdlib_modules = available | runtime
+        type(self)._retired_modules = retired - runtime
 
     def is_stdlib_module(self, module_name: str) -> bool:
-        """Check if a module is part of the standard library."""
-        try:
-            # We use finder to look up the stub.
-            # If it's found in the stdlib portion of typeshed, it's stdlib.
-            # typeshed-client 2.0+ uses get_stub_file
-            stub = finder.get_stub_file(module_name)
-
-            if not stub:
-                return False
-
-            stub_path = str(stub)
-            # Rough heuristic: typeshed keeps stdlib stubs in a 'stdlib' folder
-            # OR top-level in bundled typeshed (e.g. .../typeshed/os/...)
-            # We trust everything in the bundled typeshed that isn't explicitly third-party stubs?
-            # Actually, typeshed-client includes stdlib.
-
-            if "stdlib" in stub_path:
+        """
+        Check if a module is part of the standard library: a set lookup for the module
+        and, if it is not listed itself, for each parent package (submodules share
+        their parent's availability).
+        """
+        name = module_name
+        while name:
+            if name in self._stdlib_modules:
                 return True
-
-            # If it's in the stubs folder of typeshed, it's third-party
-            if "typeshed/stubs/" in stub_path or "typeshed_client/typeshed/stubs/" in stub_path:
-                 return False
-
-            # If path contains 'typeshed_client/typeshed/', it's likely stdlib info from the bundle
-            if "typeshed_client/typeshed/" in stub_path:
-                 return True
-
-            return False
-
-        except ImportError:
-            # Fallback if typeshed_client not installed/working
-            return False
-        except Exception:
-            return False
+            if name in self._retired_modules:
+                return False
+            name = name.rpartition(".")[0]
+        return False
 
     def is_stdlib_qname(self, qname: str) -> bool:
         """Check if a fully qualified name originates from stdlib."""
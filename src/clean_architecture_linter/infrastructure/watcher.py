@@ -0,0 +1,71 @@
+"""File watching for `excelsior watch`."""
+
+import os
+import time
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+
+from clean_architecture_linter.domain.entities import Diagnostic
+from clean_architecture_linter.infrastructure.adapters.excelsior_adapter import discover_python_files
+
+
+class PollingWatcher:
+    """
+    Detects added, modified and removed Python files under a target by polling their stat.
+    Polling needs no platform-specific dependency and is cheap next to a pylint run.
+    """
+
+    def __init__(
+        self,
+        target_path: str,
+        interval: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.target_path = target_path
+        self.interval = interval
+        self._sleep = sleep
+        self._snapshot = self._take_snapshot()
+
+    def changes(self) -> Set[str]:
+        """Files that were added, modified or removed since the previous call."""
+        current = self._take_snapshot()
+        previous = self._snapshot
+        changed = {path for path in current.keys() | previous.keys() if current.get(path) != previous.get(path)}
+        self._snapshot = current
+        return changed
+
+    def wait(self) -> Set[str]:
+        """Block until something changes, then let the burst of writes from one save settle."""
+        changed: Set[str] = set()
+        while not changed:
+            self._sleep(self.interval)
+            changed = self.changes()
+        while True:
+            self._sleep(self.interval)
+            more = self.changes()
+            if not more:
+                return changed
+            changed |= more
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        snapshot: Dict[str, Tuple[int, int]] = {}
+        for path in discover_python_files(self.target_path):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+
+def diff_diagnostics(
+    before: Iterable[Diagnostic], after: Iterable[Diagnostic]
+) -> Tuple[List[Diagnostic], List[Diagnostic]]:
+    """Return (introduced, resolved) diagnostics, each sorted by location."""
+    old: Set[Diagnostic] = set(before)
+    new: Set[Diagnostic] = set(after)
+
+    def order(d: Diagnostic) -> Tuple[str, int, int, str]:
+        return (d.path, d.line, d.column, d.code)
+
+    return sorted(new - old, key=order), sorted(old - new, key=order)
+
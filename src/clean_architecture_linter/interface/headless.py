@@ -0,0 +1,106 @@
+"""Plain-text telemetry and report rendering for CI and other non-interactive runs."""
+
+import os
+import re
+import sys
+from dataclasses import dataclass
+from typing import Mapping, Optional, Protocol, Sequence, TextIO
+
+# Rule messages carry ANSI colour codes for the rich terminal; CI logs should not.
+_ANSI_ESCAPE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+
+def headless_requested(environ: Optional[Mapping[str, str]] = None) -> bool:
+    """Whether the environment asks for headless output (EXCELSIOR_HEADLESS, or CI=true)."""
+    env = os.environ if environ is None else environ
+    if env.get("EXCELSIOR_HEADLESS", "").lower() in ("1", "true", "yes"):
+        return True
+    return env.get("CI", "").lower() in ("1", "true")
+
+
+def strip_ansi(text: str) -> str:
+    """Remove terminal colour codes."""
+    return _ANSI_ESCAPE.sub("", text)
+
+
+class HeadlessTelemetry:
+    """
+    TelemetryPort that writes plain lines: no rich console, no log file, no prompts.
+    Questions are answered with their defaults so a CI job never blocks on input.
+    """
+
+    def __init__(
+        self, project_name: str = "EXCELSIOR", out: Optional[TextIO] = None, err: Optional[TextIO] = None
+    ) -> None:
+        self.project_name = project_name
+        self._out = out
+        self._err = err
+
+    def handshake(self) -> None:
+        """Name the tool once; there is no banner in headless mode."""
+        print(f"{self.project_name} (headless)", file=self._out or sys.stdout)
+
+    def step(self, msg: str) -> None:
+        """Report a step."""
+        print(f"- {strip_ansi(msg)}", file=self._out or sys.stdout)
+
+    def error(self, msg: str) -> None:
+        """Report an error on stderr."""
+        print(f"ERROR: {strip_ansi(msg)}", file=self._err or sys.stderr)
+
+    def ask(self, prompt: str, default: str | None = None, password: bool = False) -> str:
+        """Non-interactive: the default answer."""
+        return default or ""
+
+    def confirm(self, prompt: str, default: bool = True) -> bool:
+        """Non-interactive: the default answer."""
+        return default
+
+    def warning(self, msg: str) -> None:
+        """Report a warning on stderr."""
+        print(f"WARNING: {strip_ansi(msg)}", file=self._err or sys.stderr)
+
+    def debug(self, msg: str) -> None:
+        """Debug messages are dropped."""
+
+
+class _Column(Protocol):
+    header: str
+    key: str
+
+
+class _Schema(Protocol):
+    title: str
+    columns: Sequence[_Column]
+
+
+@dataclass(frozen=True)
+class PlainColumn:
+    """Stand-in for stellar_ui_kit's ColumnDefinition, so headless runs never import it."""
+
+    header: str
+    key: str
+
+
+@dataclass(frozen=True)
+class PlainSchema:
+    """Stand-in for stellar_ui_kit's ReportSchema; styling has no meaning in plain text."""
+
+    title: str
+    columns: Sequence[PlainColumn]
+
+
+class PlainReporter:
+    """Drop-in for stellar_ui_kit's TerminalReporter that prints tab-separated rows."""
+
+    def __init__(self, out: Optional[TextIO] = None) -> None:
+        self._out = out
+
+    def generate_report(self, rows: Sequence[Mapping[str, object]], schema: _Schema) -> None:
+        """Print the title, a header line and one line per row."""
+        # Resolved per call so a redirected sys.stdout is honoured.
+        out = self._out or sys.stdout
+        print(f"\n{schema.title} ({len(rows)})", file=out)
+        print("\t".join(column.header for column in schema.columns), file=out)
+        for row in rows:
+            print("\t".join(strip_ansi(str(row.get(column.key, ""))) for column in schema.columns), file=out)
@@ -1,7 +1,11 @@
 import unittest
+from functools import partial
+from unittest.mock import patch
 
 from clean_architecture_linter.checks.patterns import CouplingChecker, PatternChecker
 from clean_architecture_linter.config import ConfigurationLoader
+from clean_architecture_linter.infrastructure.gateways.astroid_gateway import AstroidGateway
+from clean_architecture_linter.infrastructure.gateways.python_gateway import PythonGateway
 from tests.linter_test_utils import run_checker
 
 
@@ -66,5 +70,36 @@ def logic(obj):
         self.assertEqual(msgs, [])
 
 
+class TestCouplingChainAnalysis(unittest.TestCase):
+    def setUp(self):
+        ConfigurationLoader._instance = None
+        self.checker = partial(CouplingChecker, ast_gateway=AstroidGateway(), python_gateway=PythonGateway())
+
+    def test_chain_is_reported_once(self):
+        code = """
+def logic(obj):
+    obj.load().parse().validate().save()
+        """
+        msgs = run_checker(self.checker, code, "src/use_cases/logic.py")
+        self.assertEqual(msgs, ["clean-arch-demeter"])
+
+    def test_inner_links_are_analysed_with_the_outermost_call(self):
+        code = """
+def logic(obj):
+    obj.load().parse().validate().save()
+        """
+        with patch.object(CouplingChecker, "_check_method_chain", autospec=True, return_value=False) as check:
+            run_checker(self.checker, code, "src/use_cases/logic.py")
+        self.assertEqual([c.args[1].func.attrname for c in check.call_args_list], ["save"])
+
+    def test_violating_inner_link_is_reported_when_outer_call_is_excluded(self):
+        code = """
+def logic(obj):
+    return obj.settings.source.as_dict().items()
+        """
+        msgs = run_checker(self.checker, code, "src/use_cases/logic.py")
+        self.assertEqual(msgs, ["clean-arch-demeter"])
+
+
 if __name__ == "__main__":
     unittest.main()
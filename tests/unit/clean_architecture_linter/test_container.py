@@ -23,3 +23,32 @@ class TestExcelsiorContainer:
         container = ExcelsiorContainer()
         with pytest.raises(ValueError, match=r"Dependency 'Missing' not registered\."):
             container.get("Missing")
+
+    def test_embedded_flag(self):
+        container = ExcelsiorContainer()
+        assert container.embedded is False
+        container.mark_embedded()
+        assert container.embedded is True
+
+    def test_defaults_are_built_on_first_use(self):
+        container = ExcelsiorContainer()
+        assert not container.is_built("AstroidGateway")
+
+        gateway = container.get("AstroidGateway")
+
+        assert container.is_built("AstroidGateway")
+        assert container.get("AstroidGateway") is gateway
+
+    def test_register_singleton_replaces_factory(self):
+        container = ExcelsiorContainer()
+        telemetry = object()
+        container.register_singleton("TelemetryPort", telemetry)
+        assert container.get("TelemetryPort") is telemetry
+
+    def test_register_factory(self):
+        container = ExcelsiorContainer()
+        calls = []
+        container.register_factory("Service", lambda: calls.append(1) or "service")
+        assert calls == []
+        assert container.get("Service") == container.get("Service") == "service"
+        assert calls == [1]
@@ -0,0 +1,82 @@
+import io
+import logging
+import pickle
+import sys
+from unittest.mock import PropertyMock, patch
+
+import dill
+from pylint.lint import PyLinter
+from pylint.reporters.text import TextReporter
+
+from clean_architecture_linter.checker import PLUGIN_STATE_ATTR, _ast_cache_class
+from clean_architecture_linter.config import ConfigurationLoader, PluginState
+from clean_architecture_linter.di.container import ExcelsiorContainer
+
+
+def _reset_loader():
+    ConfigurationLoader._instance = None
+    ConfigurationLoader._config = {}
+    ConfigurationLoader._registry = None
+
+
+class TestPluginState:
+    def setup_method(self):
+        _reset_loader()
+        ExcelsiorContainer.reset()
+
+    def teardown_method(self):
+        _reset_loader()
+        ExcelsiorContainer.reset()
+
+    def test_snapshot_survives_pickling(self):
+        ConfigurationLoader()
+        ConfigurationLoader._config = {"layer_map": {"Infrastructure": "gateways"}}
+
+        state = pickle.loads(pickle.dumps(ConfigurationLoader().snapshot()))
+
+        assert isinstance(state, PluginState)
+        assert state.config == {"layer_map": {"Infrastructure": "gateways"}}
+        assert "os" in state.stdlib_modules
+
+    def test_install_does_not_read_pyproject(self):
+        state = ConfigurationLoader().snapshot()
+        _reset_loader()
+
+        with patch.object(ConfigurationLoader, "load_config") as load_config:
+            ConfigurationLoader.install(state)
+            ConfigurationLoader()
+
+        load_config.assert_not_called()
+        assert ConfigurationLoader().registry is state.registry
+
+    def test_workers_reuse_the_parent_state_without_the_banner(self, capsys):
+        parent = PyLinter(reporter=TextReporter(io.StringIO()))
+        parent.load_plugin_modules(["clean_architecture_linter"])
+        state = getattr(parent, PLUGIN_STATE_ATTR)
+        assert capsys.readouterr().out
+
+        # The steps of pylint's -j worker initializer: unpickle the linter, re-register plugins.
+        worker = dill.loads(dill.dumps(parent))
+        _reset_loader()
+        ExcelsiorContainer.reset()
+        with patch.object(ConfigurationLoader, "load_config") as load_config:
+            worker._deregister_checkers(worker._registered_dynamic_plugin_checkers)
+            worker.load_plugin_modules(worker._dynamic_plugins, force=True)
+
+        load_config.assert_not_called()
+        assert capsys.readouterr().out == ""
+        assert ConfigurationLoader().config == state.config
+        assert ConfigurationLoader().registry.directory_map == state.registry.directory_map
+
+    def test_ast_cache_without_its_extra_falls_back_with_a_warning(self, caplog):
+        _ast_cache_class.cache_clear()
+        linter = PyLinter(reporter=TextReporter(io.StringIO()))
+        with patch.object(ConfigurationLoader, "ast_cache", new_callable=PropertyMock, return_value=True), \
+                patch.dict(sys.modules, {"clean_architecture_linter.infrastructure.ast_cache": None}), \
+                caplog.at_level(logging.WARNING):
+            linter.load_plugin_modules(["clean_architecture_linter"])
+        _ast_cache_class.cache_clear()
+
+        assert not ExcelsiorContainer.get_instance().is_built("AstCache")
+        assert "pylint-clean-architecture[ast-cache]" in caplog.text
+        assert "clean-arch-demeter" in {msg.symbol for msg in linter.msgs_store.messages}
@@ -0,0 +1,34 @@
+import io
+from typing import Callable, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+# (stdout, returncode, stderr) of one fake child process; trailing fields may be left out.
+_DEFAULT_RUN: Tuple[str, int, str] = ("", 0, "")
+
+
+def _fake_popen(*runs: Tuple[object, ...]) -> MagicMock:
+    """subprocess.Popen double: each call plays the next run (the last one repeats)."""
+    runs = runs or (_DEFAULT_RUN,)
+
+    def start(cmd, **kwargs):
+        run = tuple(runs[min(popen.call_count, len(runs)) - 1])
+        stdout, returncode, stderr = run + _DEFAULT_RUN[len(run):]
+        if stderr and hasattr(kwargs.get("stderr"), "write"):
+            kwargs["stderr"].write(stderr)
+        proc = MagicMock(stdout=io.StringIO(stdout), returncode=returncode)
+        proc.__enter__.return_value = proc
+        proc.poll.return_value = returncode
+        return proc
+
+    popen = MagicMock(side_effect=start)
+    return popen
+
+
+@pytest.fixture
+def fake_popen(request) -> Callable[..., MagicMock]:
+    """Factory for Popen doubles, e.g. fake_popen(("out", 1), ("", 2, "usage")); also self.fake_popen."""
+    if request.cls is not None:
+        request.cls.fake_popen = staticmethod(_fake_popen)
+    return _fake_popen
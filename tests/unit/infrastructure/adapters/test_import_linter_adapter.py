@@ -1,9 +1,9 @@
-import pytest
-import subprocess
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+
 from clean_architecture_linter.infrastructure.adapters.import_linter_adapter import ImportLinterAdapter
 
-def test_gather_results_success():
+
+def test_gather_results_success(fake_popen):
     adapter = ImportLinterAdapter()
 
     mock_output = """
@@ -20,36 +20,42 @@ Allowed layers:
 domain.entities is not allowed to import infrastructure.db
     """
 
-    with patch("subprocess.run") as mock_run:
-        mock_run.return_value = MagicMock(
-            stdout=mock_output,
-            returncode = 1 # failure in linting, but success in execution
-        )
-
+    # failure in linting, but success in execution
+    with patch("subprocess.Popen", fake_popen((mock_output, 1))):
         results = adapter.gather_results("src")
 
         assert len(results) > 0, "Should find violations"
         assert results[0].code == "IL001"
         assert "domain_isolation" in results[0].message
         assert "is not allowed to import" in results[0].message
+        assert results[0].locations == []
+        assert [d.message for d in results[0].diagnostics] == [results[0].message]
 
-def test_gather_results_fallback():
+def test_gather_results_fallback(fake_popen):
     adapter = ImportLinterAdapter()
 
-    with patch("subprocess.run") as mock_run:
-        # First call raises FileNotFoundError
-        mock_run.side_effect = [FileNotFoundError, MagicMock(stdout = "", returncode = 0)]
-
+    with patch("shutil.which", return_value=None), patch("subprocess.Popen", fake_popen()) as mock_popen:
         results = adapter.gather_results("src")
 
-        # Should have called subprocess twice
-        assert mock_run.call_count == 2
+        # Falls back to running the module with the current interpreter
+        assert mock_popen.call_args.args[0][1:] == ["-m", "importlinter", "lint"]
         # Should return empty list (success)
         assert results == []
 
+def test_gather_results_streams_diagnostics(fake_popen):
+    adapter = ImportLinterAdapter()
+    output = "Broken contract: layers\na is not allowed to import b\nc is not allowed to import d\n"
+    seen = []
+
+    with patch("subprocess.Popen", fake_popen((output, 1))):
+        results = adapter.gather_results("src", on_diagnostic=seen.append)
+
+    assert [d.code for d in seen] == ["IL001", "IL001"]
+    assert len(results) == 2
+
 def test_gather_results_exception():
     adapter = ImportLinterAdapter()
-    with patch("subprocess.run", side_effect=Exception("Boom")):
+    with patch("subprocess.Popen", side_effect=Exception("Boom")):
         results = adapter.gather_results("src")
         assert len(results) == 1
         assert results[0].code == "IMPORT_LINTER_ERROR"
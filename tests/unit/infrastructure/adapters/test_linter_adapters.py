@@ -1,7 +1,21 @@
+import sys
 import unittest
-from unittest.mock import patch, MagicMock
-from clean_architecture_linter.infrastructure.adapters.linter_adapters import MypyAdapter, LinterResult
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+from clean_architecture_linter.infrastructure.adapters.linter_adapters import LinterResult, MypyAdapter
+from clean_architecture_linter.infrastructure.adapters.mypy_adapter import MYPY_CACHE_DIR
+from clean_architecture_linter.infrastructure.adapters.process_stream import ProcessLineStream
+
+
+def test_process_stream_keeps_stderr_apart():
+    stream = ProcessLineStream([sys.executable, "-c", "import sys; print('out'); sys.stderr.write('err'); sys.exit(2)"])
+    assert list(stream) == ["out\n"]
+    assert (stream.returncode, stream.stderr) == (2, "err")
+
+
+@pytest.mark.usefixtures("fake_popen")
 class TestMypyAdapter(unittest.TestCase):
     def setUp(self):
         self.adapter = MypyAdapter()
@@ -36,31 +50,105 @@ class TestMypyAdapter(unittest.TestCase):
         self.assertEqual(results[0].code, "MYPY")
         self.assertEqual(results[0].message, "Some generic error")
 
-    @patch('subprocess.run')
-    def test_gather_results_exception(self, mock_run):
-        mock_run.side_effect = Exception("System Error")
+    def test_parse_json_output(self):
+        mypy_output = (
+            '{"file": "src/a.py", "line": 3, "column": 4, "message": "Bad type", "hint": null, '
+            '"code": "assignment", "severity": "error"}\n'
+            '{"file": "src/a.py", "line": 3, "column": 4, "message": "See docs", "hint": null, '
+            '"code": null, "severity": "note"}\n'
+            '{"file": "src/b.py", "line": 9, "column": 0, "message": "No code", "hint": null, '
+            '"code": null, "severity": "error"}\n'
+        )
+        results = {r.code: r for r in self.adapter._parse_output(mypy_output)}
+
+        self.assertEqual(set(results), {"assignment", "MYPY"})
+        self.assertEqual(results["assignment"].locations, ["src/a.py:3"])
+        self.assertEqual(results["assignment"].diagnostics[0].column, 4)
+        self.assertEqual(results["MYPY"].message, "No code")
+
+    def test_gather_results_requests_json(self):
+        with patch("subprocess.Popen", self.fake_popen()) as mock_popen:
+            self.adapter.gather_results("src")
+        self.assertIn("json", mock_popen.call_args.args[0])
+
+    def test_gather_results_falls_back_to_text(self):
+        # Old mypy: usage error about -O (exit 2, nothing on stdout), then a text run.
+        popen = self.fake_popen(
+            ("", 2, "mypy: error: unrecognized arguments: -O json\n"),
+            ("src/file.py:1: error: msg  [code]\n", 1),
+        )
+        with patch("subprocess.Popen", popen):
+            results = self.adapter.gather_results("src")
+        self.assertEqual(popen.call_count, 2)
+        self.assertNotIn("json", popen.call_args.args[0])
+        self.assertEqual(results[0].code, "code")
+
+    def test_fatal_errors_are_not_retried_as_text(self):
+        popen = self.fake_popen(("", 2, "mypy: can't read file 'missing': No such file or directory\n"))
+        with patch("subprocess.Popen", popen):
+            self.assertEqual(self.adapter.gather_results("missing"), [])
+        self.assertEqual(popen.call_count, 1)
+
+    def test_cache_dir_is_kept_under_excelsior(self):
+        with patch("subprocess.Popen", self.fake_popen()) as mock_popen:
+            self.adapter.gather_results("src")
+        cmd = mock_popen.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("--cache-dir") + 1], str(MYPY_CACHE_DIR))
+
+    def test_daemon_mode_uses_dmypy_run(self):
+        adapter = MypyAdapter(mode="daemon")
+        with patch("subprocess.Popen", self.fake_popen(("Daemon started\n",))) as mock_popen:
+            adapter.gather_results("src")
+        cmd = mock_popen.call_args.args[0]
+        self.assertIn("mypy.dmypy", cmd)
+        self.assertEqual(cmd[cmd.index("run"):cmd.index("run") + 3], ["run", "--", "src"])
+
+    def test_api_mode_runs_in_process(self):
+        adapter = MypyAdapter(mode="api")
+        output = (
+            '{"file": "src/a.py", "line": 2, "column": 0, "message": "msg", "code": "code", "severity": "error"}\n'
+        )
+        # mypy is not a runtime dependency; stand in for mypy.api whether or not it is installed.
+        mock_run = MagicMock(return_value=(output, "", 1))
+        api = MagicMock(run=mock_run)
+        with patch.dict(sys.modules, {"mypy": MagicMock(api=api), "mypy.api": api}), \
+                patch("subprocess.Popen") as mock_popen:
+            results = adapter.gather_results("src")
+        mock_popen.assert_not_called()
+        self.assertIn("--strict", mock_run.call_args.args[0])
+        self.assertEqual(results[0].locations, ["src/a.py:2"])
+
+    def test_unknown_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            MypyAdapter(mode="fast")
+
+    @patch('subprocess.Popen')
+    def test_gather_results_exception(self, mock_popen):
+        mock_popen.side_effect = Exception("System Error")
         results = self.adapter.gather_results("src")
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].code, "MYPY_ERROR")
         self.assertIn("System Error", results[0].message)
 
-    @patch('subprocess.run')
-    def test_gather_results(self, mock_run):
-        mock_run.return_value = MagicMock(
-            stdout = "src/file.py:1: error: msg  [code]",
-            returncode = 1
+    def test_gather_results(self):
+        output = (
+            '{"file": "src/file.py", "line": 1, "column": 0, "message": "msg", "code": "code", "severity": "error"}\n'
         )
+        seen = []
+        with patch("subprocess.Popen", self.fake_popen((output, 1))):
+            results = self.adapter.gather_results("src", on_diagnostic=seen.append)
 
-        results = self.adapter.gather_results("src")
+        self.assertEqual(len(seen), 1)
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].code, "code")
         self.assertEqual(results[0].message, "msg")
         self.assertEqual(results[0].locations, ["src/file.py:1"])
 
+@pytest.mark.usefixtures("fake_popen")
 class TestExcelsiorAdapter(unittest.TestCase):
     def setUp(self):
         from clean_architecture_linter.infrastructure.adapters.linter_adapters import ExcelsiorAdapter
-        self.adapter = ExcelsiorAdapter()
+        self.adapter = ExcelsiorAdapter(in_process=False)
 
     def test_parse_output(self):
         output = "src/domain/user.py:10: W9001: Dependency violation (dependency-violation)\n"
@@ -69,22 +157,74 @@ class TestExcelsiorAdapter(unittest.TestCase):
         self.assertEqual(results[0].code, "W9001")
         self.assertEqual(results[0].message, "Dependency violation (dependency-violation)")
 
-    @patch('subprocess.run')
-    def test_gather_results(self, mock_run):
-        mock_run.return_value = MagicMock(
-            stdout = "src/domain/user.py:10: W9001: msg\n",
-            returncode = 1
+    def test_parse_json_output(self):
+        output = (
+            "\x1b[31m\n  BANNER [ v2 ]\n\x1b[0m\n"
+            "[\n"
+            "    {\n"
+            '        "line": 10, "column": 4, "path": "src/domain/user.py",\n'
+            '        "symbol": "clean-arch-dependency", "message": "First", "message-id": "W9001"\n'
+            "    },\n"
+            '    {"line": 2, "column": 0, "path": "src/a.py", "symbol": "clean-arch-dependency",'
+            ' "message": "Second", "message-id": "W9001"}\n'
+            "]\n"
         )
-        results = self.adapter.gather_results("src")
+        results = self.adapter._parse_output(output)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].locations, ["src/a.py:2", "src/domain/user.py:10"])
+        self.assertEqual(
+            [d.message for d in results[0].diagnostics],
+            ["Second (clean-arch-dependency)", "First (clean-arch-dependency)"],
+        )
+
+    def test_gather_results(self):
+        output = (
+            '[{"line": 10, "column": 0, "path": "src/domain/user.py", "symbol": "s", "message": "msg", '
+            '"message-id": "W9001"}]\n'
+        )
+        with patch("subprocess.Popen", self.fake_popen((output, 1))) as mock_popen:
+            results = self.adapter.gather_results("src")
+        self.assertIn("--output-format=json", mock_popen.call_args.args[0])
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].code, "W9001")
 
-    @patch('subprocess.run')
+    @patch('subprocess.Popen')
     def test_gather_results_exception(self, mock_run):
         mock_run.side_effect = Exception("Pylint Failed")
         results = self.adapter.gather_results("src")
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].code, "EXCELSIOR_ERROR")
 
+class TestExcelsiorAdapterInProcess(unittest.TestCase):
+    def setUp(self):
+        from clean_architecture_linter.infrastructure.adapters.linter_adapters import ExcelsiorAdapter
+        self.adapter = ExcelsiorAdapter()
+
+    def _message(self, path, line, msg_id="W9006", symbol="clean-arch-demeter"):
+        return MagicMock(path=path, line=line, msg_id=msg_id, msg="Law of Demeter", symbol=symbol)
+
+    @patch("pylint.lint.Run")
+    def test_gather_results_collects_messages(self, mock_run):
+        def fake_run(args, reporter=None, exit=True):
+            reporter.handle_message(self._message("src/b.py", 3))
+            reporter.handle_message(self._message("src/a.py", 7))
+
+        mock_run.side_effect = fake_run
+        seen = []
+        results = self.adapter.gather_results("src", on_diagnostic=seen.append)
+
+        self.assertEqual([d.path for d in seen], ["src/b.py", "src/a.py"])
+        self.assertFalse(mock_run.call_args.kwargs["exit"])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0].code, "W9006")
+        self.assertEqual(results[0].message, "Law of Demeter (clean-arch-demeter)")
+        self.assertEqual(results[0].locations, ["src/a.py:7", "src/b.py:3"])
+
+    @patch("pylint.lint.Run")
+    def test_gather_results_system_exit(self, mock_run):
+        mock_run.side_effect = SystemExit(32)
+        results = self.adapter.gather_results("src")
+        self.assertEqual(results[0].code, "EXCELSIOR_ERROR")
+
 if __name__ == "__main__":
     unittest.main()
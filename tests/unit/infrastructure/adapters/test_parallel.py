@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from clean_architecture_linter.domain.entities import Diagnostic
+from clean_architecture_linter.infrastructure.adapters import parallel
+from clean_architecture_linter.infrastructure.adapters.excelsior_adapter import ExcelsiorAdapter
+from clean_architecture_linter.infrastructure.adapters.parallel import default_workers, shard_by_package
+
+
+def _tree(tmp_path, layout):
+    files = []
+    for name, size in layout.items():
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("#" * size)
+        files.append(str(path))
+    return files
+
+
+def test_shard_by_package_keeps_packages_together(tmp_path):
+    files = _tree(tmp_path, {"big/a.py": 900, "big/b.py": 900, "mid/c.py": 1000, "small/d.py": 10, "small/e.py": 10})
+
+    shards = shard_by_package(files, 2)
+
+    assert shards == [sorted(files[:2]), sorted(files[2:])]
+    assert shards == shard_by_package(list(reversed(files)), 2)
+
+
+def test_shard_by_package_never_returns_empty_shards(tmp_path):
+    files = _tree(tmp_path, {"only/a.py": 1, "only/b.py": 1})
+    assert shard_by_package(files, 8) == [sorted(files)]
+
+
+def test_default_workers_is_bounded_by_cpus_memory_and_work():
+    with patch.object(parallel, "available_cpus", return_value=16), patch.object(
+        parallel, "available_memory", return_value=3 * parallel.WORKER_MEMORY_BYTES
+    ):
+        assert default_workers(5) == 1
+        assert default_workers(100 * parallel.MIN_FILES_PER_WORKER) == 3
+    with patch.object(parallel, "available_cpus", return_value=4), patch.object(
+        parallel, "available_memory", return_value=None
+    ):
+        assert default_workers(100 * parallel.MIN_FILES_PER_WORKER) == 4
+
+
+def test_parallel_lint_merges_in_shard_order(tmp_path):
+    files = _tree(tmp_path, {"p1/a.py": 10, "p2/b.py": 10})
+    adapter = ExcelsiorAdapter(jobs=2)
+    results = {
+        0: ([Diagnostic("W9001", "m", files[0], 1)], {files[0]: [files[1]]}, []),
+        1: ([Diagnostic("W9006", "m", files[1], 2)], {files[1]: []}, [files[1]]),
+    }
+
+    class FakePool:
+        def __init__(self, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, shards):
+            # Workers may finish in any order; map() still returns in submission order.
+            return [results[index] for index, _ in enumerate(shards)]
+
+    with patch(
+        "clean_architecture_linter.infrastructure.adapters.excelsior_adapter.ProcessPoolExecutor", FakePool
+    ):
+        diagnostics = list(adapter.lint([str(tmp_path)]))
+
+    assert [d.code for d in diagnostics] == ["W9001", "W9006"]
+    assert adapter._project_dependencies(files[0], set(files)) == {files[1]}
+    assert not adapter._is_degraded(files[0]) and adapter._is_degraded(files[1])
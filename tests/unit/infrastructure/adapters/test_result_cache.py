@@ -0,0 +1,124 @@
+from unittest.mock import MagicMock, patch
+
+from clean_architecture_linter.domain.entities import Diagnostic
+from clean_architecture_linter.infrastructure.adapters.excelsior_adapter import ExcelsiorAdapter
+from clean_architecture_linter.infrastructure.adapters.result_cache import (
+    ResultCache,
+    config_fingerprint,
+    pylint_settings,
+)
+
+
+def test_roundtrip_and_content_invalidation(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    cache = ResultCache("fp", tmp_path / "cache")
+    diagnostic = Diagnostic("W9001", "msg", str(source), 1)
+
+    assert cache.lookup(str(source)) is None
+    cache.store(str(source), [diagnostic])
+    assert cache.lookup(str(source)) == [diagnostic]
+
+    source.write_text("x = 2\n")
+    assert cache.lookup(str(source)) is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_fingerprint_change_invalidates(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    ResultCache("old", tmp_path / "cache").store(str(source), [])
+
+    assert ResultCache("old", tmp_path / "cache").lookup(str(source)) == []
+    assert ResultCache("new", tmp_path / "cache").lookup(str(source)) is None
+
+
+def test_config_fingerprint_depends_on_config_and_version():
+    settings = {"pylint": "3.0", "enabled": ["W9006"]}
+    base = config_fingerprint({"layer_map": {"Domain": "domain"}}, "1.0", settings)
+    assert base == config_fingerprint({"layer_map": {"Domain": "domain"}}, "1.0", settings)
+    assert base != config_fingerprint({"layer_map": {"Domain": "core"}}, "1.0", settings)
+    assert base != config_fingerprint({"layer_map": {"Domain": "domain"}}, "1.1", settings)
+    assert base != config_fingerprint({"layer_map": {"Domain": "domain"}}, "1.0", {**settings, "enabled": []})
+
+
+def test_pylint_settings_follow_the_config_file_without_loading_it(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "pyproject.toml").write_text("[tool.pylint.main]\njobs = 1\n")
+    enabled = pylint_settings()
+
+    # A configuration pylint itself would reject still yields a fingerprint.
+    (tmp_path / "pyproject.toml").write_text(
+        '[tool.pylint.messages_control]\ndisable = ["clean-arch-demeter"]\n'
+        '[tool.pylint.reports]\noutput-format = "colorized,json"\n'
+    )
+    disabled = pylint_settings()
+
+    assert enabled["config_file"] == disabled["config_file"]
+    assert {"pylint", "astroid"} <= set(enabled)
+    assert config_fingerprint({}, "1.0", enabled) != config_fingerprint({}, "1.0", disabled)
+
+
+def test_adapter_only_lints_changed_files(tmp_path):
+    pkg = tmp_path / "src"
+    pkg.mkdir()
+    for name in ("a.py", "b.py"):
+        (pkg / name).write_text("x = 1\n")
+    adapter = ExcelsiorAdapter(cache=ResultCache("fp", tmp_path / "cache"))
+    calls = []
+
+    def fake_pylint(targets):
+        calls.append(targets)
+        a_path = str(pkg / "a.py")
+        linted = any(a_path.startswith(target) for target in targets)
+        return iter([Diagnostic("W9001", "msg", a_path, 1)] if linted else [])
+
+    with patch.object(adapter, "lint", side_effect=fake_pylint):
+        first = list(adapter.iter_diagnostics(str(pkg)))
+        (pkg / "b.py").write_text("x = 2\n")
+        second = list(adapter.iter_diagnostics(str(pkg)))
+
+    # Cold cache lints the target as given; afterwards only the edited file is re-linted.
+    assert calls == [[str(pkg)], [str(pkg / "b.py")]]
+    assert first == second
+    # Replayed diagnostics keep the fingerprint computed when the file was linted.
+    assert second[0].fingerprint and second[0].fingerprint == first[0].fingerprint
+
+
+def test_adapter_does_not_cache_files_analysed_over_budget(tmp_path):
+    for name in ("a.py", "b.py"):
+        (tmp_path / name).write_text("x = 1\n")
+    tracker = MagicMock()
+    tracker.dependencies_of.return_value = set()
+    tracker.is_degraded.side_effect = lambda path: path.endswith("a.py")
+    adapter = ExcelsiorAdapter(cache=ResultCache("fp", tmp_path / "cache"), dependency_tracker=tracker)
+    calls = []
+
+    def fake_pylint(targets):
+        calls.append(targets)
+        return iter([])
+
+    with patch.object(adapter, "lint", side_effect=fake_pylint):
+        list(adapter.iter_diagnostics(str(tmp_path)))
+        list(adapter.iter_diagnostics(str(tmp_path)))
+
+    # The degraded file stays stale and is analysed again on the next run.
+    assert calls == [[str(tmp_path)], [str(tmp_path / "a.py")]]
+
+
+def test_dependency_change_invalidates_reverse_closure(tmp_path):
+    files = {name: tmp_path / f"{name}.py" for name in ("a", "b", "c", "d")}
+    for path in files.values():
+        path.write_text("x = 1\n")
+    cache = ResultCache("fp", tmp_path / "cache")
+    # a -> b -> c; d is unrelated.
+    cache.store(str(files["a"]), [], [str(files["b"])])
+    cache.store(str(files["b"]), [], [str(files["c"])])
+    cache.store(str(files["c"]), [])
+    cache.store(str(files["d"]), [Diagnostic("W9001", "msg", str(files["d"]), 1)])
+
+    files["c"].write_text("x = 2\n")
+    replayed, stale = cache.partition([str(p) for p in files.values()])
+
+    assert sorted(stale) == sorted(str(files[n]) for n in ("a", "b", "c"))
+    assert [d.path for d in replayed] == [str(files["d"])]
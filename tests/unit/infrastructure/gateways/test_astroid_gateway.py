@@ -1,6 +1,8 @@
+import sys
 import astroid
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, PropertyMock
+from clean_architecture_linter.config import ConfigurationLoader, InferenceBudget
 from clean_architecture_linter.infrastructure.gateways.astroid_gateway import AstroidGateway
 
 def test_resolve_simple_annotation_name():
@@ -231,3 +233,188 @@ def test_is_primitive_union():
     # "int | str | None"
     assert gateway.is_primitive("builtins.int | builtins.str | builtins.NoneType") is True
     assert gateway.is_primitive("builtins.int | Unsafe") is False
+
+def test_records_cross_module_dependencies(tmp_path):
+    gateway = AstroidGateway()
+    base = tmp_path / "dep_base.py"
+    base.write_text("class Base:\n    def name(self) -> str:\n        return ''\n")
+    # dep_mid only re-exports Base; dep_user never imports dep_base itself.
+    mid = tmp_path / "dep_mid.py"
+    mid.write_text("from dep_base import Base\n")
+    user = tmp_path / "dep_user.py"
+    user.write_text("from dep_mid import Base\nBase().name()\n")
+
+    with patch("sys.path", [str(tmp_path), *sys.path]):
+        module = astroid.MANAGER.ast_from_file(str(user), "dep_user")
+        call = module.body[-1].value
+        assert gateway.get_node_return_type_qname(call) == "builtins.str"
+
+        assert gateway.dependencies_of(str(user)) == {str(mid), str(base)}
+        # Import edges are structural; only the recorded inference is forgotten.
+        gateway.reset_dependencies()
+        assert gateway.dependencies_of(str(user)) == {str(mid)}
+
+def test_memoizes_queries_until_cleared():
+    gateway = AstroidGateway()
+    call = astroid.extract_node("'a b'.split()")
+
+    first = gateway.get_return_type_qname_from_expr(call)
+    assert gateway.get_return_type_qname_from_expr(call) == first
+    # Answered during the first query, which delegated to it.
+    assert gateway.get_node_return_type_qname(call) == first
+    stats = gateway.memo_stats()
+    assert stats["hits"] == 2
+    assert stats["cached"] == stats["misses"]
+
+    gateway.clear_memo()
+    with patch.object(gateway, "_discovery_fallback", return_value="builtins.list") as fallback:
+        assert gateway.get_node_return_type_qname(call) == "builtins.list"
+        assert gateway.get_node_return_type_qname(call) == "builtins.list"
+    assert fallback.call_count == 1
+    assert gateway.memo_stats() == {"hits": 3, "misses": stats["misses"] + 1, "cached": 1}
+
+def test_memo_is_bypassed_for_explicit_visited_sets():
+    gateway = AstroidGateway()
+    name = astroid.extract_node("x = 1\nx #@")
+
+    gateway.get_return_type_qname_from_expr(name, {id(name)})
+    gateway.get_return_type_qname_from_expr(name, set())
+
+    assert gateway.memo_stats()["hits"] == 0
+
+def test_caches_annotations_by_source_and_bindings():
+    gateway = AstroidGateway()
+    module = astroid.parse(
+        "from typing import Optional\n"
+        "def a(x: Optional[str]): ...\n"
+        "def b(x: Optional[str]): ...\n"
+        "def c(str: int, x: Optional[str]): ...\n"
+    )
+    first, second, shadowed = (module.body[i].args.annotations[-1] for i in (1, 2, 3))
+
+    assert gateway._resolve_annotation(first) == "builtins.str"
+    spent = gateway.inference_calls
+    with patch.object(gateway, "_infer") as infer:
+        assert gateway._resolve_annotation(second) == "builtins.str"
+    infer.assert_not_called()
+    # The inner `str` was cached on the way too.
+    assert gateway.annotation_stats() == {"hits": 1, "misses": 2, "cached": 2, "inferences_saved": spent}
+
+    # `str` is bound to a parameter here, so the same source is resolved afresh.
+    gateway._resolve_annotation(shadowed)
+    assert gateway.annotation_stats()["cached"] == 4
+
+    gateway.clear_memo()
+    assert gateway.annotation_stats()["cached"] == 0
+
+def test_chain_links_are_analysed_once():
+    gateway = AstroidGateway()
+    outer = astroid.extract_node("'a'" + ".strip()" * 40)
+    links = []
+    node = outer
+    while isinstance(node, astroid.nodes.Call):
+        links.append(node)
+        node = node.func.expr
+
+    with patch.object(gateway, "_returns_receiver_type", wraps=gateway._returns_receiver_type) as matches, \
+            patch.object(gateway, "_is_protocol_receiver", wraps=gateway._is_protocol_receiver) as protocols:
+        assert gateway.is_fluent_call(outer) is True
+        assert all(gateway.is_fluent_call(link) for link in links)
+        assert not any(gateway.is_protocol_call(link) for link in links)
+
+    # Only the innermost call is matched; every outer link inherits its verdict.
+    assert matches.call_count == 1
+    assert protocols.call_count == len(links)
+
+def test_chain_verdicts_match_for_inner_calls_analysed_first():
+    code = "class Builder:\n    def add(self) -> 'Builder':\n        return self\nBuilder().add().add() #@"
+    outer_first = AstroidGateway()
+    outer = astroid.extract_node(code)
+    inner = outer.func.expr
+    assert [outer_first.is_fluent_call(outer), outer_first.is_fluent_call(inner)] == [True, True]
+
+    inner_first = AstroidGateway()
+    outer = astroid.extract_node(code)
+    inner = outer.func.expr
+    assert [inner_first.is_fluent_call(inner), inner_first.is_fluent_call(outer)] == [True, True]
+
+def test_summarises_unannotated_returns_bottom_up():
+    gateway = AstroidGateway()
+    module = astroid.parse(
+        "class Service: ...\n"
+        "def make(): return Service()\n"
+        "def build(): return make()\n"
+        "def ping(n):\n    if n:\n        return pong(n - 1)\n    return 'ping'\n"
+        "def pong(n): return ping(n)\n"
+        "def maybe(n):\n    if n:\n        return 1\n"
+        "build() #@\n"
+        "pong(3) #@\n"
+        "maybe(1) #@\n"
+    )
+    build_call, pong_call, maybe_call = [stmt.value for stmt in module.body[-3:]]
+
+    with patch.object(gateway, "_return_terms", wraps=gateway._return_terms) as read:
+        assert gateway._discover_from_call(build_call) == f"{module.name}.Service"
+        assert gateway._discover_from_call(build_call) == f"{module.name}.Service"
+        # ping and pong call each other: one component, settled together.
+        assert gateway._discover_from_call(pong_call) == "builtins.str"
+        # Falling off the end returns None, which conflicts with int.
+        assert gateway._discover_from_call(maybe_call) is None
+    assert read.call_count == 5
+
+def _budget(**limits):
+    return patch.object(ConfigurationLoader, "inference_budget", new_callable=PropertyMock,
+                        return_value=InferenceBudget(**limits))
+
+def test_module_over_budget_falls_back_and_is_reported_degraded(tmp_path):
+    path = str(tmp_path / "service.py")
+    module = astroid.parse("class Service: ...\nx = Service()\ny = Service()\n", path=path)
+    first, second = module.body[1].value, module.body[2].value
+    other = astroid.extract_node("int #@")
+
+    with _budget(module_steps=1):
+        gateway = AstroidGateway()
+        assert gateway.get_node_return_type_qname(first.func) == f"{module.name}.Service"
+        # The module's steps are spent: the second inference fails without running.
+        with patch.object(astroid.nodes.Name, "infer") as infer:
+            assert gateway.get_node_return_type_qname(second.func) is None
+        infer.assert_not_called()
+
+    # Moving on to another module releases the budget but remembers the degradation.
+    assert [inferred.name for inferred in gateway.infer(other)] == ["int"]
+    assert gateway.inference_degradation(module) == "module over 1 inference steps"
+    assert gateway.is_degraded(path)
+    assert not gateway.is_degraded(str(tmp_path / "other.py"))
+    # A new run starts every module with a fresh budget.
+    gateway.reset_dependencies()
+    assert gateway.inference_degradation(module) is None
+
+def test_node_over_budget_is_cut_short_alone():
+    module = astroid.parse(
+        "def pick(n):\n    if n:\n        return 1\n    if n > 1:\n        return 'a'\n    return 2.0\n"
+        "pick(1) #@\n"
+        "int #@\n"
+    )
+    call, name = module.body[-2].value, module.body[-1].value
+
+    with _budget(node_steps=2):
+        gateway = AstroidGateway()
+        with pytest.raises(astroid.InferenceError):
+            list(gateway.infer(call))
+        assert [inferred.name for inferred in gateway.infer(name)] == ["int"]
+
+    assert gateway.inference_degradation(module) == "1 node(s) over 2 steps"
+
+def test_default_node_budget_trips_below_astroids_own_cap():
+    # Ten names with two candidate values each: astroid gives up on the sum at
+    # InferenceContext.max_inferred, and the default budget has to stop it first.
+    source = "import random\n" + "".join(f"x{i} = 1 if random.random() else 2.0\n" for i in range(10))
+    module = astroid.parse(source + "total = " + " + ".join(f"x{i}" for i in range(10)) + "\n")
+    assert InferenceBudget().node_steps < astroid.context.InferenceContext.max_inferred
+
+    with _budget():
+        gateway = AstroidGateway()
+        with pytest.raises(astroid.InferenceError):
+            list(gateway.infer(module.body[-1].value))
+
+    assert gateway.inference_degradation(module) == f"1 node(s) over {InferenceBudget().node_steps} steps"
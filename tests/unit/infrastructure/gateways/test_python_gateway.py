@@ -0,0 +1,38 @@
+import sys
+from unittest.mock import patch
+
+import astroid
+
+from clean_architecture_linter.infrastructure.gateways.python_gateway import ModuleLocator, PythonGateway
+
+
+def test_stdlib_detection_never_builds_modules():
+    gateway = PythonGateway(stdlib_modules=frozenset())
+
+    with patch.object(astroid.MANAGER, "ast_from_module_name") as build:
+        assert gateway.is_std_lib_module("json.decoder") is True
+        assert gateway.is_std_lib_module("excelsior_no_such_module") is False
+    build.assert_not_called()
+
+
+def test_locator_caches_misses_and_evicts_least_recent():
+    locator = ModuleLocator(maxsize=2)
+
+    assert locator.locate("excelsior_no_such_module") is None
+    assert locator.locate("excelsior_no_such_module") is None
+    assert locator.locate("json").endswith("__init__.py")
+    assert locator.locate("json.decoder").endswith("decoder.py")
+    assert (locator.hits, locator.misses) == (1, 3)
+
+    # The missing module was least recently used and has been evicted.
+    assert locator.locate("excelsior_no_such_module") is None
+    assert locator.misses == 4
+
+
+def test_locator_forgets_answers_when_sys_path_changes(tmp_path):
+    locator = ModuleLocator()
+    assert locator.locate("excelsior_local_module") is None
+
+    (tmp_path / "excelsior_local_module.py").write_text("", encoding="utf-8")
+    with patch("sys.path", [str(tmp_path), *sys.path]):
+        assert locator.locate("excelsior_local_module") == str(tmp_path / "excelsior_local_module.py")
@@ -1,6 +1,10 @@
 import unittest
-from unittest.mock import MagicMock, patch
-from clean_architecture_linter.infrastructure.typeshed_integration import TypeshedService
+from unittest.mock import patch
+from clean_architecture_linter.infrastructure.typeshed_integration import (
+    STDLIB_SNAPSHOT,
+    TypeshedService,
+    parse_stdlib_versions,
+)
 
 class TestTypeshedService(unittest.TestCase):
     def setUp(self):
@@ -9,51 +13,41 @@ class TestTypeshedService(unittest.TestCase):
         self.service = TypeshedService()
 
     @patch("clean_architecture_linter.infrastructure.typeshed_integration.finder")
-    def test_is_stdlib_module_found_stdlib_path(self, mock_finder):
-        # Scenario 1: Path contains 'stdlib' and 'site-packages'
-        mock_stub = MagicMock()
-        mock_stub.__str__.return_value: str = "/usr/lib/python3.11/site-packages/typeshed_client/typeshed/stdlib/re.pyi"
-        mock_finder.get_stub_file.return_value = mock_stub
-
+    def test_is_stdlib_module_is_a_table_lookup(self, mock_finder):
         self.assertTrue(self.service.is_stdlib_module("re"))
-        mock_finder.get_stub_file.assert_called_with("re")
-
-    @patch("clean_architecture_linter.infrastructure.typeshed_integration.finder")
-    def test_is_stdlib_module_bundled_typeshed(self, mock_finder):
-        # Scenario 2: Bundled typeshed structure
-        mock_stub = MagicMock()
-        mock_stub.__str__.return_value: str = "/site-packages/typeshed_client/typeshed/os/__init__.pyi"
-        mock_finder.get_stub_file.return_value = mock_stub
-
         self.assertTrue(self.service.is_stdlib_module("os"))
-
-    @patch("clean_architecture_linter.infrastructure.typeshed_integration.finder")
-    def test_is_stdlib_module_bundled_stubs(self, mock_finder):
-        # Scenario 3: Bundled 3rd party stubs (should be False)
-        mock_stub = MagicMock()
-        mock_stub.__str__.return_value: str = "/site-packages/typeshed_client/typeshed/stubs/yaml/__init__.pyi"
-        mock_finder.get_stub_file.return_value = mock_stub
-
-        self.assertFalse(self.service.is_stdlib_module("yaml"))
-
-    @patch("clean_architecture_linter.infrastructure.typeshed_integration.finder")
-    def test_is_stdlib_module_system_typeshed(self, mock_finder):
-        # Scenario 4: System typeshed path
-        mock_stub = MagicMock()
-        mock_stub.__str__.return_value: str = "/usr/share/typeshed/stdlib/json.pyi"
-        mock_finder.get_stub_file.return_value = mock_stub
-
+        self.assertTrue(self.service.is_stdlib_module("os.path"))
         self.assertTrue(self.service.is_stdlib_module("json"))
-
-    @patch("clean_architecture_linter.infrastructure.typeshed_integration.finder")
-    def test_is_stdlib_module_not_found(self, mock_finder):
-        mock_finder.get_stub_file.return_value = None
+        self.assertFalse(self.service.is_stdlib_module("yaml"))
         self.assertFalse(self.service.is_stdlib_module("unknown_module"))
+        self.assertFalse(self.service.is_stdlib_module("clean_architecture_linter"))
+        mock_finder.get_stub_file.assert_not_called()
 
-    @patch("clean_architecture_linter.infrastructure.typeshed_integration.finder")
-    def test_is_stdlib_module_error(self, mock_finder):
-        mock_finder.get_stub_file.side_effect = ImportError("typeshed not installed")
-        self.assertFalse(self.service.is_stdlib_module("re"))
+    def test_snapshot_is_loaded_without_typeshed(self):
+        TypeshedService._instance = None
+        with patch("clean_architecture_linter.infrastructure.typeshed_integration.finder") as mock_finder:
+            service = TypeshedService()
+        mock_finder.get_search_context.assert_not_called()
+        self.assertTrue(STDLIB_SNAPSHOT.is_file())
+        self.assertTrue(service.is_stdlib_module("asyncio"))
+
+    def test_parse_stdlib_versions_applies_version_ranges(self):
+        lines = ["# comment", "", "asyncio: 3.4-", "asyncio.taskgroups: 3.11-", "distutils: 3.0-3.11"]
+
+        available, retired = parse_stdlib_versions(lines, (3, 10))
+        self.assertEqual(available, {"asyncio", "distutils"})
+        self.assertEqual(retired, {"asyncio.taskgroups"})
+
+        available, retired = parse_stdlib_versions(lines, (3, 12))
+        self.assertEqual(available, {"asyncio", "asyncio.taskgroups"})
+        self.assertEqual(retired, {"distutils"})
+
+    def test_unlisted_submodules_follow_their_parent(self):
+        with patch.object(TypeshedService, "_stdlib_modules", frozenset({"asyncio"})), \
+                patch.object(TypeshedService, "_retired_modules", frozenset({"asyncio.taskgroups"})):
+            self.assertTrue(self.service.is_stdlib_module("asyncio.tasks"))
+            self.assertFalse(self.service.is_stdlib_module("asyncio.taskgroups"))
+            self.assertFalse(self.service.is_stdlib_module("asyncio.taskgroups.impl"))
 
     def test_is_stdlib_qname(self):
         with patch.object(self.service, "is_stdlib_module") as mock_is_mod:
@@ -0,0 +1,81 @@
+import os
+
+import astroid
+from astroid.manager import AstroidManager
+from astroid.util import Uninferable
+
+from clean_architecture_linter.infrastructure.ast_cache import AstCache
+
+
+def _rebuild(name, path):
+    """Build name from path as if astroid met it for the first time, leaving the shared cache as it was."""
+    previous = astroid.MANAGER.astroid_cache.pop(name, None)
+    try:
+        return astroid.MANAGER.ast_from_file(path, name)
+    finally:
+        if previous is not None:
+            astroid.MANAGER.astroid_cache[name] = previous
+
+
+def test_stdlib_modules_are_loaded_from_disk_on_the_next_run(tmp_path):
+    path = astroid.MANAGER.ast_from_module_name("json.decoder").file
+    original = AstroidManager.ast_from_file
+    cache, warm = AstCache(tmp_path), AstCache(tmp_path)
+    cache.install()
+    try:
+        built = _rebuild("json.decoder", path)
+        assert cache.stats() == (0, 1, 1)
+
+        cache.uninstall()
+        warm.install()
+        loaded = _rebuild("json.decoder", path)
+    finally:
+        cache.uninstall()
+        warm.uninstall()
+
+    assert warm.stats() == (1, 0, 0)
+    assert loaded is not built
+    assert loaded.file == path
+    assert [c.name for c in loaded.nodes_of_class(astroid.nodes.ClassDef)] == ["JSONDecodeError", "JSONDecoder"]
+    assert AstroidManager.ast_from_file is original
+
+
+def test_edited_stub_is_rebuilt(tmp_path):
+    stub = tmp_path / "excelsior_stub.pyi"
+    stub.write_text("def run() -> int: ...\n", encoding="utf-8")
+    cache = AstCache(tmp_path / "cache")
+    cache.install()
+    try:
+        _rebuild("excelsior_stub", str(stub))
+        stub.write_text("def run() -> str: ...\n", encoding="utf-8")
+        module = _rebuild("excelsior_stub", str(stub))
+    finally:
+        cache.uninstall()
+        astroid.MANAGER.astroid_cache.pop("excelsior_stub", None)
+
+    assert cache.stats() == (0, 2, 2)
+    assert module.body[0].returns.as_string() == "str"
+
+
+def test_uninferable_survives_the_round_trip(tmp_path):
+    source = tmp_path / "excelsior_uninferable.pyi"
+    source.write_text("x = 1\n", encoding="utf-8")
+    cache = AstCache(tmp_path / "cache")
+    module = astroid.MANAGER.ast_from_file(str(source), "excelsior_uninferable")
+    astroid.MANAGER.astroid_cache.pop("excelsior_uninferable", None)
+    module.body[0].targets[0].marker = Uninferable
+    entry = cache._entry(astroid.MANAGER, str(source), "excelsior_uninferable")
+
+    cache._store(entry, module)
+    loaded = cache._load(entry)
+
+    assert loaded.body[0].targets[0].marker is Uninferable
+
+
+def test_project_and_site_packages_files_are_not_cached(tmp_path):
+    cache = AstCache(tmp_path)
+
+    assert cache.cacheable(os.__file__)
+    assert cache.cacheable(str(tmp_path / "module.pyi"))
+    assert not cache.cacheable(str(tmp_path / "module.py"))
+    assert not cache.cacheable(astroid.__file__)
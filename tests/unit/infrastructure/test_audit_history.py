@@ -0,0 +1,123 @@
+import sqlite3
+
+import pytest
+
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+from clean_architecture_linter.infrastructure.audit_history import AuditHistory
+
+
+def _record(history, architectural, type_integrity=()):
+    run_id = history.begin_run("src")
+    history.record_results(run_id, "architectural", architectural)
+    history.record_results(run_id, "type_integrity", list(type_integrity))
+    history.finish_run(run_id)
+    return run_id
+
+
+@pytest.fixture
+def history(tmp_path):
+    with AuditHistory(tmp_path / "history.sqlite3") as store:
+        yield store
+
+
+def test_runs_report_totals_per_category(history):
+    _record(history, [LinterResult("W9006", "demeter", ["a.py:1", "a.py:2"])], [LinterResult("MYPY", "t", ["b.py:3"])])
+    _record(history, [LinterResult("W9006", "demeter", ["a.py:1"])])
+
+    runs = history.runs()
+
+    assert [(r["architectural"], r.get("type_integrity")) for r in runs] == [(2, 1), (1, None)]
+
+
+def test_every_diagnostic_is_a_row_and_tool_failures_mark_the_run(history):
+    same_line = [Diagnostic("W9006", "demeter", "a.py", 1), Diagnostic("W9006", "demeter", "a.py", 1, 8)]
+    contract = Diagnostic("IL001", "Broken contract: layers", "", 0)
+    run_id = history.begin_run("src")
+    history.record_results(run_id, "architectural", LinterResult.group(same_line))
+    history.record_results(run_id, "contracts", [LinterResult(contract.code, contract.message, [], [contract])])
+    history.record_results(run_id, "type_integrity", [LinterResult("MYPY_ERROR", "mypy crashed")])
+    history.finish_run(run_id)
+
+    [run] = history.runs()
+
+    assert (run["architectural"], run["contracts"], run.get("type_integrity")) == (2, 1, None)
+    assert run["failed"] == "type_integrity"
+    assert history.top_files() == [{"path": "a.py", "violations": 2}]
+
+
+def test_opens_version_1_history(tmp_path):
+    path = tmp_path / "history.sqlite3"
+    with sqlite3.connect(str(path)) as conn:
+        conn.executescript(
+            "CREATE TABLE runs (id INTEGER PRIMARY KEY, target TEXT NOT NULL, started_at REAL NOT NULL,"
+            " finished_at REAL);"
+            "CREATE TABLE rules (id INTEGER PRIMARY KEY, category TEXT NOT NULL, code TEXT NOT NULL,"
+            " message TEXT NOT NULL DEFAULT '', UNIQUE (category, code));"
+            "CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT NOT NULL UNIQUE);"
+            "CREATE TABLE locations (run_id INTEGER NOT NULL, rule_id INTEGER NOT NULL,"
+            " file_id INTEGER NOT NULL, line INTEGER);"
+            "INSERT INTO runs VALUES (1, 'src', 0, 1);"
+            "PRAGMA user_version = 1;"
+        )
+    conn.close()
+
+    with AuditHistory(path) as history:
+        _record(history, [LinterResult("IL001", "contract")])
+        assert [run["run"] for run in history.runs()] == [1, 2]
+
+
+def test_rule_trend_counts_zero_for_runs_without_the_rule(history):
+    _record(history, [LinterResult("W9006", "demeter", ["a.py:1", "b.py:1"])])
+    _record(history, [LinterResult("W9001", "boundary", ["a.py:1"])])
+
+    assert [r["violations"] for r in history.rule_trend("W9006")] == [2, 0]
+
+
+def test_top_files_and_regressions(history):
+    _record(history, [LinterResult("W9006", "demeter", ["a.py:1", "b.py:1"])])
+    _record(history, [
+        LinterResult("W9006", "demeter", ["a.py:1", "a.py:5", "a.py:9", "c.py:2"]),
+        LinterResult("W9001", "boundary", ["b.py:1", "b.py:2"]),
+    ])
+
+    assert history.top_files(limit=2) == [{"path": "a.py", "violations": 3}, {"path": "b.py", "violations": 2}]
+    assert history.top_files("W9001") == [{"path": "b.py", "violations": 2}]
+    assert history.regressions("W9006") == [
+        {"path": "a.py", "before": 1, "after": 3},
+        {"path": "c.py", "before": 0, "after": 1},
+    ]
+    assert history.regressions() == [
+        {"path": "a.py", "before": 1, "after": 3},
+        {"path": "b.py", "before": 1, "after": 2},
+        {"path": "c.py", "before": 0, "after": 1},
+    ]
+
+
+def test_unfinished_run_is_rolled_back(tmp_path):
+    path = tmp_path / "history.sqlite3"
+    with AuditHistory(path) as history:
+        _record(history, [LinterResult("W9006", "demeter", ["a.py:1"])])
+        history.record_results(history.begin_run("src"), "architectural", [LinterResult("W9006", "d", ["a.py:2"])])
+
+    with AuditHistory(path) as history:
+        assert [r["run"] for r in history.runs()] == [1]
+        assert history.top_files() == [{"path": "a.py", "violations": 1}]
+
+
+def test_prune_keeps_newest_runs(history):
+    for _ in range(3):
+        _record(history, [LinterResult("W9006", "demeter", ["a.py:1"])])
+
+    assert history.prune(1) == 2
+    assert [r["run"] for r in history.runs()] == [3]
+    assert history.rule_trend("W9006") == [{"run": 3, "started_at": history.runs()[0]["started_at"], "violations": 1}]
+
+
+def test_incompatible_schema_is_rejected(tmp_path):
+    path = tmp_path / "history.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.execute("PRAGMA user_version = 99")
+    conn.close()
+
+    with pytest.raises(sqlite3.DatabaseError):
+        AuditHistory(path)
@@ -0,0 +1,123 @@
+import gzip
+import json
+
+import pytest
+
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+from clean_architecture_linter.infrastructure.audit_trail import (
+    AuditTrailWriter,
+    audit_trail_path,
+    find_audit_trail,
+    iter_audit_records,
+    load_audit_records,
+)
+
+
+def _write_trail(path):
+    with AuditTrailWriter(path) as trail:
+        trail.write_results("architectural", [LinterResult("W9001", "boundary", ["a.py:1", "b.py:2"])])
+        trail.write_results("type_integrity", [])
+        trail.write_summary({"architectural": 1.23456})
+    return trail
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "lzma"])
+def test_round_trip_in_each_compression(tmp_path, compression):
+    path = audit_trail_path(compression, tmp_path)
+    _write_trail(path)
+
+    records = list(iter_audit_records(path))
+
+    assert [r["type"] for r in records] == ["header", "violation", "summary"]
+    assert records[1] == {
+        "type": "violation",
+        "category": "architectural",
+        "code": "W9001",
+        "message": "boundary",
+        "locations": ["a.py:1", "b.py:2"],
+    }
+    assert records[2]["summary"] == {"architectural": 1, "type_integrity": 0}
+    assert records[2]["timings"] == {"architectural": 1.235}
+
+
+def test_violation_records_keep_their_diagnostics(tmp_path):
+    path = audit_trail_path("gzip", tmp_path)
+    diagnostics = [Diagnostic("W9006", "demeter", "a.py", 3, 8, "Service.run"), Diagnostic("W9006", "chain", "a.py", 3)]
+    result = LinterResult.group(diagnostics)[0]
+    with AuditTrailWriter(path) as trail:
+        trail.write_results("architectural", [result])
+
+    [record] = [r for r in iter_audit_records(path) if r["type"] == "violation"]
+
+    assert record["diagnostics"] == result.to_dict()["diagnostics"]
+    assert record["diagnostics"][1] == {
+        "path": "a.py", "line": 3, "column": 8, "symbol": "Service.run", "message": "demeter"
+    }
+    # Locations are derived from the diagnostics on read, not stored twice.
+    assert record["locations"] == result.locations == ["a.py:3"]
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert all("locations" not in json.loads(line) for line in f)
+
+
+def test_compressed_trail_is_gzip_on_disk(tmp_path):
+    path = audit_trail_path("gzip", tmp_path)
+    _write_trail(path)
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert json.loads(f.readline())["type"] == "header"
+
+
+def test_new_trail_replaces_other_compressions(tmp_path):
+    _write_trail(audit_trail_path("gzip", tmp_path))
+    _write_trail(audit_trail_path("none", tmp_path))
+
+    assert not audit_trail_path("gzip", tmp_path).exists()
+    assert find_audit_trail(tmp_path) == audit_trail_path("none", tmp_path)
+
+
+def test_failed_run_keeps_previous_trail(tmp_path):
+    path = audit_trail_path("none", tmp_path)
+    _write_trail(path)
+    before = path.read_text(encoding="utf-8")
+
+    with pytest.raises(RuntimeError):
+        with AuditTrailWriter(path) as trail:
+            trail.write_results("architectural", [])
+            raise RuntimeError("tool crashed")
+
+    assert path.read_text(encoding="utf-8") == before
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+
+def test_truncated_tail_ends_iteration(tmp_path):
+    path = audit_trail_path("none", tmp_path)
+    _write_trail(path)
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"type": "viol')
+
+    assert [r["type"] for r in iter_audit_records(path)] == ["header", "violation", "summary"]
+
+
+def test_legacy_json_trail_is_read_as_records(tmp_path):
+    legacy = {
+        "version": "2.0.0",
+        "violations": {
+            "architectural": [{"code": "W9001", "message": "m", "location": "a.py:1, b.py:2"}],
+            "contracts": [],
+        },
+    }
+    (tmp_path / "last_audit.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    records = list(load_audit_records(tmp_path))
+
+    assert records == [{
+        "type": "violation",
+        "category": "architectural",
+        "code": "W9001",
+        "message": "m",
+        "locations": ["a.py:1", "b.py:2"],
+    }]
+
+
+def test_no_trail(tmp_path):
+    assert load_audit_records(tmp_path) is None
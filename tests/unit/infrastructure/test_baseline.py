@@ -0,0 +1,78 @@
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+from clean_architecture_linter.infrastructure.baseline import Baseline, compute_fingerprint, fingerprint_keys
+
+
+def _diagnostics(path, code="W9006"):
+    lines = path.read_text(encoding="utf-8").splitlines()
+    return [
+        Diagnostic(code, "chain", str(path), number, 4, "run")
+        for number, line in enumerate(lines, start=1)
+        if "a.b.c()" in line
+    ]
+
+
+def test_fingerprint_ignores_line_numbers_and_whitespace(tmp_path):
+    source = tmp_path / "service.py"
+    source.write_text("def run():\n    a.b.c()\n", encoding="utf-8")
+    before = compute_fingerprint(_diagnostics(source)[0])
+
+    source.write_text("import os\n\n\ndef run():\n        a.b.c()   \n", encoding="utf-8")
+
+    assert compute_fingerprint(_diagnostics(source)[0]) == before
+    assert compute_fingerprint(Diagnostic("W9006", "chain", str(source), 5, 4, "other")) != before
+
+
+def test_identical_lines_get_distinct_keys(tmp_path):
+    source = tmp_path / "service.py"
+    source.write_text("def run():\n    a.b.c()\n    a.b.c()\n", encoding="utf-8")
+
+    keys = [key for key, _ in fingerprint_keys(_diagnostics(source))]
+
+    assert len(set(keys)) == 2
+    assert [key.rsplit(".", 1)[1] for key in keys] == ["1", "2"]
+
+
+def test_partition_reports_only_new_violations(tmp_path):
+    source = tmp_path / "service.py"
+    source.write_text("def run():\n    a.b.c()\n", encoding="utf-8")
+    baseline = Baseline()
+    baseline.add(LinterResult.group(_diagnostics(source)))
+
+    source.write_text("def run():\n    x = 1\n    a.b.c()\n    a.b.c()\n", encoding="utf-8")
+    error = LinterResult("MYPY_ERROR", "mypy crashed")
+    new, known, seen = baseline.partition(LinterResult.group(_diagnostics(source)) + [error])
+
+    assert known == 1 and seen == set(baseline.entries)
+    assert [(r.code, [d.line for d in r.diagnostics]) for r in new] == [("W9006", [4]), ("MYPY_ERROR", [])]
+
+
+def test_import_contracts_are_baselined_by_message():
+    broken = Diagnostic("IL001", "Broken contract: layers: a is not allowed to import b", "", 0)
+    baseline = Baseline()
+    baseline.add([LinterResult(broken.code, broken.message, [], [broken])])
+    assert len(baseline) == 1
+
+    another = Diagnostic("IL001", "Broken contract: layers: c is not allowed to import d", "", 0)
+    new, known, _ = baseline.partition([LinterResult(d.code, d.message, [], [d]) for d in (broken, another)])
+
+    assert known == 1
+    assert [(r.code, r.message) for r in new] == [("IL001", another.message)]
+
+
+def test_save_load_round_trip_and_ratchet(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    kept, fixed = tmp_path / "src" / "kept.py", tmp_path / "other.py"
+    for path in (kept, fixed):
+        path.write_text("a.b.c()\n", encoding="utf-8")
+    baseline = Baseline()
+    baseline.add(LinterResult.group(_diagnostics(kept) + _diagnostics(fixed, "W9001")))
+    baseline.save(tmp_path / "baseline")
+
+    loaded = Baseline.load(tmp_path / "baseline")
+    assert loaded.entries == baseline.entries
+    assert sorted(path for _, path in loaded.entries.values()) == ["other.py", "src/kept.py"]
+
+    # Only entries under the checked path can be declared fixed.
+    assert loaded.ratchet(set(), "src") == 1
+    assert [path for _, path in loaded.entries.values()] == ["other.py"]
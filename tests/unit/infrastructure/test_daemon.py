@@ -0,0 +1,101 @@
+import threading
+from unittest.mock import patch
+
+import astroid
+import pytest
+
+from clean_architecture_linter.domain.entities import Diagnostic
+from clean_architecture_linter.infrastructure.adapters.daemon_adapter import DaemonAdapter, DaemonClient
+from clean_architecture_linter.infrastructure.adapters.result_cache import ResultCache
+from clean_architecture_linter.infrastructure.daemon import evict_modules, serve
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    socket_path = tmp_path / "d.sock"
+    ready = threading.Event()
+    thread = threading.Thread(
+        target=serve,
+        args=(socket_path, ResultCache("fp", tmp_path / "cache")),
+        kwargs={"on_ready": lambda _: ready.set()},
+        daemon=True,
+    )
+    thread.start()
+    assert ready.wait(5)
+    client = DaemonClient(socket_path, timeout=5)
+    yield client
+    if client.ping():
+        client.shutdown()
+    thread.join(5)
+
+
+def test_ping_and_shutdown(daemon):
+    assert daemon.ping()
+    daemon.shutdown()
+    for _ in range(50):
+        if not daemon.ping():
+            break
+        threading.Event().wait(0.05)
+    assert not daemon.ping()
+    assert not daemon.socket_path.exists()
+
+
+def test_check_streams_diagnostics_relative_to_client(daemon, tmp_path):
+    found = Diagnostic("W9001", "msg", str(tmp_path / "src" / "a.py"), 3)
+    with patch(
+        "clean_architecture_linter.infrastructure.adapters.excelsior_adapter.ExcelsiorAdapter.iter_diagnostics",
+        return_value=iter([found]),
+    ), patch("os.getcwd", return_value=str(tmp_path)):
+        adapter = DaemonAdapter(daemon)
+        results = adapter.gather_results("src")
+
+    assert results[0].code == "W9001"
+    assert results[0].locations == ["src/a.py:3"]
+    assert adapter.stats["diagnostics"] == 1
+
+
+def test_unknown_command_is_reported(daemon):
+    replies = list(daemon.request({"command": "nope"}))
+    assert "error" in replies[0]
+
+
+def test_ping_without_daemon(tmp_path):
+    assert not DaemonClient(tmp_path / "missing.sock").ping()
+
+
+def test_evict_modules_drops_changed_files(tmp_path):
+    source = tmp_path / "evict_me.py"
+    source.write_text("x = 1\n")
+    astroid.MANAGER.cache_module(astroid.MANAGER.ast_from_file(str(source), "evict_me"))
+    assert "evict_me" in astroid.MANAGER.astroid_cache
+
+    assert evict_modules({str(source)}) >= 1
+    assert "evict_me" not in astroid.MANAGER.astroid_cache
+
+
+def test_evict_modules_forgets_failed_imports(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importer = tmp_path / "importer.py"
+    importer.write_text("import newmod\n")
+    manager = astroid.MANAGER
+    manager.cache_module(manager.ast_from_file(str(importer), "importer"))
+    with pytest.raises(astroid.AstroidImportError):
+        manager.astroid_cache["importer"].import_module("newmod")
+
+    (tmp_path / "newmod.py").write_text("VALUE = 1\n")
+    evict_modules({str(importer)})
+
+    module = manager.ast_from_file(str(importer), "importer")
+    assert module.import_module("newmod").file == str(tmp_path / "newmod.py")
+
+
+def test_unknown_astroid_caches_fall_back_to_a_full_clear(tmp_path):
+    source = tmp_path / "evict_me_too.py"
+    source.write_text("x = 1\n")
+    astroid.MANAGER.cache_module(astroid.MANAGER.ast_from_file(str(source), "evict_me_too"))
+
+    with patch("clean_architecture_linter.infrastructure.daemon._cache_clearers", return_value=None), \
+            patch.object(astroid.MANAGER, "clear_cache") as clear_cache:
+        evict_modules({str(source)})
+
+    clear_cache.assert_called_once_with()
@@ -0,0 +1,97 @@
+import os
+import sys
+from unittest.mock import patch
+
+import astroid
+
+from clean_architecture_linter.infrastructure.gateways.astroid_gateway import AstroidGateway
+from clean_architecture_linter.infrastructure.symbol_index import MappedIndex, SymbolIndex
+
+
+def test_missing_modules_are_attempted_once(tmp_path):
+    index = SymbolIndex(tmp_path / "symbols.idx")
+
+    with patch.object(astroid.MANAGER, "ast_from_module_name", wraps=astroid.MANAGER.ast_from_module_name) as build:
+        assert index.module("excelsior_no_such_module") is None
+        assert index.module("excelsior_no_such_module") is None
+    assert build.call_count == 1
+
+    index.save()
+    reopened = SymbolIndex(tmp_path / "symbols.idx")
+    with patch.object(astroid.MANAGER, "ast_from_module_name") as build:
+        assert reopened.module("excelsior_no_such_module") is None
+    build.assert_not_called()
+    assert (reopened.hits, reopened.misses) == (1, 0)
+
+
+def test_saved_index_is_looked_up_in_place(tmp_path):
+    index = SymbolIndex(tmp_path / "symbols.idx")
+    for number in range(200):
+        index.remember_method_return(f"pkg.mod.C{number}", "run", f"builtins.int{number}", [])
+    index.remember_method_return("pkg.mod.Untyped", "run", None, [])
+    index.save()
+
+    saved = MappedIndex(tmp_path / "symbols.idx")
+    assert [saved.get(f"R:pkg.mod.C{n}:run") for n in (0, 57, 199)] == [
+        ["builtins.int0"], ["builtins.int57"], ["builtins.int199"]
+    ]
+    assert saved.get("R:pkg.mod.C200:run") is None
+    assert saved.get("A") is None and saved.get("Z") is None
+    saved.close()
+
+    reopened = SymbolIndex(tmp_path / "symbols.idx")
+    assert reopened.method_return("pkg.mod.C42", "run") == ("builtins.int42", frozenset())
+    assert reopened.method_return("pkg.mod.Untyped", "run") == (None, frozenset())
+    assert reopened.method_return("pkg.mod.C42", "stop") is None
+
+
+def test_entries_are_dropped_when_a_source_file_changes(tmp_path):
+    source = tmp_path / "service.py"
+    source.write_text("class Service: ...\n", encoding="utf-8")
+    index = SymbolIndex(tmp_path / "symbols.idx")
+    index.remember_method_return("service.Service", "run", "builtins.str", [str(source)])
+    index.save()
+
+    source.write_text("class Service:\n    def run(self) -> int: ...\n", encoding="utf-8")
+    os.utime(source, ns=(1, 1))
+
+    reopened = SymbolIndex(tmp_path / "symbols.idx")
+    assert reopened.method_return("service.Service", "run") is None
+    reopened.save()
+    assert MappedIndex(tmp_path / "symbols.idx").get("R:service.Service:run") is None
+
+
+def test_files_from_another_environment_or_resolver_are_ignored(tmp_path):
+    path = tmp_path / "symbols.idx"
+    index = SymbolIndex(path)
+    index.remember_method_return("pkg.C", "run", "builtins.int", [])
+    index.save()
+
+    with patch("clean_architecture_linter.infrastructure.symbol_index.environment_stamp", return_value="other"):
+        assert SymbolIndex(path).method_return("pkg.C", "run") is None
+    with patch("clean_architecture_linter.infrastructure.symbol_index.plugin_version", return_value="9.9"):
+        assert SymbolIndex(path).method_return("pkg.C", "run") is None
+    with patch.object(astroid, "__version__", "0.0.1"):
+        assert SymbolIndex(path).method_return("pkg.C", "run") is None
+    assert SymbolIndex(path).method_return("pkg.C", "run") == ("builtins.int", frozenset())
+
+
+def test_indexed_answers_keep_their_dependencies(tmp_path):
+    base = tmp_path / "sym_base.py"
+    base.write_text("class Base:\n    def name(self) -> str:\n        return ''\n", encoding="utf-8")
+    user = tmp_path / "sym_user.py"
+    user.write_text("import sym_base\ndef run(b: 'sym_base.Base'):\n    b.name()\n", encoding="utf-8")
+    index = SymbolIndex(tmp_path / "symbols.idx")
+
+    with patch("sys.path", [str(tmp_path), *sys.path]):
+        module = astroid.MANAGER.ast_from_file(str(user), "sym_user")
+        context = module.body[-1]
+        first = AstroidGateway(index)
+        assert first._find_method_in_class_hierarchy("sym_base.Base", "name", context) == "builtins.str"
+        index.save()
+
+        second = AstroidGateway(SymbolIndex(tmp_path / "symbols.idx"))
+        with patch.object(second, "_resolve_method_in_node") as resolve:
+            assert second._find_method_in_class_hierarchy("sym_base.Base", "name", context) == "builtins.str"
+        resolve.assert_not_called()
+        assert str(base) in second.dependencies_of(str(user))
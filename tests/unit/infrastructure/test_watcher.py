@@ -0,0 +1,36 @@
+from clean_architecture_linter.domain.entities import Diagnostic
+from clean_architecture_linter.infrastructure.watcher import PollingWatcher, diff_diagnostics
+
+
+def test_changes_reports_added_modified_and_removed(tmp_path):
+    kept = tmp_path / "kept.py"
+    kept.write_text("x = 1\n")
+    gone = tmp_path / "gone.py"
+    gone.write_text("y = 1\n")
+    watcher = PollingWatcher(str(tmp_path))
+    assert watcher.changes() == set()
+
+    kept.write_text("x = 22\n")
+    gone.unlink()
+    (tmp_path / "new.py").write_text("z = 1\n")
+    (tmp_path / "notes.txt").write_text("ignored\n")
+
+    assert watcher.changes() == {str(kept), str(gone), str(tmp_path / "new.py")}
+    assert watcher.changes() == set()
+
+
+def test_wait_merges_a_burst_of_writes(tmp_path):
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n")
+    edits = [lambda: source.write_text("x = 2\n"), lambda: (tmp_path / "b.py").write_text(""), lambda: None]
+    watcher = PollingWatcher(str(tmp_path), sleep=lambda _: edits.pop(0)())
+
+    assert watcher.wait() == {str(source), str(tmp_path / "b.py")}
+
+
+def test_diff_diagnostics():
+    kept = Diagnostic("W9001", "msg", "a.py", 1)
+    fixed = Diagnostic("W9006", "msg", "a.py", 5)
+    new = Diagnostic("W9006", "msg", "b.py", 2)
+
+    assert diff_diagnostics([kept, fixed], [new, kept]) == ([new], [fixed])
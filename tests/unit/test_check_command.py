@@ -1,26 +1,26 @@
+import os
+import tempfile
 from unittest.mock import MagicMock, patch
 import unittest
-from clean_architecture_linter.cli import check_command
+from clean_architecture_linter.cli import CheckOptions, _LiveProgress, check_command
+from clean_architecture_linter.domain.entities import Diagnostic, LinterResult
+from clean_architecture_linter.infrastructure.audit_history import HISTORY_PATH, AuditHistory
 
 class TestCheckCommand(unittest.TestCase):
-    @patch("clean_architecture_linter.cli.MypyAdapter")
-    @patch("clean_architecture_linter.cli.ExcelsiorAdapter")
-    @patch("clean_architecture_linter.cli.ImportLinterAdapter")
-    @patch("clean_architecture_linter.cli.TerminalReporter")
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.MypyAdapter")
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.ExcelsiorAdapter")
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.ImportLinterAdapter")
+    @patch("stellar_ui_kit.TerminalReporter")
     def test_check_command_execution(self, mock_reporter, mock_il, mock_excelsior, mock_mypy):
         telemetry = MagicMock()
         target_path: str = "src"
 
         # Mock results
         mock_mypy_instance = mock_mypy.return_value
-        mock_mypy_instance.gather_results.return_value = [
-            MagicMock(to_dict=lambda: {"code": "MYPY001", "message": "error", "location": "f1.py:1"})
-        ]
+        mock_mypy_instance.gather_results.return_value = [LinterResult("MYPY001", "error", ["f1.py:1"])]
 
         mock_excelsior_instance = mock_excelsior.return_value
-        mock_excelsior_instance.gather_results.return_value = [
-            MagicMock(to_dict=lambda: {"code": "W9001", "message": "error", "location": "f2.py:2"})
-        ]
+        mock_excelsior_instance.gather_results.return_value = [LinterResult("W9001", "error", ["f2.py:2"])]
 
         mock_il_instance = mock_il.return_value
         mock_il_instance.gather_results.return_value = [] # No IL errors for this test
@@ -29,11 +29,60 @@ class TestCheckCommand(unittest.TestCase):
 
         # Verify calls
         telemetry.step.assert_any_call(f"Starting Excelsior Audit for: {target_path}")
-        mock_mypy_instance.gather_results.assert_called_with(target_path)
-        mock_excelsior_instance.gather_results.assert_called_with(target_path)
+        assert mock_mypy_instance.gather_results.call_args.args == (target_path,)
+        assert mock_excelsior_instance.gather_results.call_args.args == (target_path,)
 
         # Verify reporter was called twice (once for Mypy, once for Excelsior, 0 for IL)
         self.assertEqual(mock_reporter.return_value.generate_report.call_count, 2)
 
+    @patch("clean_architecture_linter.cli._save_audit_trail")
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.MypyAdapter")
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.ExcelsiorAdapter")
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.ImportLinterAdapter")
+    @patch("stellar_ui_kit.TerminalReporter")
+    def test_check_command_records_timings(self, mock_reporter, mock_il, mock_excelsior, mock_mypy, mock_save):
+        telemetry = MagicMock()
+        for adapter in (mock_mypy, mock_excelsior, mock_il):
+            adapter.return_value.gather_results.return_value = []
+
+        for concurrent in (True, False):
+            check_command(telemetry, "src", CheckOptions(concurrent=concurrent))
+
+            timings = mock_save.call_args.args[5]
+            self.assertEqual(set(timings), {"type_integrity", "architectural", "contracts"})
+            self.assertTrue(all(seconds >= 0 for seconds in timings.values()))
+
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.MypyAdapter")
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.ExcelsiorAdapter")
+    @patch("clean_architecture_linter.infrastructure.adapters.linter_adapters.ImportLinterAdapter")
+    @patch("stellar_ui_kit.TerminalReporter")
+    def test_check_command_records_history(self, mock_reporter, mock_il, mock_excelsior, mock_mypy):
+        telemetry = MagicMock()
+        mock_mypy.return_value.gather_results.return_value = []
+        mock_il.return_value.gather_results.return_value = []
+        mock_excelsior.return_value.gather_results.return_value = [LinterResult("W9006", "chain", ["a.py:3"])]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                check_command(telemetry, "src", CheckOptions(record_history=True))
+                with AuditHistory(HISTORY_PATH) as history:
+                    self.assertEqual(history.top_files("W9006"), [{"path": "a.py", "violations": 1}])
+            finally:
+                os.chdir(cwd)
+
+    def test_live_progress_previews_first_violations(self):
+        telemetry = MagicMock()
+        progress = _LiveProgress(telemetry)
+        sink = progress.sink("architectural")
+
+        for line in range(5):
+            sink(Diagnostic("W9001", "msg", "src/a.py", line))
+
+        previews = [c.args[0] for c in telemetry.step.call_args_list if c.args[0].startswith("⚡")]
+        self.assertEqual(len(previews), _LiveProgress.PREVIEW_LIMIT)
+        self.assertIn("src/a.py:0 W9001", previews[0])
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,9 @@
 import argparse
-from unittest.mock import MagicMock, patch
 from pathlib import Path
-from clean_architecture_linter.cli import init_command, _update_makefile
+from unittest.mock import MagicMock, patch
+
+from clean_architecture_linter.cli import _update_makefile, init_command
+
 
 def test_init_command_creates_files():
     telemetry = MagicMock()
@@ -71,10 +73,69 @@ def test_main():
          patch("sys.argv", ["excelsior", "init"]):
 
         telemetry = MagicMock()
-        mock_cont.return_value.get.return_value = telemetry
+        mock_cont.get_instance.return_value.get.return_value = telemetry
 
         from clean_architecture_linter.cli import main
         main()
 
         telemetry.handshake.assert_called_once()
+        mock_cont.get_instance.return_value.mark_embedded.assert_called_once()
         mock_init.assert_called_once_with(telemetry)
+
+def test_main_headless_uses_plain_telemetry():
+    from clean_architecture_linter.interface.headless import HeadlessTelemetry
+
+    with patch("clean_architecture_linter.cli.ExcelsiorContainer") as mock_cont, \
+         patch("clean_architecture_linter.cli.init_command"), \
+         patch("sys.argv", ["excelsior", "--headless", "init"]):
+        from clean_architecture_linter.cli import main
+        main()
+
+        registered = mock_cont.get_instance.return_value.register_singleton.call_args
+        assert registered.args[0] == "TelemetryPort"
+        assert isinstance(registered.args[1], HeadlessTelemetry)
+
+def test_cli_import_stays_light():
+    import json
+    import subprocess
+    import sys
+
+    from clean_architecture_linter.infrastructure.startup_bench import HEAVY_MODULES
+
+    probe = (
+        "import json, sys; import clean_architecture_linter.cli; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    output = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True).stdout
+
+    assert json.loads(output) == []
+
+def test_headless_tables_do_not_need_stellar_ui_kit(capsys):
+    import sys
+
+    from clean_architecture_linter.cli import _render_audit_table, bench_command
+    from clean_architecture_linter.domain.entities import LinterResult
+    from clean_architecture_linter.infrastructure.startup_bench import StartupSample
+    from clean_architecture_linter.interface.headless import PlainReporter
+
+    sample = StartupSample("help", 40.0, 12.5, ())
+    with patch.dict(sys.modules, {"stellar_ui_kit": None}), \
+         patch("clean_architecture_linter.infrastructure.startup_bench.measure_startup", return_value=[sample]):
+        _render_audit_table(PlainReporter(), "architectural", [LinterResult("W9006", "chain", ["a.py:3"])])
+        bench_command(MagicMock(), runs=1, headless=True)
+
+    out = capsys.readouterr().out
+    assert "Rule ID\tCount\tViolation Description\nW9006\t1\tchain\n" in out
+    assert "help\t40.0\t12.5\t-\n" in out
+
+def test_unreadable_config_runs_without_the_cache():
+    from clean_architecture_linter.cli import CheckOptions, _open_caches
+
+    telemetry = MagicMock()
+    with patch(
+        "clean_architecture_linter.infrastructure.adapters.result_cache.config_fingerprint",
+        side_effect=OSError("pyproject.toml: permission denied"),
+    ):
+        assert _open_caches(telemetry, CheckOptions()) == (None, None)
+
+    assert "permission denied" in telemetry.warning.call_args.args[0]
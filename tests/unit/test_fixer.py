@@ -6,6 +6,7 @@ from clean_architecture_linter.fixer import (
     _fix_domain_immutability,
     _fix_type_integrity,
     _fix_structural_integrity,
+    _generate_fix_manifest,
     excelsior_fix
 )
 
@@ -127,3 +128,22 @@ class MyEntity:
     assert "def __init__(self, name) -> None:" in new_content
     # Check 3: structural fix (__init__.py created in domain folder)
     assert (tmp_path / "domain" / "__init__.py").exists()
+
+def test_fix_manifest_streams_audit_records(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".excelsior").mkdir()
+    records = iter([
+        {"type": "header", "version": "3.0.0"},
+        {"type": "violation", "category": "architectural", "code": "W9001", "message": "\x1b[35mm\x1b[0m",
+         "locations": ["a.py:1"]},
+        {"type": "violation", "category": "architectural", "code": "W9002", "message": "n", "locations": []},
+        {"type": "summary", "summary": {"architectural": 2}},
+    ])
+
+    _generate_fix_manifest(MagicMock(), records)
+
+    manifest = (tmp_path / ".excelsior" / "fix_manifest.md").read_text(encoding="utf-8")
+    assert manifest.count("## Architectural") == 1
+    assert "- **Message**: m" in manifest
+    assert "  - `a.py:1`" in manifest
+    assert "### ❓ W9002" in manifest
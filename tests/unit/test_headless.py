@@ -0,0 +1,36 @@
+import io
+from types import SimpleNamespace
+
+from clean_architecture_linter.interface.headless import HeadlessTelemetry, PlainReporter, headless_requested
+
+
+def test_headless_requested_by_env():
+    assert headless_requested({"EXCELSIOR_HEADLESS": "1"})
+    assert headless_requested({"CI": "true"})
+    assert not headless_requested({"CI": "false"})
+    assert not headless_requested({})
+
+
+def test_headless_telemetry_is_plain_and_non_interactive():
+    out, err = io.StringIO(), io.StringIO()
+    telemetry = HeadlessTelemetry(out=out, err=err)
+
+    telemetry.step("\x1b[35mdone\x1b[0m")
+    telemetry.warning("careful")
+
+    assert out.getvalue() == "- done\n"
+    assert err.getvalue() == "WARNING: careful\n"
+    assert telemetry.confirm("Overwrite?", default=False) is False
+    assert telemetry.ask("Name", default="src") == "src"
+
+
+def test_plain_reporter_prints_tab_separated_rows():
+    out = io.StringIO()
+    schema = SimpleNamespace(
+        title="[EXCELSIOR] Audit",
+        columns=[SimpleNamespace(header="Rule ID", key="code"), SimpleNamespace(header="Count", key="count")],
+    )
+
+    PlainReporter(out).generate_report([{"code": "\x1b[31mW9006\x1b[0m", "count": 2}], schema)
+
+    assert out.getvalue() == "\n[EXCELSIOR] Audit (1)\nRule ID\tCount\nW9006\t2\n"